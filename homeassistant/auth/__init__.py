@@ -34,6 +34,8 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+ACCESS_TOKEN_LEEWAY = 10
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -184,6 +186,7 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        self._verified_access_tokens = jwt_wrapper.VerifiedTokenCache()
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -342,6 +345,7 @@ class AuthManager:
 
     async def async_remove_user(self, user: models.User) -> None:
         """Remove a user."""
+        self._verified_access_tokens.discard_issuers(set(user.refresh_tokens))
         tasks = [
             self.async_remove_credentials(credentials)
             for credentials in user.credentials
@@ -398,6 +402,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._verified_access_tokens.discard_issuers(set(user.refresh_tokens))
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -526,6 +531,7 @@ class AuthManager:
     def async_remove_refresh_token(self, refresh_token: models.RefreshToken) -> None:
         """Delete a refresh token."""
         self._store.async_remove_refresh_token(refresh_token)
+        self._verified_access_tokens.discard_issuers({refresh_token.id})
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, ())
         for revoke_callback in callbacks:
@@ -647,6 +653,14 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (
+            payload := self._verified_access_tokens.get(token, ACCESS_TOKEN_LEEWAY)
+        ) is not None:
+            refresh_token = self.async_get_refresh_token(payload["iss"])
+            if refresh_token is None or not refresh_token.user.is_active:
+                return None
+            return refresh_token
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -664,8 +678,12 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            payload = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
@@ -673,6 +691,7 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._verified_access_tokens.add(token, payload)
         return refresh_token
 
     @callback
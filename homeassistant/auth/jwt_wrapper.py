@@ -7,8 +7,10 @@ to speed up the process.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import timedelta
 from functools import lru_cache, partial
+import time
 from typing import Any
 
 from jwt import DecodeError, PyJWS, PyJWT
@@ -17,6 +19,7 @@ from homeassistant.util.json import json_loads
 
 JWT_TOKEN_CACHE_SIZE = 16
 MAX_TOKEN_SIZE = 8192
+VERIFIED_TOKEN_CACHE_SIZE = 512
 
 _VERIFY_KEYS = ("signature", "exp", "nbf", "iat", "aud", "iss")
 
@@ -103,6 +106,49 @@ class _PyJWTWithVerify(PyJWT):
         return payload
 
 
+class VerifiedTokenCache:
+    """Cache the payload of tokens which passed verification.
+
+    Only the expiry of a cached token is checked again on lookup, the owner
+    of the cache has to discard tokens which are revoked some other way.
+    """
+
+    def __init__(self, maxsize: int = VERIFIED_TOKEN_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._tokens: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def get(self, token: str, leeway: float = 0) -> dict[str, Any] | None:
+        """Return the payload of a verified token which has not expired."""
+        if (payload := self._tokens.get(token)) is None:
+            return None
+        if time.time() > payload["exp"] + leeway:
+            del self._tokens[token]
+            return None
+        self._tokens.move_to_end(token)
+        return payload
+
+    def add(self, token: str, payload: dict[str, Any]) -> None:
+        """Add a verified token."""
+        self._tokens[token] = payload
+        self._tokens.move_to_end(token)
+        if len(self._tokens) > self._maxsize:
+            self._tokens.popitem(last=False)
+
+    def discard_issuers(self, issuers: set[str]) -> None:
+        """Discard all tokens of the given issuers."""
+        for token in [
+            token
+            for token, payload in self._tokens.items()
+            if payload.get("iss") in issuers
+        ]:
+            del self._tokens[token]
+
+    def clear(self) -> None:
+        """Discard all tokens."""
+        self._tokens.clear()
+
+
 _jwt = _PyJWTWithVerify()
 verify_and_decode = _jwt.verify_and_decode
 unverified_hs256_token_decode = lru_cache(maxsize=JWT_TOKEN_CACHE_SIZE)(
@@ -112,6 +158,7 @@ unverified_hs256_token_decode = lru_cache(maxsize=JWT_TOKEN_CACHE_SIZE)(
 )
 
 __all__ = [
+    "VerifiedTokenCache",
     "unverified_hs256_token_decode",
     "verify_and_decode",
 ]
@@ -14,7 +14,7 @@ from homeassistant.helpers.storage import Store
 
 from .const import DOMAIN
 from .entities import TRANSLATION_TABLE
-from .state_report import async_enable_proactive_mode
+from .state_report import AlexaChangeReporter, async_enable_proactive_mode
 
 STORE_AUTHORIZED = "authorized"
 
@@ -26,6 +26,7 @@ class AbstractConfig(ABC):
 
     _store: AlexaConfigStore
     _unsub_proactive_report: CALLBACK_TYPE | None = None
+    change_reporter: AlexaChangeReporter | None = None
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize abstract config."""
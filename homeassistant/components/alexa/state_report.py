@@ -49,6 +49,7 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+MAX_CONCURRENT_CHANGE_REPORTS = 4
 
 TO_REDACT = {"correlationToken", "token"}
 
@@ -246,6 +247,76 @@ class AlexaResponse:
         return self._response
 
 
+class AlexaChangeReporter:
+    """Send ChangeReports with bounded concurrency.
+
+    Changes of an endpoint which are waiting to be sent are merged, only the
+    latest properties are reported. Reports of the same endpoint are never
+    sent concurrently so they can't arrive out of order.
+    """
+
+    def __init__(self, hass: HomeAssistant, config: AbstractConfig) -> None:
+        """Initialize the reporter."""
+        self._hass = hass
+        self._config = config
+        self._pending: dict[str, tuple[AlexaEntity, list[dict[str, Any]]]] = {}
+        self._in_flight: set[str] = set()
+        self._senders = 0
+        self.reports_sent = 0
+        self.reports_coalesced = 0
+
+    @callback
+    def async_report(
+        self, alexa_entity: AlexaEntity, alexa_properties: list[dict[str, Any]]
+    ) -> None:
+        """Queue a ChangeReport, replacing a pending report of the endpoint."""
+        entity_id = alexa_entity.entity_id
+        if entity_id in self._pending:
+            self.reports_coalesced += 1
+        self._pending[entity_id] = (alexa_entity, alexa_properties)
+        # A report of an endpoint which is being sent is picked up by the
+        # sender of that endpoint when it's done
+        if (
+            entity_id not in self._in_flight
+            and self._senders < MAX_CONCURRENT_CHANGE_REPORTS
+        ):
+            self._senders += 1
+            self._hass.async_create_task(
+                self._async_send_pending(), "alexa change report", eager_start=True
+            )
+
+    @callback
+    def _async_pop_pending(
+        self,
+    ) -> tuple[AlexaEntity, list[dict[str, Any]]] | None:
+        """Return the next report for an endpoint which is not being sent."""
+        for entity_id in self._pending:
+            if entity_id not in self._in_flight:
+                return self._pending.pop(entity_id)
+        return None
+
+    async def _async_send_pending(self) -> None:
+        """Send pending reports until there are none left."""
+        try:
+            while (pending := self._async_pop_pending()) is not None:
+                alexa_entity, alexa_properties = pending
+                entity_id = alexa_entity.entity_id
+                self._in_flight.add(entity_id)
+                try:
+                    await async_send_changereport_message(
+                        self._hass, self._config, alexa_entity, alexa_properties
+                    )
+                except Exception:
+                    # Keep sending the other pending reports
+                    _LOGGER.exception("Error sending report to Alexa for %s", entity_id)
+                    continue
+                finally:
+                    self._in_flight.discard(entity_id)
+                self.reports_sent += 1
+        finally:
+            self._senders -= 1
+
+
 async def async_enable_proactive_mode(
     hass: HomeAssistant, smart_home_config: AbstractConfig
 ) -> CALLBACK_TYPE | None:
@@ -270,6 +341,8 @@ async def async_enable_proactive_mode(
         return old_extra_arg is not None and old_extra_arg != new_extra_arg
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
+    reporter = AlexaChangeReporter(hass, smart_home_config)
+    smart_home_config.change_reporter = reporter
 
     @callback
     def _async_entity_state_filter(data: EventStateChangedData) -> bool:
@@ -334,9 +407,7 @@ async def async_enable_proactive_mode(
         ):
             return
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
-        )
+        reporter.async_report(alexa_changed_entity, alexa_properties)
 
     return hass.bus.async_listen(
         EVENT_STATE_CHANGED,
@@ -7,7 +7,7 @@ from http import HTTPStatus
 import logging
 from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import voluptuous as vol
 
@@ -46,7 +46,7 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, template
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
@@ -66,6 +66,8 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+# Streams which fall this many events behind are closed
+STREAM_QUEUE_SIZE = 1024
 SERVICE_WAIT_TIMEOUT = 10
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -132,59 +134,86 @@ class APIEventStream(HomeAssistantView):
     async def get(self, request: web.Request) -> web.StreamResponse:
         """Provide a streaming interface for the event bus."""
         hass = request.app[KEY_HASS]
-        stop_obj = object()
-        to_write: asyncio.Queue[object | str] = asyncio.Queue()
+        # None is queued to stop the stream
+        to_write: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_QUEUE_SIZE)
+        stream_id = id(to_write)
 
-        restrict: list[EventType[Any] | str] | None = None
+        restrict: set[EventType[Any] | str] | None = None
         if restrict_str := request.query.get("restrict"):
-            restrict = [*restrict_str.split(","), EVENT_HOMEASSISTANT_STOP]
+            restrict = {*restrict_str.split(","), EVENT_HOMEASSISTANT_STOP}
 
-        async def forward_events(event: Event) -> None:
+        @ha.callback
+        def forward_events(event: Event) -> None:
             """Forward events to the open request."""
-            if restrict and event.event_type not in restrict:
+            if to_write.full():
+                # The client can not keep up, close the stream instead of
+                # buffering events without limit
                 return
+            _LOGGER.debug("STREAM %s FORWARDING %s", stream_id, event)
 
-            _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
-
+            data: bytes | None
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
+                data = None
             else:
-                data = json_dumps(event)
-
-            await to_write.put(data)
+                # The JSON of an event is cached, it is only created once
+                # for all streams
+                data = json_bytes(event.json_fragment)
+
+            if to_write.qsize() == STREAM_QUEUE_SIZE - 1:
+                _LOGGER.warning(
+                    "Closing event stream %s, the client is not reading events",
+                    stream_id,
+                )
+                data = None
+            to_write.put_nowait(data)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
-        unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
+        # Only listen to the restricted event types so other events
+        # never reach this stream
+        unsubs = [
+            hass.bus.async_listen(event_type, forward_events)
+            for event_type in restrict or (MATCH_ALL,)
+        ]
 
         try:
-            _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
+            _LOGGER.debug("STREAM %s ATTACHED", stream_id)
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            to_write.put_nowait(STREAM_PING_PAYLOAD.encode())
 
             while True:
                 try:
                     async with timeout(STREAM_PING_INTERVAL):
                         payload = await to_write.get()
-
-                    if payload is stop_obj:
+                except TimeoutError:
+                    to_write.put_nowait(STREAM_PING_PAYLOAD.encode())
+                    continue
+
+                # Write all queued events at once
+                frames: list[bytes] = []
+                while payload is not None:
+                    frames.append(b"data: " + payload + b"\n\n")
+                    if to_write.empty():
                         break
+                    payload = to_write.get_nowait()
 
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
-                except TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                if frames:
+                    msg = b"".join(frames)
+                    _LOGGER.debug("STREAM %s WRITING %s", stream_id, msg.strip())
+                    await response.write(msg)
+                if payload is None:
+                    break
 
         except asyncio.CancelledError:
-            _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
+            _LOGGER.debug("STREAM %s ABORT", stream_id)
 
         finally:
-            _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            _LOGGER.debug("STREAM %s RESPONSE CLOSED", stream_id)
+            for unsub in unsubs:
+                unsub()
 
         return response
 
@@ -209,21 +238,71 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        With a since query parameter only the states which changed since that
+        version of the state machine are returned.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        version = hass.states.version
+        # Users with different permissions get different states
+        etag = f'"{version}-{user.id}"'
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(
+                status=HTTPStatus.NOT_MODIFIED, headers={hdrs.ETAG: etag}
+            )
+
+        changed: set[str] | None = None
+        if (since := request.query.get("since")) is not None:
+            try:
+                changed = hass.states.async_changed_since(int(since))
+            except ValueError:
+                return self.json_message(
+                    "Invalid since specified.", HTTPStatus.BAD_REQUEST
+                )
+
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            entity_perm = None
         else:
             entity_perm = user.permissions.check_entity
-            states = (
-                state.as_dict_json
-                for state in hass.states.async_all()
-                if entity_perm(state.entity_id, "read")
+        if changed is None:
+            all_states = hass.states.async_all()
+        else:
+            all_states = [
+                state
+                for entity_id in changed
+                if (state := hass.states.get(entity_id)) is not None
+            ]
+        states = (
+            state.as_dict_json
+            for state in all_states
+            if entity_perm is None or entity_perm(state.entity_id, POLICY_READ)
+        )
+        states_json = b"".join((b"[", b",".join(states), b"]"))
+
+        if since is None:
+            body = states_json
+        else:
+            removed = [
+                entity_id
+                for entity_id in changed or ()
+                if hass.states.get(entity_id) is None
+                and (entity_perm is None or entity_perm(entity_id, POLICY_READ))
+            ]
+            body = json_bytes(
+                {
+                    "version": version,
+                    "full": changed is None,
+                    "states": json_fragment(states_json),
+                    "removed": removed,
+                }
             )
+
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=body,
             content_type=CONTENT_TYPE_JSON,
+            headers={hdrs.ETAG: etag},
             zlib_executor_size=32768,
         )
         response.enable_compression()
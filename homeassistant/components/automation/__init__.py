@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Collection, Mapping
 from dataclasses import dataclass
 from functools import cached_property, partial
 import logging
@@ -70,6 +70,10 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -165,19 +169,15 @@ def is_on(hass: HomeAssistant, entity_id: str) -> bool:
 
 
 def _automations_with_x(
-    hass: HomeAssistant, referenced_id: str, property_name: str
+    hass: HomeAssistant, referenced_id: str, reference_type: ReferenceType
 ) -> list[str]:
     """Return all automations that reference the x."""
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referenced_by(
+        reference_type, referenced_id
+    )
 
 
 def _x_in_automation(
@@ -198,7 +198,7 @@ def _x_in_automation(
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all automations that reference the entity."""
-    return _automations_with_x(hass, entity_id, "referenced_entities")
+    return _automations_with_x(hass, entity_id, ReferenceType.ENTITY)
 
 
 @callback
@@ -210,7 +210,7 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all automations that reference the device."""
-    return _automations_with_x(hass, device_id, "referenced_devices")
+    return _automations_with_x(hass, device_id, ReferenceType.DEVICE)
 
 
 @callback
@@ -222,7 +222,7 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all automations that reference the area."""
-    return _automations_with_x(hass, area_id, "referenced_areas")
+    return _automations_with_x(hass, area_id, ReferenceType.AREA)
 
 
 @callback
@@ -234,7 +234,7 @@ def areas_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_floor(hass: HomeAssistant, floor_id: str) -> list[str]:
     """Return all automations that reference the floor."""
-    return _automations_with_x(hass, floor_id, "referenced_floors")
+    return _automations_with_x(hass, floor_id, ReferenceType.FLOOR)
 
 
 @callback
@@ -246,7 +246,7 @@ def floors_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_label(hass: HomeAssistant, label_id: str) -> list[str]:
     """Return all automations that reference the label."""
-    return _automations_with_x(hass, label_id, "referenced_labels")
+    return _automations_with_x(hass, label_id, ReferenceType.LABEL)
 
 
 @callback
@@ -258,16 +258,7 @@ def labels_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseAutomationEntity] = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, ReferenceType.BLUEPRINT)
 
 
 @callback
@@ -415,6 +406,28 @@ class BaseAutomationEntity(ToggleEntity, ABC):
     ) -> ScriptRunResult | None:
         """Trigger automation."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the automation to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.async_on_remove(
+            async_get_reference_index(self.hass, DOMAIN).async_add(
+                self.entity_id, self._async_references
+            )
+        )
+
+    @callback
+    def _async_references(self) -> dict[ReferenceType, Collection[str]]:
+        """Return the items referenced by the automation."""
+        blueprint = self.referenced_blueprint
+        return {
+            ReferenceType.AREA: self.referenced_areas,
+            ReferenceType.BLUEPRINT: () if blueprint is None else (blueprint,),
+            ReferenceType.DEVICE: self.referenced_devices,
+            ReferenceType.ENTITY: self.referenced_entities,
+            ReferenceType.FLOOR: self.referenced_floors,
+            ReferenceType.LABEL: self.referenced_labels,
+        }
+
 
 class UnavailableAutomationEntity(BaseAutomationEntity):
     """A non-functional automation entity with its state set to unavailable.
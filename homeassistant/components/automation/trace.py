@@ -9,6 +9,7 @@ from typing import Any
 from homeassistant.components.trace import (
     CONF_STORED_TRACES,
     ActionTrace,
+    async_finish_trace,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
@@ -68,4 +69,4 @@ def trace_automation(
         raise
     finally:
         if automation_id:
-            trace.finished()
+            async_finish_trace(hass, trace)
@@ -0,0 +1,408 @@
+"""Chunked and incremental writing of the backup archive."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import copy
+from dataclasses import dataclass, field
+import hashlib
+import os
+from pathlib import Path
+import struct
+import tarfile
+import time
+from types import TracebackType
+from typing import IO, Any, NamedTuple, cast
+import zlib
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import save_json
+from homeassistant.util.json import load_json_object
+
+from .const import LOGGER
+
+CHUNK_SIZE = 2**20 * 4  # 4MB
+MIN_BATCH_SIZE = 2**18  # 256kB
+COMPRESS_LEVEL = 6
+INDEX_VERSION = 1
+INNER_TAR_NAME = "./homeassistant.tar.gz"
+
+_CRC32_POLY = 0xEDB88320
+_GZIP_END_OF_STREAM = zlib.compressobj(
+    COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS
+).flush()
+
+
+def _multmodp(a: int, b: int) -> int:
+    """Multiply two polynomials modulo the CRC-32 polynomial."""
+    m = 1 << 31
+    p = 0
+    while True:
+        if a & m:
+            p ^= b
+            if not a & (m - 1):
+                return p
+        m >>= 1
+        b = (b >> 1) ^ _CRC32_POLY if b & 1 else b >> 1
+
+
+def _x2n_table() -> list[int]:
+    """Return x^(2^n) modulo the CRC-32 polynomial for n 0 to 31."""
+    table = [1 << 30]
+    while len(table) < 32:
+        table.append(_multmodp(table[-1], table[-1]))
+    return table
+
+
+_X2N_TABLE = _x2n_table()
+
+
+def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+    """Return the CRC-32 of two concatenated blocks of data from their CRC-32s.
+
+    This is zlib's crc32_combine, which the zlib module does not expose.
+    """
+    p = 1 << 31
+    k = 3
+    while len2:
+        if len2 & 1:
+            p = _multmodp(_X2N_TABLE[k & 31], p)
+        len2 >>= 1
+        k += 1
+    return _multmodp(p, crc1) ^ crc2
+
+
+class Chunk(NamedTuple):
+    """A compressed chunk in a backup archive."""
+
+    size: int
+    crc: int
+    offset: int
+    length: int
+
+
+class FileChunks(NamedTuple):
+    """The chunks holding the data of a file."""
+
+    size: int
+    mtime_ns: int
+    digests: list[str]
+
+
+@dataclass(slots=True)
+class ChunkIndex:
+    """Where the chunks of a backup archive are, to reuse them in the next one."""
+
+    archive: str | None = None
+    archive_size: int = 0
+    archive_mtime_ns: int = 0
+    chunks: dict[str, Chunk] = field(default_factory=dict)
+    files: dict[str, FileChunks] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> ChunkIndex:
+        """Load the index, an empty index is returned when it can not be used."""
+        try:
+            data = cast(dict[str, Any], load_json_object(path))
+            if data.get("version") != INDEX_VERSION:
+                return cls()
+            return cls(
+                archive=data["archive"],
+                archive_size=data["archive_size"],
+                archive_mtime_ns=data["archive_mtime_ns"],
+                chunks={
+                    digest: Chunk(*chunk) for digest, chunk in data["chunks"].items()
+                },
+                files={
+                    name: FileChunks(*chunks) for name, chunks in data["files"].items()
+                },
+            )
+        except (HomeAssistantError, KeyError, TypeError, AttributeError) as err:
+            LOGGER.warning("Ignoring invalid backup chunk index %s: %s", path, err)
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """Save the index."""
+        save_json(path.as_posix(), self.as_dict(), atomic_writes=True)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the index."""
+        return {
+            "version": INDEX_VERSION,
+            "archive": self.archive,
+            "archive_size": self.archive_size,
+            "archive_mtime_ns": self.archive_mtime_ns,
+            "chunks": {digest: list(chunk) for digest, chunk in self.chunks.items()},
+            "files": {name: list(chunks) for name, chunks in self.files.items()},
+        }
+
+    def open_archive(self, backup_dir: Path) -> tuple[IO[bytes], int] | None:
+        """Open the archive the chunks are in.
+
+        Return the opened archive and the offset of the chunk offsets in it,
+        or None when the archive is gone or has changed.
+        """
+        if self.archive is None:
+            return None
+        path = backup_dir / self.archive
+        try:
+            stat = path.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (
+                self.archive_size,
+                self.archive_mtime_ns,
+            ):
+                return None
+            with tarfile.open(path, "r:") as archive:
+                offset = archive.getmember(INNER_TAR_NAME).offset_data
+            return path.open("rb"), offset
+        except (OSError, KeyError, tarfile.TarError) as err:
+            LOGGER.debug("Not reusing chunks of backup %s: %s", path, err)
+            return None
+
+
+def _compress(data: bytes) -> tuple[int, int, bytes]:
+    """Return the size, CRC-32 and compressed data of a chunk."""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return (
+        len(data),
+        zlib.crc32(data),
+        compressor.compress(data) + compressor.flush(zlib.Z_FULL_FLUSH),
+    )
+
+
+def _read_exactly(fileobj: IO[bytes], size: int) -> bytes:
+    """Read size bytes from a file."""
+    if len(data := fileobj.read(size)) != size:
+        raise OSError("unexpected end of data")
+    return data
+
+
+def _file_mtime_ns(tarinfo: tarfile.TarInfo, fileobj: IO[bytes]) -> int | None:
+    """Return the modification time of the file a member is read from."""
+    try:
+        stat = os.fstat(fileobj.fileno())
+    except (AttributeError, OSError):
+        return None
+    if stat.st_size != tarinfo.size:
+        return None
+    return stat.st_mtime_ns
+
+
+def _is_batch_boundary(name: str) -> bool:
+    """Return if a batch of small files should end after this file."""
+    return zlib.crc32(name.encode(errors="surrogateescape")) & 0xF == 0
+
+
+class ChunkedTarFile(tarfile.TarFile):
+    """Write a tar archive as a gzip stream of independently compressed chunks.
+
+    Each chunk is compressed in parallel as deflate blocks without references
+    into the chunk before it, so the compressed chunk only depends on its
+    data and is copied from the previous backup when that has the same chunk.
+    The result is a plain single member gzip file that can be read as a
+    stream.
+
+    Large files are split in chunks at fixed offsets and are not read at all
+    when they did not change since the previous backup. Small files are
+    batched in chunks that end after files with a boundary name, so a changed
+    file only changes the chunk it is in instead of moving all the data after
+    it into other chunks.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        previous: ChunkIndex,
+        backup_dir: Path,
+        workers: int | None = None,
+    ) -> None:
+        """Initialize the archive."""
+        super().__init__(fileobj=fileobj, mode="w")
+        # The archive may be written into another archive, the offset is the
+        # position in this archive
+        self.offset = 0
+        self.index = ChunkIndex()
+        self._source = previous.open_archive(backup_dir)
+        self._previous = previous if self._source is not None else ChunkIndex()
+        self._workers = workers or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="BackupCompress"
+        )
+        self._pending: deque[tuple[str, Chunk | Future[tuple[int, int, bytes]]]] = (
+            deque()
+        )
+        self._out = fileobj
+        self._finished = False
+        self._batch = bytearray()
+        self._crc = 0
+        self._size = 0
+        header = b"\x1f\x8b\x08\x00" + struct.pack("<I", int(time.time())) + b"\x00\xff"
+        fileobj.write(header)
+        self._position = len(header)
+
+    def addfile(
+        self, tarinfo: tarfile.TarInfo, fileobj: IO[bytes] | None = None
+    ) -> None:
+        """Add a member, the data of regular files is read from fileobj."""
+        if self._finished:
+            raise OSError("archive is closed")
+        tarinfo = copy.copy(tarinfo)
+        header = tarinfo.tobuf(self.format, self.encoding, self.errors)
+        self._batch += header
+        self.offset += len(header)
+        if fileobj is not None and tarinfo.size:
+            remainder = tarinfo.size % tarfile.BLOCKSIZE
+            padding = tarfile.NUL * (tarfile.BLOCKSIZE - remainder if remainder else 0)
+            if tarinfo.size < CHUNK_SIZE:
+                self._batch += _read_exactly(fileobj, tarinfo.size)
+                self._batch += padding
+            else:
+                self._flush_batch()
+                self._add_file_chunks(tarinfo, fileobj, padding)
+            self.offset += tarinfo.size + len(padding)
+        if len(self._batch) >= CHUNK_SIZE or (
+            len(self._batch) >= MIN_BATCH_SIZE and _is_batch_boundary(tarinfo.name)
+        ):
+            self._flush_batch()
+
+    def close(self) -> None:
+        """Write the end of the archive and the gzip trailer."""
+        if self._finished:
+            return
+        self._finished = True
+        try:
+            self._batch += tarfile.NUL * (tarfile.BLOCKSIZE * 2)
+            self.offset += tarfile.BLOCKSIZE * 2
+            if remainder := self.offset % tarfile.RECORDSIZE:
+                self._batch += tarfile.NUL * (tarfile.RECORDSIZE - remainder)
+                self.offset += tarfile.RECORDSIZE - remainder
+            self._flush_batch()
+            while self._pending:
+                self._write_chunk(*self._pending.popleft())
+            self._out.write(
+                _GZIP_END_OF_STREAM
+                + struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+            )
+        finally:
+            self._shutdown()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the archive, or only stop on errors."""
+        try:
+            super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        """Stop compressing and close the previous archive."""
+        self._pool.shutdown(cancel_futures=True)
+        if self._source is not None:
+            self._source[0].close()
+
+    def _add_file_chunks(
+        self, tarinfo: tarfile.TarInfo, fileobj: IO[bytes], padding: bytes
+    ) -> None:
+        """Add the data of a large file in chunks of its own."""
+        mtime_ns = _file_mtime_ns(tarinfo, fileobj)
+        if (
+            mtime_ns is not None
+            and (known := self._previous.files.get(tarinfo.name)) is not None
+            and (known.size, known.mtime_ns) == (tarinfo.size, mtime_ns)
+            and all(digest in self._previous.chunks for digest in known.digests)
+        ):
+            for digest in known.digests:
+                self._queue(digest, self._previous.chunks[digest])
+            self.index.files[tarinfo.name] = known
+            return
+
+        digests: list[str] = []
+        remaining = tarinfo.size
+        while remaining:
+            data = _read_exactly(fileobj, min(CHUNK_SIZE, remaining))
+            remaining -= len(data)
+            if not remaining:
+                data += padding
+            digests.append(self._add_chunk(data))
+        if mtime_ns is not None:
+            self.index.files[tarinfo.name] = FileChunks(tarinfo.size, mtime_ns, digests)
+
+    def _flush_batch(self) -> None:
+        """Add the batched small files as a chunk."""
+        if self._batch:
+            self._add_chunk(bytes(self._batch))
+            self._batch.clear()
+
+    def _add_chunk(self, data: bytes) -> str:
+        """Add a chunk, reusing it from the previous archive if it is there."""
+        digest = hashlib.sha256(data).hexdigest()
+        if (chunk := self._previous.chunks.get(digest)) is not None:
+            self._queue(digest, chunk)
+        else:
+            self._queue(digest, self._pool.submit(_compress, data))
+        return digest
+
+    def _queue(
+        self, digest: str, chunk: Chunk | Future[tuple[int, int, bytes]]
+    ) -> None:
+        """Queue a chunk to be written, writing chunks once enough are queued."""
+        self._pending.append((digest, chunk))
+        while len(self._pending) > self._workers * 2:
+            self._write_chunk(*self._pending.popleft())
+
+    def _write_chunk(
+        self, digest: str, chunk: Chunk | Future[tuple[int, int, bytes]]
+    ) -> None:
+        """Write a compressed chunk."""
+        if isinstance(chunk, Chunk):
+            if self._source is None:
+                raise RuntimeError("No archive to copy chunks from")
+            source, offset = self._source
+            source.seek(offset + chunk.offset)
+            data = _read_exactly(source, chunk.length)
+            size, crc = chunk.size, chunk.crc
+        else:
+            size, crc, data = chunk.result()
+        self._out.write(data)
+        self.index.chunks.setdefault(
+            digest, Chunk(size, crc, self._position, len(data))
+        )
+        self._position += len(data)
+        self._crc = crc32_combine(self._crc, crc, size)
+        self._size += size
+
+
+@contextmanager
+def add_chunked_tar(
+    tar: tarfile.TarFile, name: str, previous: ChunkIndex, backup_dir: Path
+) -> Generator[ChunkedTarFile]:
+    """Write a chunked tar archive straight into a member of a tar archive.
+
+    The size of the member is only known when the chunked archive is closed,
+    its header is written again then. GNU format headers have the same length
+    for any size.
+    """
+    fileobj = cast(IO[bytes], tar.fileobj)
+    tarinfo = tarfile.TarInfo(name)
+    tarinfo.mtime = int(time.time())
+    tarinfo.offset = tar.offset
+    header = tarinfo.tobuf(tarfile.GNU_FORMAT, tar.encoding, tar.errors)
+    fileobj.write(header)
+    tarinfo.offset_data = tarinfo.offset + len(header)
+    with ChunkedTarFile(fileobj, previous, backup_dir) as chunked_tar:
+        yield chunked_tar
+    tarinfo.size = fileobj.tell() - tarinfo.offset_data
+    if remainder := tarinfo.size % tarfile.BLOCKSIZE:
+        fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+    end = fileobj.tell()
+    fileobj.seek(tarinfo.offset)
+    fileobj.write(tarinfo.tobuf(tarfile.GNU_FORMAT, tar.encoding, tar.errors))
+    fileobj.seek(end)
+    tar.offset = end
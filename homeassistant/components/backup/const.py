@@ -5,6 +5,9 @@ from logging import getLogger
 DOMAIN = "backup"
 LOGGER = getLogger(__package__)
 
+SNAPSHOT_DIR = "snapshot"
+CHUNK_INDEX = "chunk_index.json"
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
@@ -12,5 +15,6 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    "backups/chunk_index.json",
     "OZW_Log.txt",
 ]
@@ -5,9 +5,11 @@ from __future__ import annotations
 import asyncio
 from dataclasses import asdict, dataclass
 import hashlib
+import inspect
 import io
 import json
 from pathlib import Path
+import shutil
 import tarfile
 from tarfile import TarError
 import time
@@ -23,7 +25,8 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .archive import INNER_TAR_NAME, ChunkIndex, add_chunked_tar
+from .const import CHUNK_INDEX, DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER, SNAPSHOT_DIR
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
@@ -53,6 +56,20 @@ class BackupPlatformProtocol(Protocol):
         """Perform operations after a backup finishes."""
 
 
+class BackupSnapshotPlatformProtocol(BackupPlatformProtocol, Protocol):
+    """Define the format of backup platforms that can snapshot their files."""
+
+    async def async_backup_snapshot(
+        self, hass: HomeAssistant, snapshot_dir: Path
+    ) -> dict[str, Path | None]:
+        """Write consistent copies of files to back up to the snapshot dir.
+
+        Return the copies by the path, relative to the configuration
+        directory, of the file they replace in the backup. Paths mapped
+        to None are left out of the backup.
+        """
+
+
 class BackupManager:
     """Backup manager for the Backup integration."""
 
@@ -60,9 +77,11 @@ class BackupManager:
         """Initialize the backup manager."""
         self.hass = hass
         self.backup_dir = Path(hass.config.path("backups"))
+        self.snapshot_dir = self.backup_dir / SNAPSHOT_DIR
         self.backing_up = False
         self.backups: dict[str, Backup] = {}
         self.platforms: dict[str, BackupPlatformProtocol] = {}
+        self.snapshot_platforms: dict[str, BackupSnapshotPlatformProtocol] = {}
         self.loaded_backups = False
         self.loaded_platforms = False
 
@@ -83,24 +102,45 @@ class BackupManager:
             )
             return
         self.platforms[integration_domain] = platform
+        if inspect.iscoroutinefunction(
+            getattr(platform, "async_backup_snapshot", None)
+        ):
+            self.snapshot_platforms[integration_domain] = cast(
+                BackupSnapshotPlatformProtocol, platform
+            )
 
-    async def pre_backup_actions(self) -> None:
-        """Perform pre backup actions."""
+    async def pre_backup_actions(
+        self, snapshot_dir: Path | None = None
+    ) -> dict[str, Path | None]:
+        """Perform pre backup actions.
+
+        With a snapshot dir, platforms that can snapshot their files write
+        them there instead of holding their files for the whole backup.
+        Returns the snapshots by the path of the file they replace.
+        """
         if not self.loaded_platforms:
             await self.load_platforms()
 
         pre_backup_results = await asyncio.gather(
             *(
-                platform.async_pre_backup(self.hass)
-                for platform in self.platforms.values()
+                self.snapshot_platforms[domain].async_backup_snapshot(
+                    self.hass, snapshot_dir
+                )
+                if snapshot_dir and domain in self.snapshot_platforms
+                else platform.async_pre_backup(self.hass)
+                for domain, platform in self.platforms.items()
             ),
             return_exceptions=True,
         )
+        snapshots: dict[str, Path | None] = {}
         for result in pre_backup_results:
             if isinstance(result, Exception):
                 raise result
+            if isinstance(result, dict):
+                snapshots.update(result)
+        return snapshots
 
-    async def post_backup_actions(self) -> None:
+    async def post_backup_actions(self, snapshot_dir: Path | None = None) -> None:
         """Perform post backup actions."""
         if not self.loaded_platforms:
             await self.load_platforms()
@@ -108,7 +148,8 @@ class BackupManager:
         post_backup_results = await asyncio.gather(
             *(
                 platform.async_post_backup(self.hass)
-                for platform in self.platforms.values()
+                for domain, platform in self.platforms.items()
+                if not snapshot_dir or domain not in self.snapshot_platforms
             ),
             return_exceptions=True,
         )
@@ -196,7 +237,8 @@ class BackupManager:
 
         try:
             self.backing_up = True
-            await self.pre_backup_actions()
+            await self.hass.async_add_executor_job(self._make_snapshot_dir)
+            snapshots = await self.pre_backup_actions(self.snapshot_dir)
             backup_name = f"Core {HAVERSION}"
             date_str = dt_util.now().isoformat()
             slug = _generate_slug(date_str, backup_name)
@@ -215,6 +257,7 @@ class BackupManager:
                 self._mkdir_and_generate_backup_contents,
                 tar_file_path,
                 backup_data,
+                snapshots,
             )
             backup = Backup(
                 slug=slug,
@@ -229,39 +272,81 @@ class BackupManager:
             return backup
         finally:
             self.backing_up = False
-            await self.post_backup_actions()
+            try:
+                await self.post_backup_actions(self.snapshot_dir)
+            finally:
+                await self.hass.async_add_executor_job(
+                    shutil.rmtree, self.snapshot_dir, True
+                )
+
+    def _make_snapshot_dir(self) -> None:
+        """Create an empty directory for snapshots."""
+        shutil.rmtree(self.snapshot_dir, ignore_errors=True)
+        self.snapshot_dir.mkdir(parents=True)
 
     def _mkdir_and_generate_backup_contents(
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
+        snapshots: dict[str, Path | None],
     ) -> int:
         """Generate backup contents and return the size."""
         if not self.backup_dir.exists():
             LOGGER.debug("Creating backup directory")
             self.backup_dir.mkdir()
 
+        config_dir = Path(self.hass.config.path())
+        excludes = [
+            *EXCLUDE_FROM_BACKUP,
+            self.snapshot_dir.as_posix(),
+            *((config_dir / path).as_posix() for path in snapshots),
+        ]
+
         outer_secure_tarfile = SecureTarFile(
             tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
         )
-        with outer_secure_tarfile as outer_secure_tarfile_tarfile:
-            raw_bytes = json_bytes(backup_data)
-            fileobj = io.BytesIO(raw_bytes)
-            tar_info = tarfile.TarInfo(name="./backup.json")
-            tar_info.size = len(raw_bytes)
-            tar_info.mtime = int(time.time())
-            outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
-                )
-
-        return tar_file_path.stat().st_size
+        try:
+            with outer_secure_tarfile as outer_secure_tarfile_tarfile:
+                raw_bytes = json_bytes(backup_data)
+                fileobj = io.BytesIO(raw_bytes)
+                tar_info = tarfile.TarInfo(name="./backup.json")
+                tar_info.size = len(raw_bytes)
+                tar_info.mtime = int(time.time())
+                outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
+                # The core archive reuses the chunks of the archive of the
+                # previous backup where they did not change
+                index_path = self.backup_dir / CHUNK_INDEX
+                with add_chunked_tar(
+                    outer_secure_tarfile_tarfile,
+                    INNER_TAR_NAME,
+                    ChunkIndex.load(index_path),
+                    self.backup_dir,
+                ) as core_tar:
+                    atomic_contents_add(
+                        tar_file=core_tar,
+                        origin_path=config_dir,
+                        excludes=excludes,
+                        arcname="data",
+                    )
+                    for path, snapshot in snapshots.items():
+                        if snapshot is not None:
+                            core_tar.add(
+                                snapshot.as_posix(),
+                                arcname=f"data/{path}",
+                                recursive=False,
+                            )
+        except BaseException:
+            # Don't leave an incomplete backup behind
+            tar_file_path.unlink(missing_ok=True)
+            raise
+
+        stat = tar_file_path.stat()
+        index = core_tar.index
+        index.archive = tar_file_path.name
+        index.archive_size = stat.st_size
+        index.archive_mtime_ns = stat.st_mtime_ns
+        index.save(index_path)
+        return stat.st_size
 
 
 def _generate_slug(date: str, name: str) -> str:
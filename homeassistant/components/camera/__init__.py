@@ -10,10 +10,11 @@ from dataclasses import asdict
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import cached_property, partial
+import hashlib
+from http import HTTPStatus
 import logging
 import os
 from random import SystemRandom
-import time
 from typing import Any, Final, cast, final
 
 from aiohttp import hdrs, web
@@ -21,7 +22,7 @@ import attr
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.components.http import KEY_AUTHENTICATED, KEY_HASS, HomeAssistantView
 from homeassistant.components.media_player import (
     ATTR_MEDIA_CONTENT_ID,
     ATTR_MEDIA_CONTENT_TYPE,
@@ -71,14 +72,18 @@ from .const import (  # noqa: F401
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DATA_IMAGE_REQUESTS,
     DATA_RTSP_TO_WEB_RTC,
+    DATA_SCALED_IMAGES,
+    DATA_STILL_STREAMS,
     DOMAIN,
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
     SERVICE_RECORD,
     StreamType,
 )
-from .img_util import scale_jpeg_camera_image
+from .fanout import ImageRequestCoalescer, StillStreamProducer
+from .img_util import ScaledImageCache, scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
@@ -174,7 +179,30 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests for the same camera and size share a single
+    fetch and its result is reused for the image cache TTL of the camera.
     """
+    image_requests: ImageRequestCoalescer[Image] | None = camera.hass.data.get(
+        DATA_IMAGE_REQUESTS
+    )
+    if image_requests is None or camera.entity_id is None:
+        # Cameras that are not added to Home Assistant, like previews
+        return await _async_fetch_image(camera, timeout, width, height)
+    return await image_requests.async_get(
+        (camera.entity_id, width, height),
+        partial(_async_fetch_image, camera, timeout, width, height),
+        camera.image_cache_ttl,
+    )
+
+
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: int,
+    width: int | None,
+    height: int | None,
+) -> Image:
+    """Fetch a snapshot image from a camera without sharing it."""
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
             image_bytes = (
@@ -195,7 +223,8 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await _async_scale_image(camera.hass, image, width, height),
                     )
 
                 return image
@@ -203,6 +232,29 @@ async def _async_get_image(
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_scale_image(
+    hass: HomeAssistant, image: Image, width: int, height: int
+) -> bytes:
+    """Scale a jpeg image in the executor, reusing earlier results of the frame."""
+    scaled_images: ScaledImageCache | None = hass.data.get(DATA_SCALED_IMAGES)
+    if scaled_images is None:
+        return await hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        )
+    key = (_image_digest(image.content), width, height)
+    if (scaled := scaled_images.get(key)) is None:
+        scaled = await hass.async_add_executor_job(
+            scale_jpeg_camera_image, image, width, height
+        )
+        scaled_images.put(key, scaled)
+    return scaled
+
+
+def _image_digest(content: bytes) -> bytes:
+    """Return a digest identifying the content of an image."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -265,7 +317,27 @@ async def async_get_still_stream(
     """Generate an HTTP MJPEG stream from camera images.
 
     This method must be run in the event loop.
+
+    All viewers of the same image callback and interval share a single
+    producer that fetches the images.
     """
+    hass = request.app[KEY_HASS]
+    still_streams: dict[
+        tuple[Callable[[], Awaitable[bytes | None]], float], StillStreamProducer
+    ] = hass.data[DATA_STILL_STREAMS]
+    key = (image_cb, interval)
+
+    @callback
+    def _async_producer_finished(producer: StillStreamProducer) -> None:
+        """Unregister a producer that stopped."""
+        if still_streams.get(key) is producer:
+            del still_streams[key]
+
+    if (producer := still_streams.get(key)) is None:
+        producer = still_streams[key] = StillStreamProducer(
+            hass, image_cb, interval, _async_producer_finished
+        )
+
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
@@ -283,32 +355,21 @@ async def async_get_still_stream(
             + b"\r\n"
         )
 
-    last_image = None
-
-    while True:
-        last_fetch = time.monotonic()
-        img_bytes = await image_cb()
-        if not img_bytes:
-            break
-
-        if img_bytes != last_image:
+    queue = producer.async_add_viewer()
+    try:
+        # Chrome always shows the n-1 frame:
+        # https://issues.chromium.org/issues/41199053
+        # https://issues.chromium.org/issues/40791855
+        # We send the first frame twice to ensure it shows
+        # Subsequent frames are not a concern at reasonable frame rates
+        # (even 1/10 FPS is about the latency of HLS)
+        if img_bytes := await queue.get():
             await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome always shows the n-1 frame:
-            # https://issues.chromium.org/issues/41199053
-            # https://issues.chromium.org/issues/40791855
-            # We send the first frame twice to ensure it shows
-            # Subsequent frames are not a concern at reasonable frame rates
-            # (even 1/10 FPS is about the latency of HLS)
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
-
-        next_fetch = last_fetch + interval
-        now = time.monotonic()
-        if next_fetch > now:
-            sleep_time = next_fetch - now
-            await asyncio.sleep(sleep_time)
+            await write_to_mjpeg_stream(img_bytes)
+        while img_bytes := await queue.get():
+            await write_to_mjpeg_stream(img_bytes)
+    finally:
+        producer.async_remove_viewer(queue)
 
     return response
 
@@ -387,6 +448,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     prefs = CameraPreferences(hass)
     await prefs.async_load()
     hass.data[DATA_CAMERA_PREFS] = prefs
+    hass.data[DATA_IMAGE_REQUESTS] = ImageRequestCoalescer[Image](hass)
+    hass.data[DATA_SCALED_IMAGES] = ScaledImageCache()
+    hass.data[DATA_STILL_STREAMS] = {}
 
     hass.http.register_view(CameraImageView(component))
     hass.http.register_view(CameraMjpegStream(component))
@@ -469,6 +533,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
     "frame_interval",
     "frontend_stream_type",
+    "image_cache_ttl",
     "is_on",
     "is_recording",
     "is_streaming",
@@ -489,6 +554,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_ttl: float = 0
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -569,6 +635,15 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def image_cache_ttl(self) -> float:
+        """Return how long a fetched still image can be served to other requests.
+
+        Concurrent requests always share a single fetch, cameras whose image
+        changes at a known rate can also reuse the image for later requests.
+        """
+        return self._attr_image_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -837,7 +912,16 @@ class CameraImageView(CameraView):
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
 
-        return web.Response(body=image.content, content_type=image.content_type)
+        etag = f'"{_image_digest(image.content).hex()}"'
+        if etag in request.headers.get(hdrs.IF_NONE_MATCH, ""):
+            return web.Response(
+                status=HTTPStatus.NOT_MODIFIED, headers={hdrs.ETAG: etag}
+            )
+        return web.Response(
+            body=image.content,
+            content_type=image.content_type,
+            headers={hdrs.ETAG: etag},
+        )
 
 
 class CameraMjpegStream(CameraView):
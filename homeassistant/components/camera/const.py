@@ -14,7 +14,10 @@ from homeassistant.helpers.deprecation import (
 DOMAIN: Final = "camera"
 
 DATA_CAMERA_PREFS: Final = "camera_prefs"
+DATA_IMAGE_REQUESTS: Final = "camera_image_requests"
 DATA_RTSP_TO_WEB_RTC: Final = "rtsp_to_web_rtc"
+DATA_SCALED_IMAGES: Final = "camera_scaled_images"
+DATA_STILL_STREAMS: Final = "camera_still_streams"
 
 PREF_PRELOAD_STREAM: Final = "preload_stream"
 PREF_ORIENTATION: Final = "orientation"
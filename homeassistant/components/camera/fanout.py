@@ -0,0 +1,148 @@
+"""Share camera image fetches and still streams between concurrent viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from functools import partial
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImageRequestCoalescer[_T]:
+    """Share in-flight image fetches and cache the result for a short time.
+
+    Concurrent requests for the same key wait for a single fetch instead of
+    each hitting the camera.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._pending: dict[Hashable, asyncio.Task[_T]] = {}
+        self._cache: dict[Hashable, tuple[float, _T]] = {}
+
+    async def async_get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Coroutine[Any, Any, _T]],
+        ttl: float,
+    ) -> _T:
+        """Return a cached result, join an in-flight fetch or start a new one.
+
+        The result of a fetch is reused for ttl seconds.
+        """
+        if (cached := self._cache.get(key)) is not None:
+            expires, result = cached
+            if expires > time.monotonic():
+                return result
+            del self._cache[key]
+        if (task := self._pending.get(key)) is None:
+            task = self._hass.async_create_background_task(
+                fetch(), f"camera image fetch {key}", eager_start=False
+            )
+            self._pending[key] = task
+            task.add_done_callback(partial(self._async_fetch_done, key, ttl))
+        # Shield the shared fetch so a disconnecting client does not
+        # cancel it for all other clients waiting on it
+        return await asyncio.shield(task)
+
+    @callback
+    def _async_fetch_done(
+        self, key: Hashable, ttl: float, task: asyncio.Task[_T]
+    ) -> None:
+        """Cache the result of a finished fetch."""
+        del self._pending[key]
+        if task.cancelled() or task.exception() is not None or ttl <= 0:
+            return
+        now = time.monotonic()
+        for expired_key in [
+            cached_key
+            for cached_key, (expires, _) in self._cache.items()
+            if expires <= now
+        ]:
+            del self._cache[expired_key]
+        self._cache[key] = (now + ttl, task.result())
+
+
+class StillStreamProducer:
+    """Fetch still images once and fan them out to all MJPEG viewers.
+
+    Each viewer has a single frame buffer, a viewer that can not keep up
+    skips frames instead of making the producer or other viewers wait.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        interval: float,
+        on_finished: Callable[[StillStreamProducer], None],
+    ) -> None:
+        """Initialize the producer."""
+        self._hass = hass
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_finished = on_finished
+        self._viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._last_image: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_add_viewer(self) -> asyncio.Queue[bytes | None]:
+        """Add a viewer and return the queue its frames are delivered to."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1)
+        if self._last_image is not None:
+            queue.put_nowait(self._last_image)
+        self._viewers.add(queue)
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(
+                self._async_produce(), "camera still stream producer"
+            )
+        return queue
+
+    @callback
+    def async_remove_viewer(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Remove a viewer and stop producing when it was the last one."""
+        self._viewers.discard(queue)
+        if not self._viewers and self._task is not None:
+            # Unregister right away so new viewers start a new producer
+            self._on_finished(self)
+            self._task.cancel()
+
+    async def _async_produce(self) -> None:
+        """Fetch images at the interval until there are no viewers left."""
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                img_bytes = await self._image_cb()
+                if not img_bytes:
+                    break
+
+                if img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    for queue in self._viewers:
+                        _put_latest(queue, img_bytes)
+
+                next_fetch = last_fetch + self._interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception:
+            _LOGGER.exception("Error fetching image for still stream")
+        finally:
+            self._on_finished(self)
+            for queue in self._viewers:
+                _put_latest(queue, None)
+
+
+def _put_latest(queue: asyncio.Queue[bytes | None], item: bytes | None) -> None:
+    """Put an item in a single item queue, replacing an undelivered item."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import suppress
 import logging
 from typing import TYPE_CHECKING, Literal, cast
@@ -23,6 +24,9 @@ _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+# Total size of the scaled images that are kept in memory
+SCALED_IMAGE_CACHE_BYTES = 16 * 1024 * 1024
+
 
 def find_supported_scaling_factor(
     current_width: int, current_height: int, target_width: int, target_height: int
@@ -77,6 +81,39 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+class ScaledImageCache:
+    """Least recently used cache of scaled images bounded by their total size.
+
+    Scaled images are keyed by a digest of the source image and the
+    requested size, so every frame is only scaled once per size no
+    matter how many clients request it.
+    """
+
+    def __init__(self, max_bytes: int = SCALED_IMAGE_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._images: OrderedDict[tuple[bytes, int, int], bytes] = OrderedDict()
+
+    def get(self, key: tuple[bytes, int, int]) -> bytes | None:
+        """Return a scaled image and mark it as recently used."""
+        if (content := self._images.get(key)) is not None:
+            self._images.move_to_end(key)
+        return content
+
+    def put(self, key: tuple[bytes, int, int], content: bytes) -> None:
+        """Store a scaled image, evicting the least recently used ones."""
+        if len(content) > self._max_bytes:
+            return
+        if (previous := self._images.pop(key, None)) is not None:
+            self._bytes -= len(previous)
+        self._images[key] = content
+        self._bytes += len(content)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._images.popitem(last=False)
+            self._bytes -= len(evicted)
+
+
 class TurboJPEGSingleton:
     """Load TurboJPEG only once.
 
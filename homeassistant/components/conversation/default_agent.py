@@ -13,7 +13,13 @@ import re
 from typing import IO, Any
 
 from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.intents import (
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
     RecognizeResult,
@@ -160,11 +166,17 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        # Parts of the slot lists, kept up to date from registry and state
+        # changes so only the changed part has to be recreated
+        self._area_slot_list: TextSlotList | None = None
+        self._floor_slot_list: TextSlotList | None = None
+        # entity_id -> names of exposed entities
+        self._exposed_entity_names: dict[str, list[TextSlotValue]] | None = None
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._unsub_slot_list_updates: list[Callable[[], None]] | None = None
 
     @property
     def supported_languages(self) -> list[str]:
@@ -183,33 +195,45 @@ class DefaultAgent(ConversationEntity):
     @core.callback
     def _filter_state_changes(self, event_data: core.EventStateChangedData) -> bool:
         """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
+        old_state = event_data["old_state"]
+        new_state = event_data["new_state"]
+        return (
+            not old_state
+            or not new_state
+            or old_state.name != new_state.name
+            or any(
+                old_state.attributes.get(attr) != new_state.attributes.get(attr)
+                for attr in DEFAULT_EXPOSED_ATTRIBUTES
+            )
+        )
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_slot_list_updates(self) -> None:
+        """Listen for changes that update the slot lists."""
+        assert self._unsub_slot_list_updates is None
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_updates = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_area_slot_list,
             ),
             self.hass.bus.async_listen(
                 fr.EVENT_FLOOR_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_clear_floor_slot_list,
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_entity_registry_updated,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_state_changed,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_clear_name_slot_list
+            ),
         ]
 
     async def async_recognize(
@@ -797,100 +821,169 @@ class DefaultAgent(ConversationEntity):
         return lang_intents
 
     @core.callback
-    def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
+    def _async_clear_area_slot_list(
+        self, event: core.Event[ar.EventAreaRegistryUpdatedData]
+    ) -> None:
+        """Clear the area slot list when the area registry has changed."""
+        self._area_slot_list = None
         self._slot_lists = None
-        assert self._unsub_clear_slot_list is not None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
 
     @core.callback
-    def _make_slot_lists(self) -> dict[str, SlotList]:
-        """Create slot lists with areas and entity names/aliases."""
-        if self._slot_lists is not None:
-            return self._slot_lists
+    def _async_clear_floor_slot_list(
+        self, event: core.Event[fr.EventFloorRegistryUpdatedData]
+    ) -> None:
+        """Clear the floor slot list when the floor registry has changed."""
+        self._floor_slot_list = None
+        self._slot_lists = None
 
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
+    @core.callback
+    def _async_clear_name_slot_list(self) -> None:
+        """Clear the names of all entities when expose settings have changed."""
+        self._exposed_entity_names = None
+        self._slot_lists = None
+
+    @core.callback
+    def _async_entity_registry_updated(
+        self, event: core.Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update the names of an entity when its registry entry has changed."""
+        if self._exposed_entity_names is None:
+            return
+        if event.data["action"] == "update" and (
+            old_entity_id := event.data.get("old_entity_id")
+        ):
+            self._exposed_entity_names.pop(old_entity_id, None)
+        self._async_update_entity_names(
+            self._exposed_entity_names, event.data["entity_id"]
+        )
+        self._slot_lists = None
+
+    @core.callback
+    def _async_state_changed(
+        self, event: core.Event[core.EventStateChangedData]
+    ) -> None:
+        """Update the names of an entity when it's added, removed or renamed."""
+        if self._exposed_entity_names is None:
+            return
+        self._async_update_entity_names(
+            self._exposed_entity_names, event.data["entity_id"]
+        )
+        self._slot_lists = None
+
+    @core.callback
+    def _async_update_entity_names(
+        self, exposed_entity_names: dict[str, list[TextSlotValue]], entity_id: str
+    ) -> None:
+        """Update the names of an entity in the exposed entity names."""
+        if (state := self.hass.states.get(entity_id)) is None or (
+            not async_should_expose(self.hass, DOMAIN, entity_id)
+        ):
+            exposed_entity_names.pop(entity_id, None)
+            return
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
 
-        # Gather exposed entity names.
-        #
         # NOTE: We do not pass entity ids in here because multiple entities may
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
         entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
+        if (entity := er.async_get(self.hass).async_get(entity_id)) and (
+            entity.aliases
+        ):
+            for alias in entity.aliases:
+                if not alias.strip():
+                    continue
 
-            entity = entity_registry.async_get(state.entity_id)
+                entity_names.append((alias, alias, context))
 
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
+        # Default name
+        entity_names.append((state.name, state.name, context))
 
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
+        exposed_entity_names[entity_id] = [
+            TextSlotValue.from_tuple(name_tuple, allow_template=False)
+            for name_tuple in entity_names
+        ]
 
-                    entity_names.append((alias, alias, context))
+    @core.callback
+    def _make_slot_lists(self) -> dict[str, SlotList]:
+        """Create slot lists with areas and entity names/aliases."""
+        if self._slot_lists is not None:
+            return self._slot_lists
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
+        if self._unsub_slot_list_updates is None:
+            self._listen_slot_list_updates()
 
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+        if self._exposed_entity_names is None:
+            # Gather exposed entity names.
+            self._exposed_entity_names = {}
+            for state in self.hass.states.async_all():
+                self._async_update_entity_names(
+                    self._exposed_entity_names, state.entity_id
+                )
 
-        # Expose all areas.
-        areas = ar.async_get(self.hass)
-        area_names = []
-        for area in areas.async_list_areas():
-            area_names.append((area.name, area.name))
-            if not area.aliases:
-                continue
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Exposed entities: %s", list(self._exposed_entity_names))
 
-            for alias in area.aliases:
-                alias = alias.strip()
-                if not alias:
+        if self._area_slot_list is None:
+            # Expose all areas.
+            areas = ar.async_get(self.hass)
+            area_names = []
+            for area in areas.async_list_areas():
+                area_names.append((area.name, area.name))
+                if not area.aliases:
                     continue
 
-                area_names.append((alias, alias))
+                for alias in area.aliases:
+                    alias = alias.strip()
+                    if not alias:
+                        continue
 
-        # Expose all floors.
-        floors = fr.async_get(self.hass)
-        floor_names = []
-        for floor in floors.async_list_floors():
-            floor_names.append((floor.name, floor.name))
-            if not floor.aliases:
-                continue
+                    area_names.append((alias, alias))
 
-            for alias in floor.aliases:
-                alias = alias.strip()
-                if not alias:
+            self._area_slot_list = TextSlotList.from_tuples(
+                area_names, allow_template=False
+            )
+
+        if self._floor_slot_list is None:
+            # Expose all floors.
+            floors = fr.async_get(self.hass)
+            floor_names = []
+            for floor in floors.async_list_floors():
+                floor_names.append((floor.name, floor.name))
+                if not floor.aliases:
                     continue
 
-                floor_names.append((alias, floor.name))
+                for alias in floor.aliases:
+                    alias = alias.strip()
+                    if not alias:
+                        continue
+
+                    floor_names.append((alias, floor.name))
+
+            self._floor_slot_list = TextSlotList.from_tuples(
+                floor_names, allow_template=False
+            )
 
         self._slot_lists = {
-            "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
-            "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
+            "area": self._area_slot_list,
+            "name": TextSlotList(
+                values=[
+                    name
+                    for entity_names in self._exposed_entity_names.values()
+                    for name in entity_names
+                ]
+            ),
+            "floor": self._floor_slot_list,
         }
 
-        self._listen_clear_slot_list()
         return self._slot_lists
 
     def _make_intent_context(
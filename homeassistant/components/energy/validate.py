@@ -609,7 +609,8 @@ async def async_validate(hass: HomeAssistant) -> EnergyPreferencesValidation:
                 recorder.statistics.get_metadata,
                 hass,
                 statistic_ids=set(wanted_statistics_metadata),
-            )
+            ),
+            priority=recorder.DBJobPriority.BACKGROUND,
         )
     )
 
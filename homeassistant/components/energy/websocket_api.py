@@ -271,7 +271,9 @@ async def ws_get_fossil_energy_consumption(
     statistic_ids = set(msg["energy_statistic_ids"])
     statistic_ids.add(msg["co2_statistic_id"])
 
-    # Fetch energy + CO2 statistics
+    # Fetch energy + CO2 statistics, the fossil energy of a day or month is the
+    # sum of the hourly energy weighted by the hourly CO2 signal. It can't be
+    # computed from the daily or monthly statistics.
     statistics = await recorder.get_instance(hass).async_add_executor_job(
         recorder.statistics.statistics_during_period,
         hass,
@@ -281,6 +283,7 @@ async def ws_get_fossil_energy_consumption(
         "hour",
         {"energy": UnitOfEnergy.KILO_WATT_HOUR},
         {"mean", "change"},
+        priority=recorder.DBJobPriority.BACKGROUND,
     )
 
     def _combine_change_statistics(
@@ -27,6 +27,10 @@ from homeassistant.helpers.group import (
     expand_entity_ids as _expand_entity_ids,
     get_entity_ids as _get_entity_ids,
 )
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
@@ -130,11 +134,9 @@ def groups_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     if DOMAIN not in hass.data:
         return []
 
-    return [
-        group.entity_id
-        for group in hass.data[DOMAIN].entities
-        if entity_id in group.tracking
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referenced_by(
+        ReferenceType.ENTITY, entity_id
+    )
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
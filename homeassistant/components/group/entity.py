@@ -21,6 +21,10 @@ from homeassistant.helpers import start
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 
 from .const import ATTR_AUTO, ATTR_ORDER, DOMAIN, GROUP_ORDER, REG_KEY
 from .registry import GroupIntegrationRegistry, SingleStateType
@@ -272,6 +276,7 @@ class Group(Entity):
         """
         self._async_stop()
         self._set_tracked(entity_ids)
+        async_get_reference_index(self.hass, DOMAIN).async_invalidate(self.entity_id)
         self._reset_tracked_state()
         self._async_start()
 
@@ -319,6 +324,11 @@ class Group(Entity):
         self.trackable = tuple(trackable)
         self.tracking = tuple(tracking)
 
+    @callback
+    def _async_references(self) -> dict[ReferenceType, tuple[str, ...]]:
+        """Return the entities in the group."""
+        return {ReferenceType.ENTITY: self.tracking}
+
     @callback
     def _async_deregister(self) -> None:
         """Deregister group entity from the registry."""
@@ -366,6 +376,11 @@ class Group(Entity):
         """Handle addition to Home Assistant."""
         self._registry = self.hass.data[REG_KEY]
         self._set_tracked(self._entity_ids)
+        self.async_on_remove(
+            async_get_reference_index(self.hass, DOMAIN).async_add(
+                self.entity_id, self._async_references
+            )
+        )
         self.async_on_remove(start.async_at_start(self.hass, self._async_start))
         self.async_on_remove(self._async_deregister)
 
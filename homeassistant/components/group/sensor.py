@@ -5,8 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 import logging
-import statistics
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
 import voluptuous as vol
 
@@ -59,6 +58,7 @@ from homeassistant.helpers.issue_registry import (
     async_delete_issue,
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.util.aggregation import RunningAggregate
 
 from .const import CONF_IGNORE_NON_NUMERIC, DOMAIN as GROUP_DOMAIN
 from .entity import GroupEntity
@@ -181,112 +181,84 @@ def async_create_preview_sensor(
 
 
 def calc_min(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate min value."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value, _ in sensor_values:
-        if val is None or val > sensor_value:
-            entity_id, val = sensor_id, sensor_value
-
-    attributes = {ATTR_MIN_ENTITY_ID: entity_id}
-    if TYPE_CHECKING:
-        assert val is not None
-    return attributes, val
+    if not aggregate:
+        return {ATTR_MIN_ENTITY_ID: None}, None
+    entity_id, val = aggregate.min()
+    return {ATTR_MIN_ENTITY_ID: entity_id}, val
 
 
 def calc_max(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate max value."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value, _ in sensor_values:
-        if val is None or val < sensor_value:
-            entity_id, val = sensor_id, sensor_value
-
-    attributes = {ATTR_MAX_ENTITY_ID: entity_id}
-    if TYPE_CHECKING:
-        assert val is not None
-    return attributes, val
+    if not aggregate:
+        return {ATTR_MAX_ENTITY_ID: None}, None
+    entity_id, val = aggregate.max()
+    return {ATTR_MAX_ENTITY_ID: entity_id}, val
 
 
 def calc_mean(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate mean value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.mean(result)
-    return {}, value
+    return {}, aggregate.mean()
 
 
 def calc_median(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate median value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.median(result)
-    return {}, value
+    return {}, aggregate.median()
 
 
 def calc_last(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float | None]:
     """Calculate last value."""
     last_updated: datetime | None = None
     last_entity_id: str | None = None
-    last: float | None = None
-    for entity_id, state_f, state in sensor_values:
+    for entity_id in aggregate:
+        state = member_states[entity_id]
         if last_updated is None or state.last_updated > last_updated:
             last_updated = state.last_updated
-            last = state_f
             last_entity_id = entity_id
 
     attributes = {ATTR_LAST_ENTITY_ID: last_entity_id}
-    return attributes, last
+    if last_entity_id is None:
+        return attributes, None
+    return attributes, aggregate[last_entity_id]
 
 
 def calc_range(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate range value."""
-    max_result = max((sensor_value for _, sensor_value, _ in sensor_values))
-    min_result = min((sensor_value for _, sensor_value, _ in sensor_values))
-
-    value: float = max_result - min_result
-    return {}, value
+    return {}, aggregate.range()
 
 
 def calc_stdev(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate standard deviation value."""
-    result = (sensor_value for _, sensor_value, _ in sensor_values)
-
-    value: float = statistics.stdev(result)
-    return {}, value
+    return {}, aggregate.stdev()
 
 
 def calc_sum(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate a sum of values."""
-    result = 0.0
-    for _, sensor_value, _ in sensor_values:
-        result += sensor_value
-
-    return {}, result
+    return {}, aggregate.sum()
 
 
 def calc_product(
-    sensor_values: list[tuple[str, float, State]],
+    aggregate: RunningAggregate, member_states: dict[str, State]
 ) -> tuple[dict[str, str | None], float]:
     """Calculate a product of values."""
     result = 1.0
-    for _, sensor_value, _ in sensor_values:
+    for sensor_value in aggregate.values():
         result *= sensor_value
 
     return {}, result
@@ -295,7 +267,8 @@ def calc_product(
 CALC_TYPES: dict[
     str,
     Callable[
-        [list[tuple[str, float, State]]], tuple[dict[str, str | None], float | None]
+        [RunningAggregate, dict[str, State]],
+        tuple[dict[str, str | None], float | None],
     ],
 ] = {
     "min": calc_min,
@@ -346,10 +319,12 @@ class SensorGroup(GroupEntity, SensorEntity):
         self._ignore_non_numeric = ignore_non_numeric
         self.mode = all if ignore_non_numeric is False else any
         self._state_calc: Callable[
-            [list[tuple[str, float, State]]],
+            [RunningAggregate, dict[str, State]],
             tuple[dict[str, str | None], float | None],
         ] = CALC_TYPES[self._sensor_type]
         self._state_incorrect: set[str] = set()
+        self._aggregate = RunningAggregate(entity_ids)
+        self._member_states: dict[str, State] = {}
         self._extra_state_attribute: dict[str, Any] = {}
 
     async def async_added_to_hass(self) -> None:
@@ -380,72 +355,29 @@ class SensorGroup(GroupEntity, SensorEntity):
             self._native_unit_of_measurement
         )
         self._valid_units = self._get_valid_units()
+        # Units used for conversion may have changed, parse all members again
+        self._member_states.clear()
 
     @callback
     def async_update_group_state(self) -> None:
-        """Query all members and determine the sensor group state."""
+        """Query all members and determine the sensor group state.
+
+        Only members with a new state object are parsed and converted again,
+        their values are updated in the running aggregate.
+        """
         states: list[StateType] = []
         valid_states: list[bool] = []
-        sensor_values: list[tuple[str, float, State]] = []
+        member_states = self._member_states
         for entity_id in self._entity_ids:
-            if (state := self.hass.states.get(entity_id)) is not None:
-                states.append(state.state)
-                try:
-                    numeric_state = float(state.state)
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        in self._valid_units
-                        and self._can_convert is True
-                    ):
-                        numeric_state = UNIT_CONVERTERS[self.device_class].convert(
-                            numeric_state, uom, self.native_unit_of_measurement
-                        )
-                    if (
-                        self._valid_units
-                        and (uom := state.attributes["unit_of_measurement"])
-                        not in self._valid_units
-                    ):
-                        raise HomeAssistantError("Not a valid unit")
-
-                    sensor_values.append((entity_id, numeric_state, state))
-                    if entity_id in self._state_incorrect:
-                        self._state_incorrect.remove(entity_id)
-                    valid_states.append(True)
-                except ValueError:
-                    valid_states.append(False)
-                    # Log invalid states unless ignoring non numeric values
-                    if (
-                        not self._ignore_non_numeric
-                        and entity_id not in self._state_incorrect
-                    ):
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only numerical states are supported,"
-                            " entity %s with value %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.entity_id,
-                        )
-                    continue
-                except (KeyError, HomeAssistantError):
-                    # This exception handling can be simplified
-                    # once sensor entity doesn't allow incorrect unit of measurement
-                    # with a device class, implementation see PR #107639
-                    valid_states.append(False)
-                    if entity_id not in self._state_incorrect:
-                        self._state_incorrect.add(entity_id)
-                        _LOGGER.warning(
-                            "Unable to use state. Only entities with correct unit of measurement"
-                            " is supported,"
-                            " entity %s, value %s with device class %s"
-                            " and unit of measurement %s excluded from calculation in %s",
-                            entity_id,
-                            state.state,
-                            self.device_class,
-                            state.attributes.get("unit_of_measurement"),
-                            self.entity_id,
-                        )
+            if (state := self.hass.states.get(entity_id)) is None:
+                if member_states.pop(entity_id, None) is not None:
+                    self._aggregate.discard(entity_id)
+                continue
+            states.append(state.state)
+            if member_states.get(entity_id) is not state:
+                member_states[entity_id] = state
+                self._async_update_member(entity_id, state)
+            valid_states.append(entity_id in self._aggregate)
 
         # Set group as unavailable if all members do not have numeric values
         self._attr_available = any(numeric_state for numeric_state in valid_states)
@@ -461,9 +393,64 @@ class SensorGroup(GroupEntity, SensorEntity):
 
         # Calculate values
         self._extra_state_attribute, self._attr_native_value = self._state_calc(
-            sensor_values
+            self._aggregate, member_states
         )
 
+    @callback
+    def _async_update_member(self, entity_id: str, state: State) -> None:
+        """Parse the state of a member and update its value in the aggregate."""
+        try:
+            numeric_state = float(state.state)
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                in self._valid_units
+                and self._can_convert is True
+            ):
+                numeric_state = UNIT_CONVERTERS[self.device_class].convert(
+                    numeric_state, uom, self.native_unit_of_measurement
+                )
+            if (
+                self._valid_units
+                and (uom := state.attributes["unit_of_measurement"])
+                not in self._valid_units
+            ):
+                raise HomeAssistantError("Not a valid unit")
+
+            self._aggregate.set(entity_id, numeric_state)
+            if entity_id in self._state_incorrect:
+                self._state_incorrect.remove(entity_id)
+        except ValueError:
+            self._aggregate.discard(entity_id)
+            # Log invalid states unless ignoring non numeric values
+            if not self._ignore_non_numeric and entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only numerical states are supported,"
+                    " entity %s with value %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.entity_id,
+                )
+        except (KeyError, HomeAssistantError):
+            # This exception handling can be simplified
+            # once sensor entity doesn't allow incorrect unit of measurement
+            # with a device class, implementation see PR #107639
+            self._aggregate.discard(entity_id)
+            if entity_id not in self._state_incorrect:
+                self._state_incorrect.add(entity_id)
+                _LOGGER.warning(
+                    "Unable to use state. Only entities with correct unit of measurement"
+                    " is supported,"
+                    " entity %s, value %s with device class %s"
+                    " and unit of measurement %s excluded from calculation in %s",
+                    entity_id,
+                    state.state,
+                    self.device_class,
+                    state.attributes.get("unit_of_measurement"),
+                    self.entity_id,
+                )
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the sensor."""
@@ -12,7 +12,7 @@ from typing import Any, cast
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder import DBJobPriority, get_instance, history
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -168,6 +168,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            priority=DBJobPriority.INTERACTIVE,
         )
     )
 
@@ -292,6 +293,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        priority=DBJobPriority.INTERACTIVE,
     )
     if payload:
         connection.send_message(payload)
@@ -456,7 +458,10 @@ async def ws_stream(
             _async_send_empty_response(connection, msg_id, start_time, end_time)
             return
 
-        connection.subscriptions[msg_id] = callback(lambda: None)
+        # Unsubscribing cancels the query if it is still running
+        task = asyncio.current_task()
+        assert task is not None
+        connection.subscriptions[msg_id] = task.cancel
         connection.send_result(msg_id)
         await _async_send_historical_states(
             hass,
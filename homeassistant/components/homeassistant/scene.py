@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, ValuesView
+from collections.abc import Collection, Mapping
 import logging
 from typing import Any, NamedTuple, cast
 
@@ -33,6 +33,10 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 from homeassistant.helpers.service import (
     async_extract_entity_ids,
     async_register_admin_service,
@@ -145,14 +149,9 @@ def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     if DATA_PLATFORM not in hass.data:
         return []
 
-    platform: EntityPlatform = hass.data[DATA_PLATFORM]
-
-    scene_entities = cast(ValuesView[HomeAssistantScene], platform.entities.values())
-    return [
-        scene_entity.entity_id
-        for scene_entity in scene_entities
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return async_get_reference_index(hass, SCENE_DOMAIN).async_referenced_by(
+        ReferenceType.ENTITY, entity_id
+    )
 
 
 @callback
@@ -365,6 +364,20 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_added_to_hass(self) -> None:
+        """Add the scene to the reference index."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_get_reference_index(self.hass, SCENE_DOMAIN).async_add(
+                self.entity_id, self._async_references
+            )
+        )
+
+    @callback
+    def _async_references(self) -> dict[ReferenceType, Collection[str]]:
+        """Return the entities in the scene."""
+        return {ReferenceType.ENTITY: self.scene_config.states}
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
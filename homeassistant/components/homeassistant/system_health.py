@@ -7,6 +7,13 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.service import (
+    async_entity_service_latency,
+    async_target_resolution_stats,
+)
+
+# Number of entity services with the highest mean latency that are reported
+ENTITY_SERVICE_LATENCY_REPORTED = 5
 
 
 @callback
@@ -21,7 +28,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
 
-    return {
+    health_info: dict[str, Any] = {
         "version": f"core-{info.get('version')}",
         "installation_type": info.get("installation_type"),
         "dev": info.get("dev"),
@@ -36,3 +43,43 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
     }
+    if hass.executor_pools:
+        health_info["executor_pools"] = _executor_pools_summary(hass)
+    if latencies := async_entity_service_latency(hass):
+        health_info["entity_service_latency"] = _entity_service_latency_summary(
+            latencies
+        )
+    if target_resolution := async_target_resolution_stats(hass):
+        health_info["target_resolution_cache"] = (
+            f"{target_resolution['size']} cached,"
+            f" {target_resolution['hits']} hits,"
+            f" {target_resolution['misses']} misses,"
+            f" {target_resolution['hit_rate']:.0%} hit rate"
+        )
+    return health_info
+
+
+def _executor_pools_summary(hass: HomeAssistant) -> str:
+    """Summarize the saturation of the integration executor pools."""
+    summaries = []
+    for name, pool in sorted(hass.executor_pools.items()):
+        stats = pool.stats()
+        summaries.append(
+            f"{name}: {stats['running']}/{stats['max_workers']} busy,"
+            f" {stats['pending']} queued,"
+            f" {stats['queue_wait']['mean']:.3f}s mean wait,"
+            f" {stats['run_time']['mean']:.3f}s mean run"
+        )
+    return "; ".join(summaries)
+
+
+def _entity_service_latency_summary(latencies: dict[str, dict[str, Any]]) -> str:
+    """Summarize the entity services with the highest mean latency."""
+    slowest = sorted(latencies.items(), key=lambda item: item[1]["mean"], reverse=True)[
+        :ENTITY_SERVICE_LATENCY_REPORTED
+    ]
+    return "; ".join(
+        f"{service}: {sum(latency['buckets'].values())} calls,"
+        f" {latency['mean']:.3f}s mean, {latency['max']:.3f}s max"
+        for service, latency in slowest
+    )
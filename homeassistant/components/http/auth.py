@@ -141,6 +141,8 @@ async def async_setup_auth(
         await store.async_save(data)
 
     hass.data[STORAGE_KEY] = refresh_token.id
+    # Dashboards fetch the same signed paths over and over again
+    verified_signatures = jwt_wrapper.VerifiedTokenCache()
 
     @callback
     def async_validate_auth_header(request: Request) -> bool:
@@ -180,12 +182,17 @@ async def async_setup_auth(
         if (signature := request.query.get(SIGN_QUERY_PARAM)) is None:
             return False
 
-        try:
-            claims = jwt_wrapper.verify_and_decode(
-                signature, secret, algorithms=["HS256"], options={"verify_iss": False}
-            )
-        except jwt.InvalidTokenError:
-            return False
+        if (claims := verified_signatures.get(signature)) is None:
+            try:
+                claims = jwt_wrapper.verify_and_decode(
+                    signature,
+                    secret,
+                    algorithms=["HS256"],
+                    options={"verify_iss": False},
+                )
+            except jwt.InvalidTokenError:
+                return False
+            verified_signatures.add(signature, claims)
 
         if claims["path"] != request.path:
             return False
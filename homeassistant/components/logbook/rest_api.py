@@ -11,7 +11,7 @@ from aiohttp import web
 import voluptuous as vol
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import DBJobPriority, get_instance
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
@@ -117,5 +117,8 @@ class LogbookView(HomeAssistantView):
             )
 
         return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+            web.Response,
+            await get_instance(hass).async_add_executor_job(
+                json_events, priority=DBJobPriority.INTERACTIVE
+            ),
         )
@@ -12,7 +12,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
-from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder import DBJobPriority, get_instance
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
@@ -177,6 +177,7 @@ async def _async_get_ws_stream_events(
         formatter,
         event_processor,
         partial,
+        priority=DBJobPriority.INTERACTIVE,
     )
 
 
@@ -309,7 +310,10 @@ async def ws_event_stream(
 
     if end_time and end_time <= utc_now:
         # Not live stream but we it might be a big query
-        connection.subscriptions[msg_id] = callback(lambda: None)
+        # Unsubscribing cancels the query if it is still running
+        task = asyncio.current_task()
+        assert task is not None
+        connection.subscriptions[msg_id] = task.cancel
         connection.send_result(msg_id)
         # Fetch everything from history
         await _async_send_historical_events(
@@ -518,5 +522,6 @@ async def ws_get_events(
             start_time,
             end_time,
             event_processor,
+            priority=DBJobPriority.INTERACTIVE,
         )
     )
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
-import statistics
 from typing import Any
 
 import voluptuous as vol
@@ -29,6 +28,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.util.aggregation import RunningAggregate
 
 from . import PLATFORMS
 from .const import CONF_ENTITY_IDS, CONF_ROUND_DIGITS, DOMAIN
@@ -118,86 +118,6 @@ async def async_setup_platform(
     )
 
 
-def calc_min(sensor_values: list[tuple[str, Any]]) -> tuple[str | None, float | None]:
-    """Calculate min value, honoring unknown states."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val > sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
-
-def calc_max(sensor_values: list[tuple[str, Any]]) -> tuple[str | None, float | None]:
-    """Calculate max value, honoring unknown states."""
-    val: float | None = None
-    entity_id: str | None = None
-    for sensor_id, sensor_value in sensor_values:
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE] and (
-            val is None or val < sensor_value
-        ):
-            entity_id, val = sensor_id, sensor_value
-    return entity_id, val
-
-
-def calc_mean(sensor_values: list[tuple[str, Any]], round_digits: int) -> float | None:
-    """Calculate mean value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    value: float = round(statistics.mean(result), round_digits)
-    return value
-
-
-def calc_median(
-    sensor_values: list[tuple[str, Any]], round_digits: int
-) -> float | None:
-    """Calculate median value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    value: float = round(statistics.median(result), round_digits)
-    return value
-
-
-def calc_range(sensor_values: list[tuple[str, Any]], round_digits: int) -> float | None:
-    """Calculate range value, honoring unknown states."""
-    result = [
-        sensor_value
-        for _, sensor_value in sensor_values
-        if sensor_value not in [STATE_UNKNOWN, STATE_UNAVAILABLE]
-    ]
-
-    if not result:
-        return None
-    value: float = round(max(result) - min(result), round_digits)
-    return value
-
-
-def calc_sum(sensor_values: list[tuple[str, Any]], round_digits: int) -> float | None:
-    """Calculate a sum of values, not honoring unknown states."""
-    result = 0
-    for _, sensor_value in sensor_values:
-        if sensor_value in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
-            return None
-        result += sensor_value
-
-    value: float = round(result, round_digits)
-    return value
-
-
 class MinMaxSensor(SensorEntity):
     """Representation of a min/max sensor."""
 
@@ -238,6 +158,8 @@ class MinMaxSensor(SensorEntity):
         self.last_entity_id: str | None = None
         self.count_sensors = len(self._entity_ids)
         self.states: dict[str, Any] = {}
+        self._aggregate = RunningAggregate(entity_ids)
+        self._unknown: set[str] = set()
 
     async def async_added_to_hass(self) -> None:
         """Handle added to Hass."""
@@ -301,6 +223,8 @@ class MinMaxSensor(SensorEntity):
             ]
         ):
             self.states[entity] = STATE_UNKNOWN
+            self._aggregate.discard(entity)
+            self._unknown.add(entity)
             if not update_state:
                 return
 
@@ -325,6 +249,8 @@ class MinMaxSensor(SensorEntity):
             self.states[entity] = float(new_state.state)
             self.last = float(new_state.state)
             self.last_entity_id = entity
+            self._aggregate.set(entity, self.states[entity])
+            self._unknown.discard(entity)
         except ValueError:
             _LOGGER.warning(
                 "Unable to store state. Only numerical states are supported"
@@ -338,15 +264,16 @@ class MinMaxSensor(SensorEntity):
 
     @callback
     def _calc_values(self) -> None:
-        """Calculate the values."""
-        sensor_values = [
-            (entity_id, self.states[entity_id])
-            for entity_id in self._entity_ids
-            if entity_id in self.states
-        ]
-        self.min_entity_id, self.min_value = calc_min(sensor_values)
-        self.max_entity_id, self.max_value = calc_max(sensor_values)
-        self.mean = calc_mean(sensor_values, self._round_digits)
-        self.median = calc_median(sensor_values, self._round_digits)
-        self.range = calc_range(sensor_values, self._round_digits)
-        self.sum = calc_sum(sensor_values, self._round_digits)
+        """Calculate the values from the running aggregate."""
+        aggregate = self._aggregate
+        if not aggregate:
+            self.min_entity_id = self.min_value = None
+            self.max_entity_id = self.max_value = None
+            self.mean = self.median = self.range = None
+        else:
+            self.min_entity_id, self.min_value = aggregate.min()
+            self.max_entity_id, self.max_value = aggregate.max()
+            self.mean = round(aggregate.mean(), self._round_digits)
+            self.median = round(aggregate.median(), self._round_digits)
+            self.range = round(aggregate.range(), self._round_digits)
+        self.sum = None if self._unknown else round(aggregate.sum(), self._round_digits)
@@ -59,6 +59,8 @@ from .const import (
     CALL_TYPE_X_COILS,
     CALL_TYPE_X_REGISTER_HOLDINGS,
     CONF_BAUDRATE,
+    CONF_BLOCK_READ_MAX_GAP,
+    CONF_BLOCK_READ_MAX_REGISTERS,
     CONF_BYTESIZE,
     CONF_CLIMATES,
     CONF_DATA_TYPE,
@@ -130,6 +132,7 @@ from .const import (
     DEFAULT_HUB,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TEMP_UNIT,
+    MAX_READ_REGISTERS,
     MODBUS_DOMAIN as DOMAIN,
     RTUOVERTCP,
     SERIAL,
@@ -397,6 +400,10 @@ MODBUS_SCHEMA = vol.Schema(
         vol.Optional(CONF_DELAY, default=0): cv.positive_int,
         vol.Optional(CONF_RETRIES): cv.positive_int,
         vol.Optional(CONF_MSG_WAIT): cv.positive_int,
+        vol.Optional(CONF_BLOCK_READ_MAX_GAP, default=0): cv.positive_int,
+        vol.Optional(CONF_BLOCK_READ_MAX_REGISTERS, default=0): vol.All(
+            cv.positive_int, vol.Range(max=MAX_READ_REGISTERS)
+        ),
         vol.Optional(CONF_BINARY_SENSORS): vol.All(
             cv.ensure_list, [BINARY_SENSOR_SCHEMA]
         ),
@@ -14,6 +14,8 @@ from homeassistant.const import (
 
 # configuration names
 CONF_BAUDRATE = "baudrate"
+CONF_BLOCK_READ_MAX_GAP = "block_read_max_gap"
+CONF_BLOCK_READ_MAX_REGISTERS = "block_read_max_registers"
 CONF_BYTESIZE = "bytesize"
 CONF_CLIMATES = "climates"
 CONF_DATA_TYPE = "data_type"
@@ -144,6 +146,7 @@ DEFAULT_TEMP_UNIT = "C"
 MODBUS_DOMAIN = "modbus"
 
 ACTIVE_SCAN_INTERVAL = 2  # limit to force an extra update
+MAX_READ_REGISTERS = 125  # protocol limit for a single register read
 
 PLATFORMS = (
     (Platform.BINARY_SENSOR, CONF_BINARY_SENSORS),
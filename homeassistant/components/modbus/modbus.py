@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from collections.abc import Callable
 import logging
+import time
 from typing import Any
 
 from pymodbus.client import (
@@ -29,7 +30,13 @@ from homeassistant.const import (
     CONF_TYPE,
     EVENT_HOMEASSISTANT_STOP,
 )
-from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.helpers.dispatcher import async_dispatcher_send
@@ -53,6 +60,8 @@ from .const import (
     CALL_TYPE_WRITE_REGISTER,
     CALL_TYPE_WRITE_REGISTERS,
     CONF_BAUDRATE,
+    CONF_BLOCK_READ_MAX_GAP,
+    CONF_BLOCK_READ_MAX_REGISTERS,
     CONF_BYTESIZE,
     CONF_MSG_WAIT,
     CONF_PARITY,
@@ -78,6 +87,7 @@ _LOGGER = logging.getLogger(__name__)
 
 ConfEntry = namedtuple("ConfEntry", "call_type attr func_name")
 RunEntry = namedtuple("RunEntry", "attr func")
+ReadGroup = namedtuple("ReadGroup", "slave input_type scan_interval")
 PB_CALL = [
     ConfEntry(
         CALL_TYPE_COIL,
@@ -323,6 +333,12 @@ class ModbusHub:
         else:
             self._msg_wait = 0
 
+        self._read_planner: ModbusReadPlanner | None = None
+        if max_registers := client_config.get(CONF_BLOCK_READ_MAX_REGISTERS):
+            self._read_planner = ModbusReadPlanner(
+                self, client_config.get(CONF_BLOCK_READ_MAX_GAP, 0), max_registers
+            )
+
     def _log_error(self, text: str, error_state: bool = True) -> None:
         log_text = f"Pymodbus: {self.name}: {text}"
         if self._in_error:
@@ -392,6 +408,8 @@ class ModbusHub:
                     self._log_error(str(exception_error))
                 del self._client
                 self._client = None
+                if self._read_planner:
+                    self._read_planner.async_clear()
                 message = f"modbus {self.name} communication closed"
                 _LOGGER.warning(message)
 
@@ -442,3 +460,137 @@ class ModbusHub:
                 # small delay until next request/response
                 await asyncio.sleep(self._msg_wait)
             return result
+
+    @callback
+    def async_add_read_range(
+        self,
+        slave: int | None,
+        input_type: str,
+        scan_interval: int,
+        address: int,
+        count: int,
+    ) -> CALLBACK_TYPE:
+        """Add a polled register range for block reads, return remove callback."""
+        if not self._read_planner or scan_interval <= 0:
+            return lambda: None
+        return self._read_planner.async_add_range(
+            ReadGroup(slave, input_type, scan_interval), address, count
+        )
+
+    async def async_read_registers(
+        self,
+        slave: int | None,
+        address: int,
+        count: int,
+        input_type: str,
+        scan_interval: int = 0,
+    ) -> list[int] | None:
+        """Read registers, from a block read shared with other entities if possible."""
+        if self._read_planner and scan_interval > 0:
+            return await self._read_planner.async_read(
+                ReadGroup(slave, input_type, scan_interval), address, count
+            )
+        result = await self.async_pb_call(slave, address, count, input_type)
+        if result is None:
+            return None
+        registers: list[int] = result.registers
+        return registers
+
+
+class ModbusReadPlanner:
+    """Merge register reads of entities into block reads.
+
+    The register ranges of entities polling the same slave and input type
+    at the same scan interval are merged into blocks of at most
+    max_registers registers, with at most max_gap unused registers between
+    two ranges. The first entity polled in a scan interval reads the whole
+    block, the other entities get their registers sliced out of that read.
+    """
+
+    def __init__(self, hub: ModbusHub, max_gap: int, max_registers: int) -> None:
+        """Initialize the read planner."""
+        self._hub = hub
+        self._max_gap = max_gap
+        self._max_registers = max_registers
+        self._ranges: defaultdict[ReadGroup, list[tuple[int, int]]] = defaultdict(list)
+        self._blocks: dict[ReadGroup, dict[tuple[int, int], tuple[int, int]]] = {}
+        self._locks: defaultdict[tuple[ReadGroup, int], asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        self._results: dict[tuple[ReadGroup, int], tuple[float, list[int] | None]] = {}
+
+    @callback
+    def async_add_range(
+        self, group: ReadGroup, address: int, count: int
+    ) -> CALLBACK_TYPE:
+        """Add a register range to a group, return remove callback."""
+        ranges = self._ranges[group]
+        ranges.append((address, count))
+        self._async_plan(group)
+
+        @callback
+        def _async_remove_range() -> None:
+            ranges.remove((address, count))
+            self._async_plan(group)
+
+        return _async_remove_range
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all block read results."""
+        self._results.clear()
+
+    @callback
+    def _async_plan(self, group: ReadGroup) -> None:
+        """Merge the register ranges of a group into blocks."""
+        for key in [key for key in self._results if key[0] == group]:
+            del self._results[key]
+        blocks = self._blocks[group] = {}
+        members: list[tuple[int, int]] = []
+        block_start = block_end = 0
+        for address, count in sorted(set(self._ranges[group])):
+            end = address + count
+            if members and (
+                address <= block_end + self._max_gap
+                and max(block_end, end) - block_start <= self._max_registers
+            ):
+                block_end = max(block_end, end)
+            else:
+                for member in members:
+                    blocks[member] = (block_start, block_end - block_start)
+                members = []
+                block_start, block_end = address, end
+            members.append((address, count))
+        for member in members:
+            blocks[member] = (block_start, block_end - block_start)
+
+    async def async_read(
+        self, group: ReadGroup, address: int, count: int
+    ) -> list[int] | None:
+        """Return the registers of a range, reading its block if needed."""
+        block = self._blocks.get(group, {}).get((address, count))
+        if block is None:
+            result = await self._hub.async_pb_call(
+                group.slave, address, count, group.input_type
+            )
+            return None if result is None else result.registers
+        block_start, block_count = block
+        key = (group, block_start)
+        async with self._locks[key]:
+            # A block read is shared with the entities polled in the same
+            # scan interval, the next interval reads the block again
+            cached = self._results.get(key)
+            if cached is not None and (
+                time.monotonic() - cached[0] < group.scan_interval / 2
+            ):
+                registers = cached[1]
+            else:
+                result = await self._hub.async_pb_call(
+                    group.slave, block_start, block_count, group.input_type
+                )
+                registers = None if result is None else result.registers
+                self._results[key] = (time.monotonic(), registers)
+        if registers is None:
+            return None
+        offset = address - block_start
+        return registers[offset : offset + count]
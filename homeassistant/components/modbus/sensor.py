@@ -101,6 +101,15 @@ class ModbusRegisterSensor(BaseStructPlatform, RestoreSensor, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await self.async_base_added_to_hass()
+        self.async_on_remove(
+            self._hub.async_add_read_range(
+                self._slave,
+                self._input_type,
+                self._scan_interval,
+                self._address,
+                self._count,
+            )
+        )
         state = await self.async_get_last_sensor_data()
         if state:
             self._attr_native_value = state.native_value
@@ -110,10 +119,14 @@ class ModbusRegisterSensor(BaseStructPlatform, RestoreSensor, SensorEntity):
         # remark "now" is a dummy parameter to avoid problems with
         # async_track_time_interval
         self._cancel_call = None
-        raw_result = await self._hub.async_pb_call(
-            self._slave, self._address, self._count, self._input_type
+        registers = await self._hub.async_read_registers(
+            self._slave,
+            self._address,
+            self._count,
+            self._input_type,
+            self._scan_interval,
         )
-        if raw_result is None:
+        if registers is None:
             self._attr_available = False
             self._attr_native_value = None
             if self._coordinator:
@@ -121,7 +134,7 @@ class ModbusRegisterSensor(BaseStructPlatform, RestoreSensor, SensorEntity):
             self.async_write_ha_state()
             return
 
-        result = self.unpack_structure_result(raw_result.registers)
+        result = self.unpack_structure_result(registers)
         if self._coordinator:
             if result:
                 result_array = list(
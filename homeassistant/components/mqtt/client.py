@@ -82,6 +82,7 @@ from .models import (
     PublishMessage,
     PublishPayloadType,
     ReceiveMessage,
+    receive_message_cv,
 )
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
@@ -1072,58 +1073,62 @@ class MQTT:
         )
         subscriptions = self._matching_subscriptions(topic)
         msg_cache_by_subscription_topic: dict[str, ReceiveMessage] = {}
-
-        for subscription in subscriptions:
-            if msg.retain:
-                retained_topics = self._retained_topics[subscription]
-                # Skip if the subscription already received a retained message
-                if topic in retained_topics:
-                    continue
-                # Remember the subscription had an initial retained message
-                self._retained_topics[subscription].add(topic)
-
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
+        token = receive_message_cv.set(None)
+        try:
+            for subscription in subscriptions:
+                if msg.retain:
+                    retained_topics = self._retained_topics[subscription]
+                    # Skip if the subscription already received a retained message
+                    if topic in retained_topics:
+                        continue
+                    # Remember the subscription had an initial retained message
+                    self._retained_topics[subscription].add(topic)
+
+                payload: SubscribePayloadType = msg.payload
+                if subscription.encoding is not None:
+                    try:
+                        payload = msg.payload.decode(subscription.encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        _LOGGER.warning(
+                            "Can't decode payload %s on %s with encoding %s (for %s)",
+                            msg.payload[0:8192],
+                            topic,
+                            subscription.encoding,
+                            subscription.job,
+                        )
+                        continue
+                subscription_topic = subscription.topic
+                if subscription_topic not in msg_cache_by_subscription_topic:
+                    # Only make one copy of the message
+                    # per topic so we avoid storing a separate
+                    # dataclass in memory for each subscriber
+                    # to the same topic for retained messages
+                    receive_msg = ReceiveMessage(
                         topic,
-                        subscription.encoding,
-                        subscription.job,
+                        payload,
+                        msg.qos,
+                        msg.retain,
+                        subscription_topic,
+                        msg.timestamp,
                     )
-                    continue
-            subscription_topic = subscription.topic
-            if subscription_topic not in msg_cache_by_subscription_topic:
-                # Only make one copy of the message
-                # per topic so we avoid storing a separate
-                # dataclass in memory for each subscriber
-                # to the same topic for retained messages
-                receive_msg = ReceiveMessage(
-                    topic,
-                    payload,
-                    msg.qos,
-                    msg.retain,
-                    subscription_topic,
-                    msg.timestamp,
-                )
-                msg_cache_by_subscription_topic[subscription_topic] = receive_msg
-            else:
-                receive_msg = msg_cache_by_subscription_topic[subscription_topic]
-            job = subscription.job
-            if job.job_type is HassJobType.Callback:
-                # We do not wrap Callback jobs in catch_log_exception since
-                # its expensive and we have to do it 2x for every entity
-                try:
-                    job.target(receive_msg)
-                except Exception:  # noqa: BLE001
-                    log_exception(
-                        partial(self._exception_message, job.target, receive_msg)
-                    )
-            else:
-                self.hass.async_run_hass_job(job, receive_msg)
+                    msg_cache_by_subscription_topic[subscription_topic] = receive_msg
+                else:
+                    receive_msg = msg_cache_by_subscription_topic[subscription_topic]
+                receive_message_cv.set(receive_msg)
+                job = subscription.job
+                if job.job_type is HassJobType.Callback:
+                    # We do not wrap Callback jobs in catch_log_exception since
+                    # its expensive and we have to do it 2x for every entity
+                    try:
+                        job.target(receive_msg)
+                    except Exception:  # noqa: BLE001
+                        log_exception(
+                            partial(self._exception_message, job.target, receive_msg)
+                        )
+                else:
+                    self.hass.async_run_hass_job(job, receive_msg)
+        finally:
+            receive_message_cv.reset(token)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     @callback
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from datetime import datetime
 import functools
+import hashlib
 import logging
 import re
 import time
@@ -12,14 +14,22 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_DEVICE, CONF_PLATFORM
-from homeassistant.core import HassJobType, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HassJobType,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.data_entry_flow import FlowResultType
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service_info.mqtt import MqttServiceInfo, ReceivePayloadType
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import DiscoveryInfoType
 from homeassistant.loader import async_get_mqtt
 from homeassistant.util.json import json_loads_object
@@ -27,6 +37,7 @@ from homeassistant.util.signal_type import SignalTypeFormat
 
 from .. import mqtt
 from .abbreviations import ABBREVIATIONS, DEVICE_ABBREVIATIONS, ORIGIN_ABBREVIATIONS
+from .client import DISCOVERY_COOLDOWN
 from .const import (
     ATTR_DISCOVERY_HASH,
     ATTR_DISCOVERY_PAYLOAD,
@@ -37,7 +48,13 @@ from .const import (
     DOMAIN,
     SUPPORTED_COMPONENTS,
 )
-from .models import DATA_MQTT, MqttOriginInfo, ReceiveMessage
+from .models import (
+    DATA_MQTT,
+    DiscoveryCacheItem,
+    MqttData,
+    MqttOriginInfo,
+    ReceiveMessage,
+)
 from .schemas import MQTT_ORIGIN_INFO_SCHEMA
 from .util import async_forward_entry_setup_and_setup_discovery
 
@@ -64,6 +81,10 @@ MQTT_DISCOVERY_DONE: SignalTypeFormat[Any] = SignalTypeFormat(
 
 TOPIC_BASE = "~"
 
+DISCOVERY_CACHE_STORAGE_KEY = "mqtt.discovery_cache"
+DISCOVERY_CACHE_STORAGE_VERSION = 1
+DISCOVERY_CACHE_SAVE_DELAY = 60
+
 
 class MQTTDiscoveryPayload(dict[str, Any]):
     """Class to hold and MQTT discovery payload and discovery data."""
@@ -185,12 +206,92 @@ def _valid_origin_info(discovery_payload: MQTTDiscoveryPayload) -> bool:
     return True
 
 
+def _payload_hash(payload: ReceivePayloadType) -> str:
+    """Return the hash of a received discovery payload."""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+async def _async_load_discovery_cache(hass: HomeAssistant) -> None:
+    """Load the discovery payloads normalized before Home Assistant restarted."""
+    mqtt_data = hass.data[DATA_MQTT]
+    if mqtt_data.discovery_cache_store is not None:
+        return
+    store = Store[dict[str, dict[str, Any]]](
+        hass, DISCOVERY_CACHE_STORAGE_VERSION, DISCOVERY_CACHE_STORAGE_KEY
+    )
+    mqtt_data.discovery_cache_store = store
+    for topic, item in (await store.async_load() or {}).items():
+        mqtt_data.discovery_cache.setdefault(
+            topic, DiscoveryCacheItem(item["hash"], item["payload"], received=False)
+        )
+
+
+@callback
+def _async_save_discovery_cache(mqtt_data: MqttData) -> None:
+    """Save the normalized discovery payloads."""
+    if (store := mqtt_data.discovery_cache_store) is None:
+        return
+
+    @callback
+    def _data_to_save() -> dict[str, dict[str, Any]]:
+        return {
+            topic: {"hash": item.payload_hash, "payload": item.discovery_payload}
+            for topic, item in mqtt_data.discovery_cache.items()
+        }
+
+    store.async_delay_save(_data_to_save, DISCOVERY_CACHE_SAVE_DELAY)
+
+
+@callback
+def _async_prune_discovery_cache(mqtt_data: MqttData) -> None:
+    """Remove the payloads of topics which were not received since starting.
+
+    Their retained discovery messages were removed from the broker while Home
+    Assistant was not connected.
+    """
+    if stale := [
+        topic for topic, item in mqtt_data.discovery_cache.items() if not item.received
+    ]:
+        for topic in stale:
+            del mqtt_data.discovery_cache[topic]
+        _async_save_discovery_cache(mqtt_data)
+
+
 async def async_start(  # noqa: C901
     hass: HomeAssistant, discovery_topic: str, config_entry: ConfigEntry
 ) -> None:
     """Start MQTT Discovery."""
     mqtt_data = hass.data[DATA_MQTT]
     platform_setup_lock: dict[str, asyncio.Lock] = {}
+    prune_scheduled = False
+    cancel_prune: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_prune_when_settled(_: datetime) -> None:
+        """Prune the discovery cache once no discovery messages are received."""
+        nonlocal cancel_prune
+        if (
+            wait := mqtt_data.last_discovery + DISCOVERY_COOLDOWN - time.monotonic()
+        ) > 0:
+            cancel_prune = async_call_later(hass, wait, prune_job)
+            return
+        cancel_prune = None
+        _async_prune_discovery_cache(mqtt_data)
+
+    prune_job = HassJob(
+        _async_prune_when_settled,
+        "mqtt discovery cache prune",
+        job_type=HassJobType.Callback,
+        cancel_on_shutdown=True,
+    )
+
+    @callback
+    def _async_cancel_prune() -> None:
+        """Cancel pruning the discovery cache."""
+        if cancel_prune is not None:
+            cancel_prune()
 
     @callback
     def _async_add_component(discovery_payload: MQTTDiscoveryPayload) -> None:
@@ -218,7 +319,12 @@ async def async_start(  # noqa: C901
     @callback
     def async_discovery_message_received(msg: ReceiveMessage) -> None:  # noqa: C901
         """Process the received message."""
+        nonlocal cancel_prune, prune_scheduled
         mqtt_data.last_discovery = msg.timestamp
+        if not prune_scheduled:
+            # Retained discovery messages are received after subscribing
+            prune_scheduled = True
+            cancel_prune = async_call_later(hass, DISCOVERY_COOLDOWN, prune_job)
         payload = msg.payload
         topic = msg.topic
         topic_trimmed = topic.replace(f"{discovery_topic}/", "", 1)
@@ -242,7 +348,14 @@ async def async_start(  # noqa: C901
             _LOGGER.warning("Integration %s is not supported", component)
             return
 
-        if payload:
+        payload_hash = _payload_hash(payload) if payload else None
+        cached = mqtt_data.discovery_cache.get(topic)
+        if cached is not None and cached.payload_hash == payload_hash:
+            # Retained messages are received again after reconnecting
+            # and restarting
+            cached.received = True
+            discovery_payload = MQTTDiscoveryPayload(cached.discovery_payload)
+        elif payload_hash is not None:
             try:
                 discovery_payload = MQTTDiscoveryPayload(json_loads_object(payload))
             except ValueError:
@@ -253,7 +366,15 @@ async def async_start(  # noqa: C901
                 return
             if TOPIC_BASE in discovery_payload:
                 _replace_topic_base(discovery_payload)
+            if discovery_payload:
+                discovery_payload[CONF_PLATFORM] = "mqtt"
+            mqtt_data.discovery_cache[topic] = DiscoveryCacheItem(
+                payload_hash, dict(discovery_payload)
+            )
+            _async_save_discovery_cache(mqtt_data)
         else:
+            if mqtt_data.discovery_cache.pop(topic, None) is not None:
+                _async_save_discovery_cache(mqtt_data)
             discovery_payload = MQTTDiscoveryPayload({})
 
         # If present, the node_id will be included in the discovered object id
@@ -274,8 +395,6 @@ async def async_start(  # noqa: C901
             }
             setattr(discovery_payload, "discovery_data", discovery_data)
 
-            discovery_payload[CONF_PLATFORM] = "mqtt"
-
         if discovery_hash in mqtt_data.discovery_pending_discovered:
             pending = mqtt_data.discovery_pending_discovered[discovery_hash]["pending"]
             pending.appendleft(discovery_payload)
@@ -343,6 +462,9 @@ async def async_start(  # noqa: C901
                 hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None
             )
 
+    await _async_load_discovery_cache(hass)
+    # Only prune the discovery cache once after loading it
+    prune_scheduled = all(item.received for item in mqtt_data.discovery_cache.values())
     mqtt_data.discovery_unsubscribe = [
         mqtt.async_subscribe_internal(
             hass,
@@ -356,6 +478,7 @@ async def async_start(  # noqa: C901
             f"{discovery_topic}/+/+/+/config",
         )
     ]
+    mqtt_data.discovery_unsubscribe.append(_async_cancel_prune)
 
     mqtt_data.last_discovery = time.monotonic()
     mqtt_integrations = await async_get_mqtt(hass)
@@ -179,6 +179,23 @@ def _handle_discovery_failure(
     async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(*discovery_hash), None)
 
 
+@callback
+def _async_validate_discovery_payload(
+    hass: HomeAssistant,
+    discovery_schema: VolSchemaType,
+    discovery_payload: MQTTDiscoveryPayload,
+) -> ConfigType:
+    """Validate a discovery payload, reusing the config if it is unchanged."""
+    discovery_topic = discovery_payload.discovery_data[ATTR_DISCOVERY_TOPIC]
+    cached = hass.data[DATA_MQTT].discovery_cache.get(discovery_topic)
+    if cached is None or cached.discovery_payload != discovery_payload:
+        config: ConfigType = discovery_schema(discovery_payload)
+        return config
+    if cached.config is None:
+        cached.config = discovery_schema(discovery_payload)
+    return cached.config
+
+
 def _verify_mqtt_config_entry_enabled_for_discovery(
     hass: HomeAssistant, domain: str, discovery_payload: MQTTDiscoveryPayload
 ) -> bool:
@@ -223,7 +240,9 @@ def async_setup_non_entity_entry_helper(
         ):
             return
         try:
-            config: ConfigType = discovery_schema(discovery_payload)
+            config = _async_validate_discovery_payload(
+                hass, discovery_schema, discovery_payload
+            )
             await async_setup(config, discovery_data=discovery_payload.discovery_data)
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
@@ -254,6 +273,13 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    discovered_entities: list[Entity] = []
+
+    async def _async_add_discovered_entities() -> None:
+        """Add the entities discovered since the entities were last added."""
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
 
     @callback
     def _async_setup_entity_entry_from_discovery(
@@ -266,20 +292,31 @@ def async_setup_entity_entry_helper(
         ):
             return
         try:
-            config: DiscoveryInfoType = discovery_schema(discovery_payload)
+            config = _async_validate_discovery_payload(
+                hass, discovery_schema, discovery_payload
+            )
             if schema_class_mapping is not None:
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
                 assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
-            )
+            entity = entity_class(hass, config, entry, discovery_payload.discovery_data)
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
             async_handle_schema_error(discovery_payload, err)
         except Exception:
             _handle_discovery_failure(hass, discovery_payload)
             raise
+        else:
+            # Retained discovery messages are received in bursts, add the
+            # entities discovered by a burst to the platform together
+            if not discovered_entities:
+                entry.async_create_task(
+                    hass,
+                    _async_add_discovered_entities(),
+                    f"mqtt {domain} add discovered entities",
+                    eager_start=False,
+                )
+            discovered_entities.append(entity)
 
     mqtt_data.reload_dispatchers.append(
         async_dispatcher_connect(
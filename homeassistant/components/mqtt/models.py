@@ -6,6 +6,7 @@ from ast import literal_eval
 import asyncio
 from collections import deque
 from collections.abc import Callable
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import StrEnum
 import logging
@@ -17,6 +18,7 @@ from homeassistant.exceptions import ServiceValidationError, TemplateError
 from homeassistant.helpers import template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import (
     ConfigType,
     DiscoveryInfoType,
@@ -24,6 +26,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -48,6 +51,8 @@ _LOGGER = logging.getLogger(__name__)
 
 ATTR_THIS = "this"
 
+_UNDECODED = object()
+
 type PublishPayloadType = str | bytes | int | float | None
 
 
@@ -74,6 +79,29 @@ class ReceiveMessage:
     retain: bool
     subscribed_topic: str
     timestamp: float
+    _value_json: Any = field(default=_UNDECODED, init=False, repr=False)
+
+    @property
+    def value_json(self) -> Any:
+        """Return the payload decoded as JSON.
+
+        The payload is decoded once and shared by all subscribers of the
+        message, PayloadSentinel.NONE is returned if it is not valid JSON.
+        """
+        if (value_json := self._value_json) is _UNDECODED:
+            try:
+                value_json = json_loads(self.payload)
+            except JSON_DECODE_EXCEPTIONS:
+                value_json = PayloadSentinel.NONE
+            object.__setattr__(self, "_value_json", value_json)
+        return value_json
+
+
+# The message that is being passed to subscribers, value templates
+# rendering its payload use its decoded JSON instead of decoding it again
+receive_message_cv: ContextVar[ReceiveMessage | None] = ContextVar(
+    "receive_message_cv", default=None
+)
 
 
 type MessageCallbackType = Callable[[ReceiveMessage], None]
@@ -108,6 +136,23 @@ class PendingDiscovered(TypedDict):
     unsub: CALLBACK_TYPE
 
 
+@dataclass(slots=True)
+class DiscoveryCacheItem:
+    """A normalized discovery payload and the config validated from it.
+
+    Kept per discovery topic, so a retained discovery message that is received
+    again with an unchanged payload is neither normalized nor validated again.
+    The normalized payload is stored with the hash of the received payload, the
+    validated config is not since it holds templates. Stored payloads which are
+    not received again after starting are removed.
+    """
+
+    payload_hash: str
+    discovery_payload: dict[str, Any]
+    config: ConfigType | None = None
+    received: bool = True
+
+
 class MqttOriginInfo(TypedDict, total=False):
     """Integration info of discovered entity."""
 
@@ -317,6 +362,12 @@ class MqttValueTemplate:
                 )
             values[ATTR_THIS] = self._template_state
 
+        decode_json = True
+        if (msg := receive_message_cv.get()) is not None and msg.payload is payload:
+            decode_json = False
+            if (value_json := msg.value_json) is not PayloadSentinel.NONE:
+                values["value_json"] = value_json
+
         if default is PayloadSentinel.NONE:
             _LOGGER.debug(
                 "Rendering incoming payload '%s' with variables %s and %s",
@@ -327,7 +378,7 @@ class MqttValueTemplate:
             try:
                 rendered_payload = (
                     self._value_template.async_render_with_possible_json_value(
-                        payload, variables=values
+                        payload, variables=values, decode_json=decode_json
                     )
                 )
             except TEMPLATE_ERRORS as exc:
@@ -353,7 +404,7 @@ class MqttValueTemplate:
         try:
             rendered_payload = (
                 self._value_template.async_render_with_possible_json_value(
-                    payload, default, variables=values
+                    payload, default, variables=values, decode_json=decode_json
                 )
             )
         except TEMPLATE_ERRORS as exc:
@@ -409,6 +460,8 @@ class MqttData:
     device_triggers: dict[str, Trigger] = field(default_factory=dict)
     data_config_flow_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     discovery_already_discovered: set[tuple[str, str]] = field(default_factory=set)
+    discovery_cache: dict[str, DiscoveryCacheItem] = field(default_factory=dict)
+    discovery_cache_store: Store[dict[str, dict[str, Any]]] | None = None
     discovery_pending_discovered: dict[tuple[str, str], PendingDiscovered] = field(
         default_factory=dict
     )
@@ -48,6 +48,10 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, VolDictType
@@ -142,13 +146,9 @@ def persons_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     ):
         return []
 
-    component: EntityComponent[Person] = hass.data[DOMAIN][2]
-
-    return [
-        person_entity.entity_id
-        for person_entity in component.entities
-        if entity_id in person_entity.device_trackers
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referenced_by(
+        ReferenceType.ENTITY, entity_id
+    )
 
 
 @callback
@@ -464,6 +464,11 @@ class Person(
     async def async_added_to_hass(self) -> None:
         """Register device trackers."""
         await super().async_added_to_hass()
+        self.async_on_remove(
+            async_get_reference_index(self.hass, DOMAIN).async_add(
+                self.entity_id, self._async_references
+            )
+        )
         if state := await self.async_get_last_state():
             self._parse_source_state(state)
 
@@ -493,6 +498,7 @@ class Person(
         """Handle when the config is updated."""
         self._config = config
         self._set_attrs_from_config()
+        async_get_reference_index(self.hass, DOMAIN).async_invalidate(self.entity_id)
 
         if self._unsub_track_device is not None:
             self._unsub_track_device()
@@ -507,6 +513,11 @@ class Person(
 
         self._update_state()
 
+    @callback
+    def _async_references(self) -> dict[ReferenceType, list[str]]:
+        """Return the device trackers of the person."""
+        return {ReferenceType.ENTITY: self.device_trackers}
+
     @callback
     def _async_handle_tracker_update(self, event: Event[EventStateChangedData]) -> None:
         """Handle the device tracker state changes."""
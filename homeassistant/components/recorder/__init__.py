@@ -8,6 +8,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.const import (
+    CONF_ENTITIES,
     CONF_EXCLUDE,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,  # noqa: F401
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,  # noqa: F401
@@ -28,6 +29,7 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, websocket_api
+from .compression import CompressionPolicy
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
@@ -35,6 +37,7 @@ from .const import (  # noqa: F401
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
     SQLITE_URL_PREFIX,
+    DBJobPriority,
     SupportedDialect,
 )
 from .core import Recorder
@@ -61,6 +64,12 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_COMPRESSION = "compression"
+CONF_DEVICE_CLASSES = "device_classes"
+CONF_ABSOLUTE_DEADBAND = "absolute_deadband"
+CONF_RELATIVE_DEADBAND = "relative_deadband"
+CONF_SWINGING_DOOR = "swinging_door"
+CONF_MAX_INTERVAL = "max_interval"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -71,6 +80,31 @@ FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {vol.Optional(CONF_EXCLUDE, default=EXCLUDE_SCHEMA({})): EXCLUDE_SCHEMA}
 )
 
+COMPRESSION_POLICY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_ABSOLUTE_DEADBAND): cv.positive_float,
+            vol.Optional(CONF_RELATIVE_DEADBAND): cv.positive_float,
+            vol.Optional(CONF_SWINGING_DOOR): cv.positive_float,
+            vol.Optional(CONF_MAX_INTERVAL): cv.positive_time_period,
+        }
+    ),
+    cv.has_at_least_one_key(
+        CONF_ABSOLUTE_DEADBAND, CONF_RELATIVE_DEADBAND, CONF_SWINGING_DOOR
+    ),
+)
+
+COMPRESSION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ENTITIES, default=dict): {
+            cv.entity_id: COMPRESSION_POLICY_SCHEMA
+        },
+        vol.Optional(CONF_DEVICE_CLASSES, default=dict): {
+            cv.string: COMPRESSION_POLICY_SCHEMA
+        },
+    }
+)
+
 
 ALLOW_IN_MEMORY_DB = False
 
@@ -113,6 +147,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_COMPRESSION): COMPRESSION_SCHEMA,
                 }
             ),
         )
@@ -152,6 +187,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
+    compression = conf.get(CONF_COMPRESSION, {})
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -163,6 +199,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        entity_compression=_compression_policies(compression.get(CONF_ENTITIES, {})),
+        device_class_compression=_compression_policies(
+            compression.get(CONF_DEVICE_CLASSES, {})
+        ),
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -177,6 +217,21 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return await instance.async_db_ready
 
 
+def _compression_policies(
+    conf: dict[str, dict[str, Any]],
+) -> dict[str, CompressionPolicy]:
+    """Create compression policies from their config."""
+    return {
+        key: CompressionPolicy(
+            absolute_deadband=policy.get(CONF_ABSOLUTE_DEADBAND, 0),
+            relative_deadband=policy.get(CONF_RELATIVE_DEADBAND, 0),
+            swinging_door=policy.get(CONF_SWINGING_DOOR),
+            max_interval=policy.get(CONF_MAX_INTERVAL),
+        )
+        for key, policy in conf.items()
+    }
+
+
 async def _async_setup_integration_platform(
     hass: HomeAssistant, instance: Recorder
 ) -> None:
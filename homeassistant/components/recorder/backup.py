@@ -1,11 +1,12 @@
 """Backup platform for the Recorder integration."""
 
 from logging import getLogger
+from pathlib import Path
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .util import async_migration_in_progress, get_instance
+from .util import async_migration_in_progress, dburl_to_path, get_instance
 
 _LOGGER = getLogger(__name__)
 
@@ -25,3 +26,33 @@ async def async_post_backup(hass: HomeAssistant) -> None:
     _LOGGER.info("Backup end notification, releasing write lock")
     if not instance.unlock_database():
         raise HomeAssistantError("Could not release database write lock")
+
+
+async def async_backup_snapshot(
+    hass: HomeAssistant, snapshot_dir: Path
+) -> dict[str, Path | None]:
+    """Write a snapshot of the database to back up instead of the database."""
+    instance = get_instance(hass)
+    if async_migration_in_progress(hass):
+        raise HomeAssistantError("Database migration in progress")
+    database = Path(dburl_to_path(instance.db_url))
+    if (
+        path := await hass.async_add_executor_job(
+            _config_relative_path, database, Path(hass.config.config_dir)
+        )
+    ) is None:
+        # Not a database file in the configuration directory
+        return {}
+    snapshot = snapshot_dir / database.name
+    _LOGGER.info("Backup start notification, writing database snapshot")
+    if not await instance.async_snapshot_database(snapshot.as_posix()):
+        return {}
+    return {path: snapshot, f"{path}-wal": None, f"{path}-shm": None}
+
+
+def _config_relative_path(path: Path, config_dir: Path) -> str | None:
+    """Return the path relative to the configuration directory if it is in it."""
+    try:
+        return path.resolve().relative_to(config_dir.resolve()).as_posix()
+    except ValueError:
+        return None
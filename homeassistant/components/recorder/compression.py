@@ -0,0 +1,202 @@
+"""Compress the states of noisy numeric entities before they are recorded."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import math
+from typing import Any
+
+from homeassistant.const import ATTR_DEVICE_CLASS, EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, State, callback
+
+
+@dataclass(slots=True, frozen=True)
+class CompressionPolicy:
+    """How the states of an entity are compressed.
+
+    A numeric state is not recorded while it stays within the deadband of the
+    last recorded state. With a swinging door deviation, states outside the
+    deadband are not recorded either while a straight line from the last
+    recorded state to the latest state stays within the deviation of all
+    states in between. A state is always recorded once max_interval passed
+    since the last recorded state.
+    """
+
+    absolute_deadband: float = 0
+    relative_deadband: float = 0
+    swinging_door: float | None = None
+    max_interval: timedelta | None = None
+
+
+@dataclass(slots=True)
+class _EntityCompression:
+    """The compression of the states of one entity."""
+
+    state: State
+    value: float
+    held: Event[EventStateChangedData] | None = None
+    upper_slope: float = math.inf
+    lower_slope: float = -math.inf
+
+
+def _numeric_value(state: State) -> float | None:
+    """Return the value of a numeric state."""
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+class StateCompressor:
+    """Hold back state changes that do not have to be recorded.
+
+    Only the last state that was held back for an entity is kept. It is
+    recorded before the next state that has to be recorded, so history
+    shows when a value started changing.
+    """
+
+    def __init__(
+        self,
+        entity_policies: dict[str, CompressionPolicy],
+        device_class_policies: dict[str, CompressionPolicy],
+        queue_put: Callable[[Event[Any]], None],
+    ) -> None:
+        """Initialize the compressor."""
+        self._entity_policies = entity_policies
+        self._device_class_policies = device_class_policies
+        self._queue_put = queue_put
+        self._entities: dict[str, _EntityCompression] = {}
+
+    def _policy(self, entity_id: str, state: State) -> CompressionPolicy | None:
+        """Return the compression policy for a state."""
+        if (policy := self._entity_policies.get(entity_id)) is not None:
+            return policy
+        if (device_class := state.attributes.get(ATTR_DEVICE_CLASS)) is None:
+            return None
+        return self._device_class_policies.get(device_class)
+
+    @callback
+    def async_put(self, event: Event[Any]) -> None:
+        """Queue an event unless it is a state change that is held back."""
+        if event.event_type != EVENT_STATE_CHANGED:
+            self._queue_put(event)
+            return
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        compression = self._entities.get(entity_id)
+        if (
+            new_state is None
+            or (policy := self._policy(entity_id, new_state)) is None
+            or (value := _numeric_value(new_state)) is None
+        ):
+            if compression is not None:
+                self._async_release(compression)
+                del self._entities[entity_id]
+            self._queue_put(event)
+            return
+        if compression is None or new_state.attributes != compression.state.attributes:
+            self._async_record(entity_id, compression, event, new_state, value)
+            return
+
+        elapsed = new_state.last_updated_timestamp - (
+            compression.state.last_updated_timestamp
+        )
+        if (
+            policy.max_interval is not None
+            and elapsed >= policy.max_interval.total_seconds()
+        ):
+            self._async_record(entity_id, compression, event, new_state, value)
+            return
+
+        deadband = max(
+            policy.absolute_deadband,
+            abs(compression.value) * policy.relative_deadband / 100,
+        )
+        in_deadband = abs(value - compression.value) <= deadband
+        if (deviation := policy.swinging_door) is None or elapsed <= 0:
+            # Without a time since the last recorded state there is no slope
+            # to hold a state back on
+            if not in_deadband:
+                self._async_record(entity_id, compression, event, new_state, value)
+                return
+            compression.held = event
+            return
+
+        if not in_deadband and not (
+            compression.lower_slope
+            <= (value - compression.value) / elapsed
+            <= compression.upper_slope
+        ):
+            # The line to this state is not within the deviation of all
+            # states since the last recorded state, record the state before
+            # it and restart the door from there
+            if (held := compression.held) is None:
+                self._async_record(entity_id, compression, event, new_state, value)
+                return
+            held_state = held.data["new_state"]
+            assert held_state is not None
+            self._async_release(compression)
+            compression.state = held_state
+            compression.value = float(held_state.state)
+            compression.upper_slope = math.inf
+            compression.lower_slope = -math.inf
+            if (
+                elapsed := new_state.last_updated_timestamp
+                - held_state.last_updated_timestamp
+            ) <= 0:
+                self._async_record(entity_id, compression, event, new_state, value)
+                return
+
+        # Every state held back narrows the door, also the ones within the
+        # deadband
+        compression.upper_slope = min(
+            compression.upper_slope,
+            (value + deviation - compression.value) / elapsed,
+        )
+        compression.lower_slope = max(
+            compression.lower_slope,
+            (value - deviation - compression.value) / elapsed,
+        )
+        compression.held = event
+
+    @callback
+    def _async_record(
+        self,
+        entity_id: str,
+        compression: _EntityCompression | None,
+        event: Event[EventStateChangedData],
+        new_state: State,
+        value: float,
+    ) -> None:
+        """Queue a state change and the state held back before it."""
+        if compression is not None:
+            self._async_release(compression)
+        self._queue_put(event)
+        self._entities[entity_id] = _EntityCompression(new_state, value)
+
+    @callback
+    def _async_release(self, compression: _EntityCompression) -> None:
+        """Queue the state change held back for an entity."""
+        if (held := compression.held) is None:
+            return
+        compression.held = None
+        if held.data["old_state"] is not compression.state:
+            # The old state links the recorded state to the one recorded
+            # before it, not to a state that was not recorded
+            held = Event(
+                EVENT_STATE_CHANGED,
+                {**held.data, "old_state": compression.state},
+                held.origin,
+                held.time_fired_timestamp,
+                held.context,
+            )
+        self._queue_put(held)
+
+    @callback
+    def async_flush(self) -> None:
+        """Queue all state changes that are held back."""
+        for compression in self._entities.values():
+            self._async_release(compression)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
@@ -64,6 +64,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUP_SCHEMA_VERSION = 45
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -84,3 +85,11 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class DBJobPriority(IntEnum):
+    """Priority of database executor jobs, lower values run first."""
+
+    INTERACTIVE = 0
+    INTEGRATION = 1
+    BACKGROUND = 2
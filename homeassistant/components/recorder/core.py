@@ -26,6 +26,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
@@ -50,6 +51,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .compression import CompressionPolicy, StateCompressor
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -66,6 +68,7 @@ from .const import (
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATISTICS_ROWS_SCHEMA_VERSION,
+    DBJobPriority,
     SupportedDialect,
 )
 from .db_schema import (
@@ -83,13 +86,19 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import (
+    DBInterruptibleThreadPoolExecutor,
+    DBJobScheduler,
+    track_db_job_connection,
+    untrack_db_job_connection,
+)
 from .migration import (
     BaseRunTimeMigration,
     EntityIDMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
@@ -116,6 +125,8 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    StatisticsRollupMigrationTask,
+    StatisticsRollupRebuildTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -125,6 +136,7 @@ from .tasks import (
 )
 from .util import (
     async_create_backup_failure_issue,
+    backup_sqlite_database,
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
@@ -162,6 +174,11 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+# Keep a worker free for interactive jobs and run one background job at a time
+MAX_DB_EXECUTOR_WORKERS_PER_PRIORITY = {
+    DBJobPriority.INTEGRATION: MAX_DB_EXECUTOR_WORKERS - 1,
+    DBJobPriority.BACKGROUND: 1,
+}
 
 
 class Recorder(threading.Thread):
@@ -181,6 +198,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        entity_compression: dict[str, CompressionPolicy] | None = None,
+        device_class_compression: dict[str, CompressionPolicy] | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -216,6 +235,13 @@ class Recorder(threading.Thread):
         # by is_entity_recorder and the sensor recorder.
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
+        self._compressor: StateCompressor | None = None
+        if entity_compression or device_class_compression:
+            self._compressor = StateCompressor(
+                entity_compression or {},
+                device_class_compression or {},
+                self._queue.put_nowait,
+            )
 
         self.schema_version = 0
         self._commits_without_expire = 0
@@ -236,8 +262,11 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_active = False
+        self._statistics_rollups_time_zone = hass.config.time_zone
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.db_job_scheduler: DBJobScheduler | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -300,6 +329,12 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self.db_job_scheduler = DBJobScheduler(
+            self.hass.loop,
+            self._db_executor,
+            MAX_DB_EXECUTOR_WORKERS,
+            MAX_DB_EXECUTOR_WORKERS_PER_PRIORITY,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -311,7 +346,9 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put: Callable[[Event[Any]], None] = self._queue.put_nowait
+        if self._compressor is not None:
+            queue_put = self._compressor.async_put
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -370,15 +407,28 @@ class Recorder(threading.Thread):
 
     @callback
     def async_add_executor_job[_T](
-        self, target: Callable[..., _T], *args: Any
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+        priority: DBJobPriority = DBJobPriority.INTEGRATION,
     ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event loop."""
-        return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        """Add an executor job from within the event loop.
+
+        Jobs wait for a free database worker in order of their priority.
+        Cancelling the returned future interrupts the query of the job.
+        """
+        if self.db_job_scheduler is None:
+            return self.hass.loop.run_in_executor(self._db_executor, target, *args)
+        return self.db_job_scheduler.async_add_job(priority, target, *args)
 
     def _stop_executor(self) -> None:
         """Stop the executor."""
         if self._db_executor is None:
             return
+        if self.db_job_scheduler is not None:
+            # Fail the jobs which will never start
+            self.hass.add_job(self.db_job_scheduler.async_shutdown)
+            self.db_job_scheduler = None
         self._db_executor.shutdown()
         self._db_executor = None
 
@@ -475,6 +525,8 @@ class Recorder(threading.Thread):
         """Shut down the Recorder at final write."""
         if not self._hass_started.done():
             self._hass_started.set_result(SHUTDOWN_TASK)
+        if self._compressor is not None:
+            self._compressor.async_flush()
         self.queue_task(StopTask())
         self._async_stop_listeners()
         await self.hass.async_add_executor_job(self.join)
@@ -490,8 +542,20 @@ class Recorder(threading.Thread):
         bus = self.hass.bus
         bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close)
         bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_shutdown)
+        bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated)
         async_at_started(self.hass, self._async_hass_started)
 
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Rebuild daily and monthly statistics if the time zone changed."""
+        if self.hass.config.time_zone == self._statistics_rollups_time_zone:
+            return
+        self._statistics_rollups_time_zone = self.hass.config.time_zone
+        # Stop using the daily and monthly statistics right away,
+        # they are aligned with the old time zone
+        self.statistics_rollups_active = False
+        self.queue_task(StatisticsRollupRebuildTask())
+
     @callback
     def _async_startup_failed(self) -> None:
         """Report startup failure."""
@@ -838,6 +902,18 @@ class Recorder(threading.Thread):
                     ):
                         self.queue_task(EntityIDPostMigrationTask())
 
+            migrator = StatisticsRollupMigration(
+                session, schema_version, migration_changes
+            )
+            if migrator.needs_migrate():
+                self.queue_task(migrator.task())
+            elif not statistics.rollup_statistics_match_time_zone(session):
+                _LOGGER.debug("Rebuilding daily and monthly statistics for time zone")
+                self.queue_task(StatisticsRollupRebuildTask())
+            else:
+                _LOGGER.debug("Activating daily and monthly statistics")
+                self.statistics_rollups_active = True
+
             if self.schema_version > LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION:
                 with contextlib.suppress(SQLAlchemyError):
                     # If the index of event_ids on the states table is still present
@@ -1315,6 +1391,10 @@ class Recorder(threading.Thread):
         """Post migrate entity_ids if needed."""
         return migration.post_migrate_entity_ids(self)
 
+    def _migrate_statistics_rollups(self, task: StatisticsRollupMigrationTask) -> bool:
+        """Compile daily and monthly statistics if needed."""
+        return migration.migrate_statistics_rollups(self, task)
+
     def _cleanup_legacy_states_event_ids(self) -> bool:
         """Cleanup legacy event_ids if needed."""
         return migration.cleanup_legacy_states_event_ids(self)
@@ -1375,6 +1455,26 @@ class Recorder(threading.Thread):
         self._database_lock_task = task
         return True
 
+    async def async_snapshot_database(self, destination: str) -> bool:
+        """Write a consistent copy of the database to destination.
+
+        Unlike lock_database, writes continue while the copy is made.
+        Returns false if the database is not a SQLite database file.
+        """
+        if (
+            self.dialect_name != SupportedDialect.SQLITE
+            or not self._using_file_sqlite
+            or ":memory:" in self.db_url
+        ):
+            return False
+
+        # Only what is committed is part of the copy
+        await self.async_block_till_done()
+        await self.hass.async_add_executor_job(
+            backup_sqlite_database, dburl_to_path(self.db_url), destination
+        )
+        return True
+
     @callback
     def unlock_database(self) -> bool:
         """Unlock database.
@@ -1458,6 +1558,10 @@ class Recorder(threading.Thread):
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
+        sqlalchemy_event.listen(
+            self.engine, "before_cursor_execute", track_db_job_connection
+        )
+        sqlalchemy_event.listen(self.engine, "checkin", untrack_db_job_connection)
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Executor
 from concurrent.futures.thread import _threads_queues, _worker
+from dataclasses import dataclass, field
+from functools import partial
 import threading
+import time
 from typing import Any
 import weakref
 
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from sqlalchemy.engine import Connection
+
+from homeassistant.core import callback
+from homeassistant.util.executor import (
+    ExecutorJobHistogram,
+    InterruptibleThreadPoolExecutor,
+)
+
+from .const import DBJobPriority
+
+_current_job = threading.local()
 
 
 def _worker_with_shutdown_hook(
@@ -71,3 +87,189 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+@dataclass(slots=True)
+class _DBJob:
+    """A job waiting for or running in the database executor."""
+
+    priority: DBJobPriority
+    target: Callable[..., Any]
+    args: tuple[Any, ...]
+    future: asyncio.Future[Any]
+    queued_at: float
+    started: bool = False
+    dbapi_connection: Any = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def track_db_job_connection(conn: Connection, *args: Any) -> None:
+    """Remember the connection the database job of this thread executes on.
+
+    Registered as a before_cursor_execute listener of the engine.
+    """
+    if (job := getattr(_current_job, "job", None)) is not None:
+        with job.lock:
+            job.dbapi_connection = conn.connection.dbapi_connection
+
+
+def untrack_db_job_connection(dbapi_connection: Any, *args: Any) -> None:
+    """Forget the connection of the database job of this thread.
+
+    Registered as a checkin listener of the engine, so a job that is cancelled
+    after returning its connection to the pool does not interrupt the query
+    another job runs on it.
+    """
+    if (job := getattr(_current_job, "job", None)) is not None:
+        with job.lock:
+            if job.dbapi_connection is dbapi_connection:
+                job.dbapi_connection = None
+
+
+def _interrupt_dbapi_connection(dbapi_connection: Any) -> None:
+    """Abort the query running on a connection from another thread."""
+    if (interrupt := getattr(dbapi_connection, "interrupt", None)) is not None:
+        # sqlite3
+        interrupt()
+    elif (cancel := getattr(dbapi_connection, "cancel", None)) is not None:
+        # psycopg2
+        cancel()
+
+
+class DBJobScheduler:
+    """Admit database executor jobs by priority.
+
+    Waiting jobs are started in priority order, with a limit of running jobs
+    per priority so slow jobs of a low priority can not occupy all workers.
+    Cancelling the future of a job removes it from the queue, or interrupts
+    its query if it is already running.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        executor: Executor,
+        max_running: int,
+        max_running_per_priority: dict[DBJobPriority, int],
+    ) -> None:
+        """Initialize the scheduler."""
+        self._loop = loop
+        self._executor = executor
+        self._max_running = max_running
+        self._max_running_per_priority = max_running_per_priority
+        self._queues: dict[DBJobPriority, deque[_DBJob]] = {
+            priority: deque() for priority in sorted(DBJobPriority)
+        }
+        self._running: dict[DBJobPriority, int] = dict.fromkeys(DBJobPriority, 0)
+        self._total_running = 0
+        self._shutdown = False
+        self.queue_wait: dict[DBJobPriority, ExecutorJobHistogram] = {
+            priority: ExecutorJobHistogram() for priority in DBJobPriority
+        }
+
+    @callback
+    def async_add_job[_T](
+        self, priority: DBJobPriority, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a job and start it when a worker is free for its priority."""
+        future: asyncio.Future[_T] = self._loop.create_future()
+        if self._shutdown:
+            future.set_exception(RuntimeError("The database executor is shut down"))
+            return future
+        job = _DBJob(priority, target, args, future, time.monotonic())
+        future.add_done_callback(partial(self._async_job_future_done, job))
+        self._queues[priority].append(job)
+        self._async_start_jobs()
+        return future
+
+    @callback
+    def _async_start_jobs(self) -> None:
+        """Start waiting jobs while workers are free."""
+        for priority, jobs in self._queues.items():
+            limit = self._max_running_per_priority.get(priority, self._max_running)
+            while (
+                jobs
+                and self._total_running < self._max_running
+                and self._running[priority] < limit
+            ):
+                self._async_start_job(jobs.popleft())
+
+    @callback
+    def _async_start_job(self, job: _DBJob) -> None:
+        """Start a job in the executor."""
+        job.started = True
+        self.queue_wait[job.priority].record(time.monotonic() - job.queued_at)
+        try:
+            run = self._loop.run_in_executor(self._executor, self._run_job, job)
+        except RuntimeError as err:
+            # The executor was shut down
+            job.future.set_exception(err)
+            return
+        self._running[job.priority] += 1
+        self._total_running += 1
+        run.add_done_callback(partial(self._async_job_finished, job))
+
+    @staticmethod
+    def _run_job(job: _DBJob) -> Any:
+        """Run a job in a worker thread."""
+        _current_job.job = job
+        try:
+            return job.target(*job.args)
+        finally:
+            _current_job.job = None
+            with job.lock:
+                job.dbapi_connection = None
+
+    @callback
+    def _async_job_finished(self, job: _DBJob, run: asyncio.Future[Any]) -> None:
+        """Pass on the result of a job and start the next ones."""
+        self._running[job.priority] -= 1
+        self._total_running -= 1
+        if job.future.done():
+            # The job was cancelled, its query may have been interrupted
+            if not run.cancelled():
+                run.exception()
+        elif run.cancelled():
+            job.future.cancel()
+        elif (exception := run.exception()) is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(run.result())
+        self._async_start_jobs()
+
+    @callback
+    def _async_job_future_done(self, job: _DBJob, future: asyncio.Future[Any]) -> None:
+        """Dequeue or interrupt a job that was cancelled."""
+        if not future.cancelled():
+            return
+        if not job.started:
+            self._queues[job.priority].remove(job)
+            return
+        with job.lock:
+            if job.dbapi_connection is not None:
+                _interrupt_dbapi_connection(job.dbapi_connection)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Fail the jobs which are still waiting, running jobs are not aborted."""
+        self._shutdown = True
+        for jobs in self._queues.values():
+            while jobs:
+                jobs.popleft().future.set_exception(
+                    RuntimeError("The database executor is shut down")
+                )
+
+    @callback
+    def async_stats(self) -> dict[DBJobPriority, dict[str, Any]]:
+        """Return the queued and running jobs and queue wait per priority."""
+        return {
+            priority: {
+                "max_running": self._max_running_per_priority.get(
+                    priority, self._max_running
+                ),
+                "queued": len(jobs),
+                "running": self._running[priority],
+                "queue_wait": self.queue_wait[priority].as_dict(),
+            }
+            for priority, jobs in self._queues.items()
+        }
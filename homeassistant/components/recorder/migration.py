@@ -53,6 +53,7 @@ from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUP_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -75,7 +76,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDay,
     StatisticsMeta,
+    StatisticsMonth,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -91,15 +94,17 @@ from .queries import (
     find_states_context_ids_to_migrate,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
+    get_statistics_start_ts_range,
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_to_rollup,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import compile_rollup_statistics, get_start_time
 from .tasks import (
     CommitTask,
     EntityIDMigrationTask,
@@ -108,6 +113,7 @@ from .tasks import (
     PostSchemaMigrationTask,
     RecorderTask,
     StatesContextIDMigrationTask,
+    StatisticsRollupMigrationTask,
     StatisticsTimestampMigrationCleanupTask,
 )
 from .util import (
@@ -124,6 +130,8 @@ if TYPE_CHECKING:
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 0
 _EMPTY_ENTITY_ID = "missing.entity_id"
 _EMPTY_EVENT_TYPE = "missing_event_type"
+# How much hourly statistics to compile daily and monthly statistics from per run
+STATISTICS_ROLLUP_BATCH = timedelta(days=31)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -1200,6 +1208,11 @@ def _apply_update(  # noqa: C901
             )
         # Finally restore dropped constraints
         _restore_foreign_key_constraints(session_maker, engine, dropped_constraints)
+    elif new_version == 45:
+        # The daily and monthly statistics are compiled from the hourly
+        # statistics by the StatisticsRollupMigrationTask after startup
+        cast(Table, StatisticsDay.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsMonth.__table__).create(engine, checkfirst=True)
 
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
@@ -1827,6 +1840,38 @@ def post_migrate_entity_ids(instance: Recorder) -> bool:
     return is_done
 
 
+@retryable_database_job("compile daily and monthly statistics")
+def migrate_statistics_rollups(
+    instance: Recorder, task: StatisticsRollupMigrationTask
+) -> bool:
+    """Compile daily and monthly statistics from the hourly statistics.
+
+    The hourly statistics are compiled in chunks of STATISTICS_ROLLUP_BATCH,
+    task.start_ts is moved forward after each chunk.
+    """
+    _LOGGER.debug("Compiling daily and monthly statistics from %s", task.start_ts)
+    with session_scope(session=instance.get_session()) as session:
+        first_start_ts, last_start_ts = session.execute(
+            get_statistics_start_ts_range()
+        ).one()
+        start_ts = task.start_ts if task.start_ts is not None else first_start_ts
+        if last_start_ts is not None and start_ts is not None:
+            end_ts = min(
+                start_ts + STATISTICS_ROLLUP_BATCH.total_seconds(),
+                last_start_ts + Statistics.duration.total_seconds(),
+            )
+            compile_rollup_statistics(session, start_ts, end_ts)
+            if end_ts <= last_start_ts:
+                # If there is more work to do return False
+                # so that we can be called again
+                task.start_ts = end_ts
+                return False
+        _mark_migration_done(session, StatisticsRollupMigration)
+
+    _LOGGER.debug("Compiling daily and monthly statistics done")
+    return True
+
+
 @retryable_database_job("cleanup_legacy_event_ids")
 def cleanup_legacy_states_event_ids(instance: Recorder) -> bool:
     """Remove old event_id index from states.
@@ -1998,6 +2043,18 @@ class EntityIDMigration(BaseRunTimeMigration):
         return has_entity_ids_to_migrate()
 
 
+class StatisticsRollupMigration(BaseRunTimeMigration):
+    """Migration to compile daily and monthly statistics from hourly statistics."""
+
+    required_schema_version = STATISTICS_ROLLUP_SCHEMA_VERSION
+    migration_id = "statistics_rollup"
+    task = StatisticsRollupMigrationTask
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are statistics to compile."""
+        return has_statistics_to_rollup()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
@@ -813,6 +813,18 @@ def find_states_context_ids_to_migrate(max_bind_vars: int) -> StatementLambdaEle
     )
 
 
+def has_statistics_to_rollup() -> StatementLambdaElement:
+    """Check if there are hourly statistics to compile daily and monthly statistics from."""
+    return lambda_stmt(lambda: select(Statistics.id).limit(1))
+
+
+def get_statistics_start_ts_range() -> StatementLambdaElement:
+    """Find the start of the oldest and the newest hourly statistics."""
+    return lambda_stmt(
+        lambda: select(func.min(Statistics.start_ts), func.max(Statistics.start_ts))
+    )
+
+
 def get_migration_changes() -> StatementLambdaElement:
     """Query the database for previous migration changes."""
     return lambda_stmt(
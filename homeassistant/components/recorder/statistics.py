@@ -13,7 +13,7 @@ from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, delete, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -59,6 +59,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -125,6 +128,28 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_ROLLUP_STATISTICS_SUMMARY_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+    func.count(Statistics.mean),
+)
+
+QUERY_ROLLUP_STATISTICS_SUMMARY_SUM = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: ConductivityConverter for unit in ConductivityConverter.VALID_UNITS},
@@ -388,12 +413,16 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session, start: datetime
+) -> dict[int, StatisticDataTimestamp]:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    Returns the compiled hourly statistics by metadata_id.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
@@ -443,6 +472,222 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         Statistics.from_stats_ts(metadata_id, summary_item)
         for metadata_id, summary_item in summary.items()
     )
+    return summary
+
+
+def _compile_rollup_statistics_summary_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_id: int | None
+) -> Select:
+    """Generate the summary mean statement for daily or monthly statistics."""
+    stmt = (
+        select(*QUERY_ROLLUP_STATISTICS_SUMMARY_MEAN)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_id is not None:
+        stmt = stmt.filter(Statistics.metadata_id == metadata_id)
+    return stmt.group_by(Statistics.metadata_id).order_by(Statistics.metadata_id)
+
+
+def _compile_rollup_statistics_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_id: int | None
+) -> Select:
+    """Generate the last sum statement for daily or monthly statistics."""
+    stmt = (
+        select(*QUERY_ROLLUP_STATISTICS_SUMMARY_SUM)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_id is not None:
+        stmt = stmt.filter(Statistics.metadata_id == metadata_id)
+    subquery = stmt.subquery()
+    return (
+        select(subquery).filter(subquery.c.rownum == 1).order_by(subquery.c.metadata_id)
+    )
+
+
+def _compile_rollup_statistics_for_period(
+    session: Session,
+    table: type[StatisticsDay | StatisticsMonth],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None,
+) -> None:
+    """Compile daily or monthly statistics for one period.
+
+    This will summarize hourly statistics the same way they are reduced when
+    queried:
+    - average, min max is computed by a database query
+    - last_reset, state and sum is taken from the last hourly entry during the period
+
+    Existing statistics for the period are replaced.
+    """
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int] = {}
+    for stat in session.execute(
+        _compile_rollup_statistics_summary_mean_stmt(
+            start_time_ts, end_time_ts, metadata_id
+        )
+    ):
+        stat_metadata_id, _mean, _min, _max, mean_counts[stat_metadata_id] = stat
+        summary[stat_metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    for stat in session.execute(
+        _compile_rollup_statistics_last_sum_stmt(
+            start_time_ts, end_time_ts, metadata_id
+        )
+    ):
+        stat_metadata_id, _, last_reset_ts, state, _sum, _ = stat
+        summary.setdefault(stat_metadata_id, {"start_ts": start_time_ts}).update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    delete_stmt = (
+        delete(table)
+        .filter(table.start_ts >= start_time_ts)
+        .filter(table.start_ts < end_time_ts)
+    )
+    if metadata_id is not None:
+        delete_stmt = delete_stmt.filter(table.metadata_id == metadata_id)
+    session.execute(delete_stmt)
+    for stat_metadata_id, summary_item in summary.items():
+        row = table.from_stats_ts(stat_metadata_id, summary_item)
+        row.mean_count = mean_counts.get(stat_metadata_id, 0)
+        session.add(row)
+
+
+def compile_rollup_statistics(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None = None,
+) -> None:
+    """Compile daily and monthly statistics from hourly statistics.
+
+    All days and months overlapping start_time_ts - end_time_ts are compiled,
+    optionally only for a single statistic.
+    """
+    # Make sure pending hourly statistics are included
+    session.flush()
+    for table, period_start_end in (
+        (StatisticsDay, reduce_day_ts_factory()[1]),
+        (StatisticsMonth, reduce_month_ts_factory()[1]),
+    ):
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        while True:
+            _compile_rollup_statistics_for_period(
+                session, table, period_start_ts, period_end_ts, metadata_id
+            )
+            if period_end_ts >= end_time_ts:
+                break
+            period_start_ts, period_end_ts = period_start_end(period_end_ts)
+
+
+def _merge_rollup_statistics_for_period(
+    session: Session,
+    table: type[StatisticsRollupBase],
+    period_start_ts: float,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Merge compiled hourly statistics into daily or monthly statistics."""
+    rows = {
+        row.metadata_id: row
+        for row in session.execute(
+            select(table).filter(table.start_ts == period_start_ts)
+        ).scalars()
+    }
+    for metadata_id, stat in summary.items():
+        mean = stat.get("mean")
+        if (row := rows.get(metadata_id)) is None:
+            row = table.from_stats_ts(
+                metadata_id, {**stat, "start_ts": period_start_ts}
+            )
+            row.mean_count = 0 if mean is None else 1
+            session.add(row)
+            continue
+        if mean is not None:
+            mean_count = row.mean_count or 0
+            if row.mean is not None:
+                mean = (row.mean * mean_count + mean) / (mean_count + 1)
+            row.mean = mean
+            row.mean_count = mean_count + 1
+        if (_min := stat.get("min")) is not None and (
+            row.min is None or _min < row.min
+        ):
+            row.min = _min
+        if (_max := stat.get("max")) is not None and (
+            row.max is None or _max > row.max
+        ):
+            row.max = _max
+        row.last_reset_ts = stat.get("last_reset_ts")
+        row.state = stat.get("state")
+        row.sum = stat.get("sum")
+
+
+def _merge_rollup_statistics(
+    session: Session,
+    start_time_ts: float,
+    summary: dict[int, StatisticDataTimestamp],
+) -> None:
+    """Merge compiled hourly statistics into the day and month they belong to.
+
+    The hour is the newest hour of the statistics, its last_reset, state and
+    sum replace those of the day and month. The mean is a running mean of the
+    hourly means.
+    """
+    if not summary:
+        return
+    _merge_rollup_statistics_for_period(
+        session, StatisticsDay, reduce_day_ts_factory()[1](start_time_ts)[0], summary
+    )
+    _merge_rollup_statistics_for_period(
+        session,
+        StatisticsMonth,
+        reduce_month_ts_factory()[1](start_time_ts)[0],
+        summary,
+    )
+
+
+@retryable_database_job("compile daily and monthly statistics")
+def compile_imported_rollup_statistics(
+    instance: Recorder, statistic_id: str, start_time_ts: float, end_time_ts: float
+) -> bool:
+    """Compile the daily and monthly statistics of imported hourly statistics."""
+    with session_scope(session=instance.get_session()) as session:
+        if metadata := instance.statistics_meta_manager.get(session, statistic_id):
+            compile_rollup_statistics(session, start_time_ts, end_time_ts, metadata[0])
+    return True
+
+
+def rollup_statistics_match_time_zone(session: Session) -> bool:
+    """Return if daily and monthly statistics are aligned with the time zone.
+
+    The newest daily and monthly statistics must start at local midnight.
+    """
+    for table, period_start_end in (
+        (StatisticsDay, reduce_day_ts_factory()[1]),
+        (StatisticsMonth, reduce_month_ts_factory()[1]),
+    ):
+        start_ts = session.execute(select(func.max(table.start_ts))).scalar()
+        if start_ts is not None and period_start_end(start_ts)[0] != start_ts:
+            return False
+    return True
+
+
+def delete_rollup_statistics(instance: Recorder) -> None:
+    """Delete all daily and monthly statistics."""
+    with session_scope(session=instance.get_session()) as session:
+        session.execute(delete(StatisticsDay))
+        session.execute(delete(StatisticsMonth))
 
 
 @retryable_database_job("compile missing statistics")
@@ -589,7 +834,11 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        hourly_summary = _compile_hourly_statistics(session, start)
+        # and merge it into the day and month it belongs to
+        _merge_rollup_statistics(
+            session, start.replace(minute=0).timestamp(), hourly_summary
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -1757,8 +2006,12 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    # Use the compiled daily and monthly statistics if they are up to date
+    rollup_table: type[StatisticsDay | StatisticsMonth] | None = None
+    if period in ("day", "month") and get_instance(hass).statistics_rollups_active:
+        rollup_table = StatisticsDay if period == "day" else StatisticsMonth
     stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+        start_time, end_time, metadata_ids, rollup_table or table, types
     )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
@@ -1773,18 +2026,27 @@ def _statistics_during_period_with_session(
         statistic_ids,
         metadata,
         True,
-        table,
+        rollup_table or table,
         units,
         types,
     )
 
-    if period == "day":
+    if rollup_table is not None:
+        # Days and months don't have a fixed duration
+        _, period_start_end = (
+            reduce_day_ts_factory() if period == "day" else reduce_month_ts_factory()
+        )
+        for rows in result.values():
+            for row in rows:
+                row["end"] = period_start_end(row["start"])[1]
+
+    elif period == "day":
         result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
+    elif period == "week":
         result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
+    elif period == "month":
         result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
@@ -2491,6 +2753,29 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The sum of a day or month is the sum of its last hour, adjust all
+        # periods after the adjusted hour and recompile the period it is in
+        start_time_ts = start_time.replace(minute=0).timestamp()
+        for table, period_start_end in (
+            (StatisticsDay, reduce_day_ts_factory()[1]),
+            (StatisticsMonth, reduce_month_ts_factory()[1]),
+        ):
+            period_start_ts, period_end_ts = period_start_end(start_time_ts)
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                dt_util.utc_from_timestamp(period_end_ts),
+                sum_adjustment,
+            )
+            _compile_rollup_statistics_for_period(
+                session,
+                table,
+                period_start_ts,
+                period_end_ts,
+                metadata[statistic_id][0],
+            )
+
     return True
 
 
@@ -2551,6 +2836,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDay,
+            StatisticsMonth,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
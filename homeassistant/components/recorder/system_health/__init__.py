@@ -9,8 +9,9 @@ from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 
 from .. import get_instance
-from ..const import SupportedDialect
+from ..const import DBJobPriority, SupportedDialect
 from ..core import Recorder
+from ..executor import DBJobScheduler
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -66,10 +67,23 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
 
     if instance.async_db_ready.done():
         db_stats = await instance.async_add_executor_job(
-            _get_db_stats, instance, database_name
+            _get_db_stats, instance, database_name, priority=DBJobPriority.INTERACTIVE
         )
         db_runs = {
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
+        if scheduler := instance.db_job_scheduler:
+            db_stats["database_jobs"] = _database_jobs_summary(scheduler)
     return db_runs | db_stats | db_engine_info
+
+
+def _database_jobs_summary(scheduler: DBJobScheduler) -> str:
+    """Summarize the database jobs and how long they waited per priority."""
+    return "; ".join(
+        f"{priority.name.lower()}: {stats['running']}/{stats['max_running']} busy,"
+        f" {stats['queued']} queued,"
+        f" {stats['queue_wait']['mean']:.3f}s mean wait,"
+        f" {stats['queue_wait']['max']:.3f}s max wait"
+        for priority, stats in scheduler.async_stats().items()
+    )
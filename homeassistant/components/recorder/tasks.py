@@ -11,6 +11,8 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy.exc import SQLAlchemyError
+
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
@@ -191,14 +193,56 @@ class ImportStatisticsTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Run statistics task."""
-        if statistics.import_statistics(
+        if not statistics.import_statistics(
             instance, self.metadata, self.statistics, self.table
         ):
+            # Schedule a new statistics task if this one didn't finish
+            instance.queue_task(
+                ImportStatisticsTask(self.metadata, self.statistics, self.table)
+            )
             return
-        # Schedule a new statistics task if this one didn't finish
-        instance.queue_task(
-            ImportStatisticsTask(self.metadata, self.statistics, self.table)
-        )
+        if self.table is Statistics and (
+            starts := [stat["start"] for stat in self.statistics]
+        ):
+            # Update the days and months covered by the imported statistics
+            # after they are committed, a failure doesn't roll them back
+            StatisticsRollupTask(
+                self.metadata["statistic_id"],
+                min(starts).timestamp(),
+                (max(starts) + Statistics.duration).timestamp(),
+            ).run(instance)
+
+
+@dataclass(slots=True)
+class StatisticsRollupTask(RecorderTask):
+    """An object to insert into the recorder queue to compile daily and monthly statistics.
+
+    The days and months overlapping start_ts - end_ts of a single statistic
+    are compiled from its hourly statistics.
+    """
+
+    statistic_id: str
+    start_ts: float
+    end_ts: float
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup task."""
+        try:
+            done = statistics.compile_imported_rollup_statistics(
+                instance, self.statistic_id, self.start_ts, self.end_ts
+            )
+        except SQLAlchemyError:
+            _LOGGER.exception(
+                "Error compiling daily and monthly statistics for %s, rebuilding them",
+                self.statistic_id,
+            )
+            instance.queue_task(StatisticsRollupRebuildTask())
+            return
+        if not done:
+            # Schedule a new rollup task if this one didn't finish
+            instance.queue_task(
+                StatisticsRollupTask(self.statistic_id, self.start_ts, self.end_ts)
+            )
 
 
 @dataclass(slots=True)
@@ -427,6 +471,42 @@ class EntityIDMigrationTask(RecorderTask):
             instance.queue_task(EntityIDPostMigrationTask())
 
 
+@dataclass(slots=True)
+class StatisticsRollupMigrationTask(RecorderTask):
+    """An object to insert into the recorder queue to compile daily and monthly statistics.
+
+    The hourly statistics are processed in chunks, start_ts keeps track of
+    where the next chunk starts.
+    """
+
+    start_ts: float | None = None
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup migration task."""
+        if not instance._migrate_statistics_rollups(self):  # noqa: SLF001
+            # Schedule a new migration task if this one didn't finish
+            instance.queue_task(StatisticsRollupMigrationTask(self.start_ts))
+        else:
+            # All daily and monthly statistics are compiled, from now on
+            # they are kept up to date when hourly statistics are compiled
+            instance.statistics_rollups_active = True
+
+
+@dataclass(slots=True)
+class StatisticsRollupRebuildTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild daily and monthly statistics.
+
+    Days and months are aligned with the time zone, so they are compiled again
+    when the time zone is changed.
+    """
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollup rebuild task."""
+        instance.statistics_rollups_active = False
+        statistics.delete_rollup_statistics(instance)
+        instance.queue_task(StatisticsRollupMigrationTask())
+
+
 @dataclass(slots=True)
 class EntityIDPostMigrationTask(RecorderTask):
     """An object to insert into the recorder queue to cleanup after entity_ids migration."""
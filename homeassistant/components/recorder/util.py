@@ -259,6 +259,21 @@ def dburl_to_path(dburl: str) -> str:
     return dburl.removeprefix(SQLITE_URL_PREFIX)
 
 
+def backup_sqlite_database(dbpath: str, destination: str) -> None:
+    """Copy an sqlite database with the online backup API.
+
+    The copy is made in a single read transaction, the recorder can keep
+    writing to the database in WAL mode while it runs.
+    """
+    import sqlite3  # pylint: disable=import-outside-toplevel
+
+    with (
+        contextlib.closing(sqlite3.connect(dbpath)) as source,
+        contextlib.closing(sqlite3.connect(destination)) as target,
+    ):
+        source.backup(target)
+
+
 def last_run_was_recently_clean(cursor: SQLiteCursor) -> bool:
     """Verify the last recorder run was recently clean."""
 
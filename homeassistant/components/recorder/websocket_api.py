@@ -32,6 +32,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import DBJobPriority
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -137,6 +138,7 @@ async def ws_get_statistic_during_period(
             msg["statistic_id"],
             msg.get("types"),
             msg.get("units"),
+            priority=DBJobPriority.INTERACTIVE,
         )
     )
 
@@ -206,6 +208,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            priority=DBJobPriority.INTERACTIVE,
         )
     )
 
@@ -256,6 +259,7 @@ async def ws_handle_list_statistic_ids(
             hass,
             msg["id"],
             msg.get("statistic_type"),
+            priority=DBJobPriority.INTERACTIVE,
         )
     )
 
@@ -288,6 +292,7 @@ async def ws_validate_statistics(
     statistic_ids = await instance.async_add_executor_job(
         validate_statistics,
         hass,
+        priority=DBJobPriority.INTERACTIVE,
     )
     connection.send_result(msg["id"], statistic_ids)
 
@@ -406,7 +411,10 @@ async def ws_adjust_sum_statistics(
 
     instance = get_instance(hass)
     metadatas = await instance.async_add_executor_job(
-        list_statistic_ids, hass, {msg["statistic_id"]}
+        list_statistic_ids,
+        hass,
+        {msg["statistic_id"]},
+        priority=DBJobPriority.INTERACTIVE,
     )
     if not metadatas:
         connection.send_error(msg["id"], "unknown_statistic_id", "Unknown statistic ID")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Collection
 from dataclasses import dataclass
 from functools import cached_property
 import logging
@@ -43,6 +44,10 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    ReferenceType,
+    async_get as async_get_reference_index,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -88,19 +93,15 @@ def is_on(hass, entity_id):
 
 
 def _scripts_with_x(
-    hass: HomeAssistant, referenced_id: str, property_name: str
+    hass: HomeAssistant, referenced_id: str, reference_type: ReferenceType
 ) -> list[str]:
     """Return all scripts that reference the x."""
     if DOMAIN not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_referenced_by(
+        reference_type, referenced_id
+    )
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -119,7 +120,7 @@ def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> lis
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scripts that reference the entity."""
-    return _scripts_with_x(hass, entity_id, "referenced_entities")
+    return _scripts_with_x(hass, entity_id, ReferenceType.ENTITY)
 
 
 @callback
@@ -131,7 +132,7 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> list[str]:
     """Return all scripts that reference the device."""
-    return _scripts_with_x(hass, device_id, "referenced_devices")
+    return _scripts_with_x(hass, device_id, ReferenceType.DEVICE)
 
 
 @callback
@@ -143,7 +144,7 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_area(hass: HomeAssistant, area_id: str) -> list[str]:
     """Return all scripts that reference the area."""
-    return _scripts_with_x(hass, area_id, "referenced_areas")
+    return _scripts_with_x(hass, area_id, ReferenceType.AREA)
 
 
 @callback
@@ -155,7 +156,7 @@ def areas_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_floor(hass: HomeAssistant, floor_id: str) -> list[str]:
     """Return all scripts that reference the floor."""
-    return _scripts_with_x(hass, floor_id, "referenced_floors")
+    return _scripts_with_x(hass, floor_id, ReferenceType.FLOOR)
 
 
 @callback
@@ -167,7 +168,7 @@ def floors_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_label(hass: HomeAssistant, label_id: str) -> list[str]:
     """Return all scripts that reference the label."""
-    return _scripts_with_x(hass, label_id, "referenced_labels")
+    return _scripts_with_x(hass, label_id, ReferenceType.LABEL)
 
 
 @callback
@@ -179,16 +180,7 @@ def labels_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, ReferenceType.BLUEPRINT)
 
 
 @callback
@@ -442,6 +434,28 @@ class BaseScriptEntity(ToggleEntity, ABC):
     def referenced_entities(self) -> set[str]:
         """Return a set of referenced entities."""
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the script to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.async_on_remove(
+            async_get_reference_index(self.hass, DOMAIN).async_add(
+                self.entity_id, self._async_references
+            )
+        )
+
+    @callback
+    def _async_references(self) -> dict[ReferenceType, Collection[str]]:
+        """Return the items referenced by the script."""
+        blueprint = self.referenced_blueprint
+        return {
+            ReferenceType.AREA: self.referenced_areas,
+            ReferenceType.BLUEPRINT: () if blueprint is None else (blueprint,),
+            ReferenceType.DEVICE: self.referenced_devices,
+            ReferenceType.ENTITY: self.referenced_entities,
+            ReferenceType.FLOOR: self.referenced_floors,
+            ReferenceType.LABEL: self.referenced_labels,
+        }
+
 
 class UnavailableScriptEntity(BaseScriptEntity):
     """A non-functional script entity with its state set to unavailable.
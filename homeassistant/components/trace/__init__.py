@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
 import logging
 from typing import Any
@@ -21,9 +22,11 @@ from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_BUDGET,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
     DEFAULT_STORED_TRACES,
+    TRACE_MEMORY_BUDGET,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -43,14 +46,88 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
 
+class TraceMemoryBudget:
+    """Track the memory used by finished traces of all scripts and automations.
+
+    Finished traces are kept as is until the traces use more than the budget.
+    The traces which finished first are then serialized and if that's not
+    enough, the least recently used traces are evicted.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the budget."""
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._sizes: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._not_frozen: dict[tuple[str, str], None] = {}
+
+    @property
+    def exceeded(self) -> bool:
+        """Return True if the traces use more than the budget."""
+        return self.total_bytes > self.max_bytes
+
+    def add(
+        self, key: str, run_id: str, size: int, frozen: bool, recent: bool = True
+    ) -> None:
+        """Add a trace."""
+        self.discard(key, run_id)
+        self._sizes[(key, run_id)] = size
+        if not recent:
+            self._sizes.move_to_end((key, run_id), last=False)
+        if not frozen:
+            self._not_frozen[(key, run_id)] = None
+        self.total_bytes += size
+
+    def pop_not_frozen(self) -> tuple[str, str] | None:
+        """Return the trace which finished first of those not serialized."""
+        if not self._not_frozen:
+            return None
+        trace_id = next(iter(self._not_frozen))
+        del self._not_frozen[trace_id]
+        return trace_id
+
+    def resize(self, key: str, run_id: str, size: int) -> None:
+        """Update the size of a trace."""
+        if (old_size := self._sizes.get((key, run_id))) is not None:
+            self._sizes[(key, run_id)] = size
+            self.total_bytes += size - old_size
+
+    def evict(self) -> list[tuple[str, str]]:
+        """Return the least recently used traces which exceed the budget."""
+        evicted: list[tuple[str, str]] = []
+        while self.exceeded and self._sizes:
+            trace_id, evicted_size = self._sizes.popitem(last=False)
+            self._not_frozen.pop(trace_id, None)
+            self.total_bytes -= evicted_size
+            evicted.append(trace_id)
+        return evicted
+
+    def touch(self, key: str, run_id: str) -> None:
+        """Mark a trace as recently used."""
+        if (key, run_id) in self._sizes:
+            self._sizes.move_to_end((key, run_id))
+
+    def discard(self, key: str, run_id: str) -> None:
+        """Remove a trace."""
+        self._not_frozen.pop((key, run_id), None)
+        if (size := self._sizes.pop((key, run_id), None)) is not None:
+            self.total_bytes -= size
+
+
 @callback
 def _get_data(hass: HomeAssistant) -> TraceData:
     return hass.data[DATA_TRACE]  # type: ignore[no-any-return]
 
 
+@callback
+def _get_budget(hass: HomeAssistant) -> TraceMemoryBudget:
+    return hass.data[DATA_TRACE_BUDGET]  # type: ignore[no-any-return]
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_BUDGET] = TraceMemoryBudget(TRACE_MEMORY_BUDGET)
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -80,7 +157,9 @@ async def async_get_trace(
     # Restore saved traces if not done
     await async_restore_traces(hass)
 
-    return _get_data(hass)[key][run_id].as_extended_dict()
+    requested_trace = _get_data(hass)[key][run_id]
+    _get_budget(hass).touch(key, run_id)
+    return requested_trace.as_extended_dict()
 
 
 async def async_list_contexts(
@@ -145,7 +224,54 @@ def async_store_trace(
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        traces_for_key = traces[key]
+        budget = _get_budget(hass)
+        # Evict the oldest traces here to keep the memory budget in sync
+        while traces_for_key and len(traces_for_key) >= stored_traces:
+            run_id, _ = traces_for_key.popitem(last=False)
+            budget.discard(key, run_id)
+        traces_for_key[trace.run_id] = trace
+
+
+@callback
+def async_finish_trace(hass: HomeAssistant, trace: ActionTrace) -> None:
+    """Mark a trace as finished and account for it in the memory budget."""
+    trace.finished()
+    if (traces_for_key := _get_data(hass).get(trace.key)) is None or traces_for_key.get(
+        trace.run_id
+    ) is not trace:
+        # The trace has already been evicted
+        return
+    budget = _get_budget(hass)
+    budget.add(trace.key, trace.run_id, trace.size, trace.frozen)
+    _async_enforce_budget(hass)
+
+
+@callback
+def _async_enforce_budget(hass: HomeAssistant) -> None:
+    """Serialize and then evict traces until they fit in the memory budget."""
+    budget = _get_budget(hass)
+    traces = _get_data(hass)
+    while budget.exceeded and (trace_id := budget.pop_not_frozen()) is not None:
+        key, run_id = trace_id
+        if (traces_for_key := traces.get(key)) is None:
+            continue
+        trace = traces_for_key.get(run_id)
+        if isinstance(trace, ActionTrace) and trace.compact():
+            budget.resize(key, run_id, trace.size)
+    _async_evict_traces(hass, budget.evict())
+
+
+@callback
+def _async_evict_traces(hass: HomeAssistant, evicted: list[tuple[str, str]]) -> None:
+    """Remove traces evicted from the memory budget."""
+    traces = _get_data(hass)
+    for key, run_id in evicted:
+        if (traces_for_key := traces.get(key)) is None:
+            continue
+        traces_for_key.pop(run_id, None)
+        if not traces_for_key:
+            del traces[key]
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -156,6 +282,8 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    _get_budget(hass).add(key, trace.run_id, trace.size, trace.frozen, recent=False)
+    _async_enforce_budget(hass)
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
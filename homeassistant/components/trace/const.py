@@ -2,6 +2,10 @@
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_BUDGET = "trace_budget"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+TRACE_COMPRESS_MIN_BYTES = 1024  # Compress finished traces larger than this
+TRACE_ELEMENT_ESTIMATED_BYTES = 4096  # Charged per element of unserialized traces
+TRACE_MEMORY_BUDGET = 32 * 1024 * 1024  # Finished traces of all items, in bytes
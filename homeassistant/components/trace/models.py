@@ -6,8 +6,12 @@ import abc
 from collections import deque
 import datetime as dt
 from typing import Any
+import zlib
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder, json_bytes
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,8 +20,13 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 import homeassistant.util.uuid as uuid_util
 
+from .const import TRACE_COMPRESS_MIN_BYTES, TRACE_ELEMENT_ESTIMATED_BYTES
+
+_EXTENDED_JSON_DEFAULT = ExtendedJSONEncoder().default
+
 
 class BaseTrace(abc.ABC):
     """Base container for a script or automation trace."""
@@ -25,6 +34,33 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    _frozen: bytes | None = None
+    _frozen_compressed: bool = False
+
+    @property
+    def frozen(self) -> bool:
+        """Return True if the trace is kept serialized."""
+        return self._frozen is not None
+
+    @property
+    def size(self) -> int:
+        """Return the memory charged for the trace."""
+        return len(self._frozen) if self._frozen is not None else 0
+
+    def _freeze(self, data: bytes) -> None:
+        """Keep the extended dictionary as serialized bytes."""
+        if len(data) >= TRACE_COMPRESS_MIN_BYTES:
+            data = zlib.compress(data, 1)
+            self._frozen_compressed = True
+        self._frozen = data
+
+    def _thaw(self) -> dict[str, Any]:
+        """Decode the frozen extended dictionary."""
+        assert self._frozen is not None
+        data = self._frozen
+        if self._frozen_compressed:
+            data = zlib.decompress(data)
+        return json_loads(data)  # type: ignore[return-value]
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -86,8 +122,48 @@ class ActionTrace(BaseTrace):
         self._state = "stopped"
         self._script_execution = script_execution_get()
 
+    @property
+    def size(self) -> int:
+        """Return the memory charged for the trace.
+
+        The size of a trace which is not serialized is estimated from the
+        number of trace elements since they keep the changed variables alive.
+        """
+        if self._frozen is not None:
+            return len(self._frozen)
+        elements = (
+            sum(len(trace) for trace in self._trace.values()) if self._trace else 0
+        )
+        return (elements + 1) * TRACE_ELEMENT_ESTIMATED_BYTES
+
+    def compact(self) -> bool:
+        """Serialize the finished trace and drop the objects it references.
+
+        Trace elements keep the changed variables alive, including full state
+        objects, serialized bytes take a fraction of that memory. Returns False
+        if the trace can't be serialized.
+        """
+        try:
+            data = orjson.dumps(
+                self.as_extended_dict(),
+                option=orjson.OPT_NON_STR_KEYS,
+                default=_EXTENDED_JSON_DEFAULT,
+            )
+        except orjson.JSONEncodeError:
+            # Keep the trace as is, the error is reported when it's fetched
+            return False
+        self._freeze(data)
+        self._dict = None
+        self._trace = None
+        self._config = None
+        self._blueprint_inputs = None
+        self._error = None
+        return True
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
+        if self._frozen is not None:
+            return self._thaw()
         if self._dict:
             return self._dict
 
@@ -159,12 +235,12 @@ class RestoredTrace(BaseTrace):
         self.context = context
         self.key = f"{extended_dict['domain']}.{extended_dict['item_id']}"
         self.run_id = extended_dict["run_id"]
-        self._dict = extended_dict
+        self._freeze(json_bytes(extended_dict))
         self._short_dict = short_dict
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
-        return self._dict  # type: ignore[no-any-return]
+        return self._thaw()
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
@@ -46,6 +46,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -117,6 +118,13 @@ _RE_VOICE_FILE = re.compile(
 )
 KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
+CACHE_INDEX_STORAGE_KEY = "tts.cache_index"
+CACHE_INDEX_STORAGE_VERSION = 1
+CACHE_INDEX_SAVE_DELAY = 10
+# Least recently used files are removed when the cache is larger than this
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
 
@@ -535,39 +543,132 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
+        # Both caches are kept in least recently used order
         self.file_cache: dict[str, str] = {}
+        self._file_cache_sizes: dict[str, int] = {}
+        self._file_cache_bytes = 0
         self.mem_cache: dict[str, TTSCache] = {}
+        self._mem_cache_bytes = 0
+        self._index_store = Store[dict[str, Any]](
+            hass, CACHE_INDEX_STORAGE_VERSION, CACHE_INDEX_STORAGE_KEY
+        )
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+    def _init_cache(self, index: dict[str, Any] | None) -> list[list[Any]]:
+        """Init cache folder and fetch files.
+
+        The index is reconciled with the files in the cache dir. Files that
+        are missing are dropped, files that are not in the index are added
+        as least recently used.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        indexed: dict[str, list[Any]] = {}
+        if index is not None and index["cache_dir"] == self.cache_dir:
+            indexed = {entry[0]: entry for entry in index["files"]}
+
         try:
-            return _get_cache_files(self.cache_dir)
+            cache_files = _get_cache_files(self.cache_dir)
+            # Only the sizes of files that are not in the index are read
+            files = [
+                [
+                    cache_key,
+                    filename,
+                    os.path.getsize(os.path.join(self.cache_dir, filename)),
+                ]
+                for cache_key, filename in cache_files.items()
+                if (entry := indexed.get(cache_key)) is None or entry[1] != filename
+            ]
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
+        files.extend(
+            entry
+            for cache_key, entry in indexed.items()
+            if cache_files.get(cache_key) == entry[1]
+        )
+        return files
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._index_store.async_load()
+        files = await self.hass.async_add_executor_job(self._init_cache, index)
+        for cache_key, filename, size in files:
+            self.file_cache[cache_key] = filename
+            self._file_cache_sizes[cache_key] = size
+            self._file_cache_bytes += size
+        self._async_evict_file_cache()
+        if index is None or index["files"] != self._async_index_data()["files"]:
+            self._async_schedule_save_index()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
         self.mem_cache = {}
+        self._mem_cache_bytes = 0
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
-
-        await self.hass.async_add_executor_job(remove_files)
+        await self.hass.async_add_executor_job(
+            _remove_cache_files, self.cache_dir, list(self.file_cache.values())
+        )
         self.file_cache = {}
+        self._file_cache_sizes = {}
+        self._file_cache_bytes = 0
+        self._async_schedule_save_index()
+
+    @callback
+    def _async_index_data(self) -> dict[str, Any]:
+        """Return the data of the file cache index."""
+        return {
+            "cache_dir": self.cache_dir,
+            "files": [
+                [cache_key, filename, self._file_cache_sizes[cache_key]]
+                for cache_key, filename in self.file_cache.items()
+            ],
+        }
+
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the file cache index."""
+        self._index_store.async_delay_save(
+            self._async_index_data, CACHE_INDEX_SAVE_DELAY
+        )
+
+    @callback
+    def _async_add_to_file_cache(
+        self, cache_key: str, filename: str, size: int
+    ) -> None:
+        """Add a file to the file cache and remove least recently used files."""
+        self._async_remove_from_file_cache(cache_key)
+        self.file_cache[cache_key] = filename
+        self._file_cache_sizes[cache_key] = size
+        self._file_cache_bytes += size
+        self._async_evict_file_cache()
+        self._async_schedule_save_index()
+
+    @callback
+    def _async_evict_file_cache(self) -> None:
+        """Remove least recently used files when the file cache is too large."""
+        evicted: list[str] = []
+        while self._file_cache_bytes > CACHE_MAX_BYTES and len(self.file_cache) > 1:
+            evicted_key = next(iter(self.file_cache))
+            evicted.append(self.file_cache[evicted_key])
+            self._async_remove_from_file_cache(evicted_key)
+        if evicted:
+            self.hass.async_add_executor_job(
+                _remove_cache_files, self.cache_dir, evicted
+            )
+
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> None:
+        """Remove a file from the file cache without removing the file."""
+        if self.file_cache.pop(cache_key, None) is not None:
+            self._file_cache_bytes -= self._file_cache_sizes.pop(cache_key)
+
+    @callback
+    def _async_touch_file_cache(self, cache_key: str) -> None:
+        """Mark a file in the file cache as recently used."""
+        self.file_cache[cache_key] = self.file_cache.pop(cache_key)
+        self._async_schedule_save_index()
 
     @callback
     def async_register_legacy_engine(
@@ -645,9 +746,12 @@ class SpeechManager:
         if cache_key in self.mem_cache:
             filename = self.mem_cache[cache_key]["filename"]
         # Is file store in file cache
-        elif use_cache and cache_key in self.file_cache:
+        elif (
+            use_cache
+            and cache_key in self.file_cache
+            and await self._async_load_file_cache(cache_key)
+        ):
             filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -673,16 +777,17 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        if cache_key not in self.mem_cache and not (
+            use_cache
+            and cache_key in self.file_cache
+            and await self._async_load_file_cache(cache_key)
+        ):
+            await self._async_get_tts_audio(
+                engine_instance, cache_key, message, use_cache, language, options
+            )
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
+        cached = self._async_get_memcache(cache_key)
+        extension = os.path.splitext(cached["filename"])[1][1:]
         if pending := cached.get("pending"):
             await pending
             cached = self.mem_cache[cache_key]
@@ -811,7 +916,7 @@ class SpeechManager:
         def handle_error(_future: asyncio.Future) -> None:
             """Handle error."""
             if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+                self._async_remove_from_memcache(cache_key)
 
         audio_task.add_done_callback(handle_error)
 
@@ -839,9 +944,23 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+        else:
+            self._async_add_to_file_cache(cache_key, filename, len(data))
+
+    async def _async_load_file_cache(self, cache_key: str) -> bool:
+        """Load a voice from the file cache into memory.
+
+        Returns False if the file was removed from the cache dir, so the
+        speech is fetched from the engine again.
+        """
+        try:
+            await self._async_file_to_mem(cache_key)
+        except HomeAssistantError as err:
+            _LOGGER.debug("%s, fetching the speech again", err)
+            return False
+        return True
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
@@ -861,9 +980,11 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            self._async_remove_from_file_cache(cache_key)
+            self._async_schedule_save_index()
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
+        self._async_touch_file_cache(cache_key)
         self._async_store_to_memcache(cache_key, filename, data)
 
     @callback
@@ -871,16 +992,28 @@ class SpeechManager:
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
         }
+        self._mem_cache_bytes += len(data)
+
+        # Remove least recently used voices when over the memory budget
+        for evicted_key in list(self.mem_cache):
+            if (
+                self._mem_cache_bytes <= MEMORY_CACHE_MAX_BYTES
+                or evicted_key == cache_key
+            ):
+                break
+            if self.mem_cache[evicted_key]["pending"] is None:
+                self._async_remove_from_memcache(evicted_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
         async_call_later(
             self.hass,
@@ -892,26 +1025,43 @@ class SpeechManager:
             ),
         )
 
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove a voice from the memcache."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self._mem_cache_bytes -= len(cached["voice"])
+
+    @callback
+    def _async_get_memcache(self, cache_key: str) -> TTSCache:
+        """Return a voice from the memcache and mark it as recently used."""
+        cached = self.mem_cache[cache_key] = self.mem_cache.pop(cache_key)
+        return cached
+
+    @callback
+    def async_get_cache_file(self, filename: str) -> str | None:
+        """Return the path of a voice which is only cached on disk.
+
+        The file can be sent without loading it into memory first.
+        """
+        cache_key = _cache_key_from_filename(filename)
+        if cache_key in self.mem_cache or cache_key not in self.file_cache:
+            return None
+        self._async_touch_file_cache(cache_key)
+        return os.path.join(self.cache_dir, self.file_cache[cache_key])
+
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
         This method is a coroutine.
         """
-        if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
-            record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
-        ):
-            raise HomeAssistantError("Wrong tts file format!")
-
-        cache_key = KEY_PATTERN.format(
-            record.group(1), record.group(2), record.group(3), record.group(4)
-        )
+        cache_key = _cache_key_from_filename(filename)
 
         if cache_key not in self.mem_cache:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
             await self._async_file_to_mem(cache_key)
 
-        cached = self.mem_cache[cache_key]
+        cached = self._async_get_memcache(cache_key)
         if pending := cached.get("pending"):
             await pending
             cached = self.mem_cache[cache_key]
@@ -982,6 +1132,27 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _cache_key_from_filename(filename: str) -> str:
+    """Return the cache key of a voice file."""
+    if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
+        record := _RE_LEGACY_VOICE_FILE.match(filename.lower())
+    ):
+        raise HomeAssistantError("Wrong tts file format!")
+
+    return KEY_PATTERN.format(
+        record.group(1), record.group(2), record.group(3), record.group(4)
+    )
+
+
+def _remove_cache_files(cache_dir: str, filenames: list[str]) -> None:
+    """Remove files from the cache dir."""
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+        except OSError as err:
+            _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1055,9 +1226,12 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            if (cache_file := self.tts.async_get_cache_file(filename)) is not None:
+                # Stream voices from disk instead of reading them into memory
+                return web.FileResponse(cache_file)
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
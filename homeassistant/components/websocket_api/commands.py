@@ -307,17 +307,23 @@ async def handle_call_service(
 
 @callback
 def _async_get_allowed_states(
-    hass: HomeAssistant, connection: ActiveConnection
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    entity_ids: set[str] | None = None,
 ) -> list[State]:
+    if entity_ids is None:
+        states = hass.states.async_all()
+    else:
+        states = [
+            state
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id)) is not None
+        ]
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return states
     entity_perm = connection.user.permissions.check_entity
-    return [
-        state
-        for state in hass.states.async_all()
-        if entity_perm(state.entity_id, POLICY_READ)
-    ]
+    return [state for state in states if entity_perm(state.entity_id, POLICY_READ)]
 
 
 @callback
@@ -392,17 +398,30 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("since"): int,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    With since, the init event also contains the current version of the state
+    machine. A client which resubscribes can pass the version it got before to
+    only receive the states which changed since then.
+    """
     entity_ids = set(msg.get("entity_ids", []))
+    changed: set[str] | None = None
+    if (since := msg.get("since")) is not None:
+        changed = hass.states.async_changed_since(since)
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
+    states = _async_get_allowed_states(hass, connection, changed)
+    if since is None:
+        delta = None
+    else:
+        delta = _async_get_entities_delta(hass, connection, entity_ids, changed)
     message_id_as_bytes = str(msg["id"]).encode()
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
@@ -428,7 +447,9 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(
+            connection, msg["id"], serialized_states, delta
+        )
         return
 
     serialized_states = []
@@ -443,11 +464,44 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(connection, msg["id"], serialized_states, delta)
+
+
+@callback
+def _async_get_entities_delta(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    entity_ids: set[str],
+    changed: set[str] | None,
+) -> bytes:
+    """Return the removed entities and version for a resubscription.
+
+    The result is added to the event of the init response.
+    """
+    removed: list[str] = []
+    if changed is not None:
+        user = connection.user
+        entity_perm = None
+        if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+            entity_perm = user.permissions.check_entity
+        removed = [
+            entity_id
+            for entity_id in changed
+            if hass.states.get(entity_id) is None
+            and (not entity_ids or entity_id in entity_ids)
+            and (entity_perm is None or entity_perm(entity_id, POLICY_READ))
+        ]
+    delta = json_bytes(
+        {"r": removed, "version": hass.states.version, "full": changed is None}
+    )
+    return b"," + delta[1:-1]
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+    connection: ActiveConnection,
+    msg_id: int,
+    serialized_states: list[bytes],
+    delta: bytes | None = None,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -457,7 +511,9 @@ def _send_handle_entities_init_response(
                 str(msg_id).encode(),
                 b',"type":"event","event":{"a":{',
                 b",".join(serialized_states),
-                b"}}}",
+                b"}",
+                delta or b"",
+                b"}}",
             )
         )
     )
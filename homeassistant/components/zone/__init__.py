@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+from collections import defaultdict
+from collections.abc import Callable
 import logging
+import math
 from operator import attrgetter
 import sys
 from typing import Any, Self, cast
@@ -106,7 +108,115 @@ STORAGE_VERSION = 1
 
 ENTITY_ID_SORTER = attrgetter("entity_id")
 
-ZONE_ENTITY_IDS = "zone_entity_ids"
+ZONE_INDEX = "zone_index"
+ZONES_BY_NAME = "zone_zones_by_name"
+
+# Size of the cells of the zone index in degrees
+ZONE_INDEX_CELL_SIZE = 0.05
+# Zones covering more cells are checked for every location
+ZONE_INDEX_MAX_CELLS = 64
+# A degree of latitude is at least 110.5 km, leave some margin
+METERS_PER_DEGREE = 110_000
+# Locations closer to the poles are checked against all zones
+ZONE_INDEX_MAX_LATITUDE = 85
+
+
+def _bounding_cells(
+    latitude: float, longitude: float, radius: float
+) -> list[tuple[int, int]] | None:
+    """Return the cells of the zone index the circle may overlap.
+
+    Returns None if the circle can't be indexed.
+    """
+    try:
+        lat_delta = max(radius, 0) / METERS_PER_DEGREE
+        min_lat = latitude - lat_delta
+        max_lat = latitude + lat_delta
+        if min_lat < -ZONE_INDEX_MAX_LATITUDE or max_lat > ZONE_INDEX_MAX_LATITUDE:
+            return None
+        lon_delta = lat_delta / math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+        min_lon = longitude - lon_delta
+        max_lon = longitude + lon_delta
+        if min_lon < -180 or max_lon > 180:
+            # Crossing the antimeridian
+            return None
+        lat_cells = range(
+            math.floor(min_lat / ZONE_INDEX_CELL_SIZE),
+            math.floor(max_lat / ZONE_INDEX_CELL_SIZE) + 1,
+        )
+        lon_cells = range(
+            math.floor(min_lon / ZONE_INDEX_CELL_SIZE),
+            math.floor(max_lon / ZONE_INDEX_CELL_SIZE) + 1,
+        )
+    except (TypeError, ValueError):
+        # Not a valid location
+        return None
+    if len(lat_cells) * len(lon_cells) > ZONE_INDEX_MAX_CELLS:
+        return None
+    return [(lat, lon) for lat in lat_cells for lon in lon_cells]
+
+
+class ZoneIndex:
+    """Grid index of the zones by the area they cover.
+
+    Each zone is added to all cells its bounding box overlaps, a location only
+    has to be checked against the zones in the cells around it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the zone index."""
+        self._cells: defaultdict[tuple[int, int], set[str]] = defaultdict(set)
+        self._unindexed: set[str] = set()
+        self._zones: dict[str, tuple[Any, Any, Any, list[tuple[int, int]]]] = {}
+
+    @callback
+    def async_update(self, entity_id: str, state: State | None) -> None:
+        """Update the cells of a zone from its state."""
+        geometry: tuple[Any, Any, Any] | None = None
+        if state is not None:
+            attrs = state.attributes
+            geometry = (
+                attrs.get(ATTR_LATITUDE),
+                attrs.get(ATTR_LONGITUDE),
+                attrs.get(ATTR_RADIUS),
+            )
+        if (zone := self._zones.get(entity_id)) is not None:
+            if zone[:3] == geometry:
+                return
+            self._async_remove(entity_id, zone[3])
+        if geometry is None:
+            return
+        cells = _bounding_cells(*geometry)
+        if cells is None:
+            self._unindexed.add(entity_id)
+            cells = []
+        for cell in cells:
+            self._cells[cell].add(entity_id)
+        self._zones[entity_id] = (*geometry, cells)
+
+    @callback
+    def _async_remove(self, entity_id: str, cells: list[tuple[int, int]]) -> None:
+        """Remove a zone from the index."""
+        del self._zones[entity_id]
+        self._unindexed.discard(entity_id)
+        for cell in cells:
+            zones = self._cells[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del self._cells[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> list[str]:
+        """Return the sorted entity IDs of the zones the location may be in."""
+        if (cells := _bounding_cells(latitude, longitude, radius)) is None:
+            return sorted(self._zones)
+        candidates = set(self._unindexed)
+        for cell in cells:
+            if zones := self._cells.get(cell):
+                candidates.update(zones)
+        return sorted(candidates)
 
 
 @bind_hass
@@ -117,14 +227,16 @@ def async_active_zone(
 
     This method must be run in the event loop.
     """
-    # Sort entity IDs so that we are deterministic if equal distance to 2 zones
     min_dist: float = sys.maxsize
     closest: State | None = None
 
     # This can be called before async_setup by device tracker
-    zone_entity_ids: Iterable[str] = hass.data.get(ZONE_ENTITY_IDS, ())
+    zone_index: ZoneIndex | None = hass.data.get(ZONE_INDEX)
+    if zone_index is None:
+        return None
 
-    for entity_id in zone_entity_ids:
+    # Sorted so that we are deterministic if equal distance to 2 zones
+    for entity_id in zone_index.async_candidates(latitude, longitude, radius):
         if (
             not (zone := hass.states.get(entity_id))
             # Skip unavailable zones
@@ -166,28 +278,52 @@ def async_active_zone(
 
 
 @callback
-def async_setup_track_zone_entity_ids(hass: HomeAssistant) -> None:
-    """Set up track of entity IDs for zones."""
-    zone_entity_ids: list[str] = hass.states.async_entity_ids(DOMAIN)
-    hass.data[ZONE_ENTITY_IDS] = zone_entity_ids
+def async_setup_zone_index(hass: HomeAssistant) -> None:
+    """Set up the index of zones by the area they cover."""
+    zone_index = ZoneIndex()
+    for state in hass.states.async_all(DOMAIN):
+        zone_index.async_update(state.entity_id, state)
+    hass.data[ZONE_INDEX] = zone_index
 
     @callback
-    def _async_add_zone_entity_id(
-        event_: Event[EventStateChangedData],
-    ) -> None:
-        """Add zone entity ID."""
-        zone_entity_ids.append(event_.data["entity_id"])
-        zone_entity_ids.sort()
+    def _async_zone_state_changed(event_: Event[EventStateChangedData]) -> None:
+        """Update the zone in the index."""
+        zone_index.async_update(event_.data["entity_id"], event_.data["new_state"])
 
-    @callback
-    def _async_remove_zone_entity_id(
-        event_: Event[EventStateChangedData],
-    ) -> None:
-        """Remove zone entity ID."""
-        zone_entity_ids.remove(event_.data["entity_id"])
+    event.async_track_state_change_filtered(
+        hass, event.TrackStates(False, set(), {DOMAIN}), _async_zone_state_changed
+    )
+
+
+@callback
+def async_setup_track_persons(hass: HomeAssistant) -> None:
+    """Set up tracking which persons are in which zone.
 
-    event.async_track_state_added_domain(hass, DOMAIN, _async_add_zone_entity_id)
-    event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone_entity_id)
+    Person states are the name of the zone they are in, so only the zones with
+    the name of the old and new state have to be updated. The home zone is
+    also registered as home.
+    """
+    zones_by_name: defaultdict[str, set[Zone]] = defaultdict(set)
+    hass.data[ZONES_BY_NAME] = zones_by_name
+
+    @callback
+    def _async_person_state_changed(event_: Event[EventStateChangedData]) -> None:
+        """Update the zones the person left or entered."""
+        zones: set[Zone] = set()
+        for state in (event_.data["old_state"], event_.data["new_state"]):
+            if state is None:
+                continue
+            if named_zones := zones_by_name.get(state.state.casefold()):
+                zones.update(named_zones)
+        for zone in zones:
+            zone.async_person_state_changed(event_)
+
+    person_domain = "person"  # avoid circular import
+    event.async_track_state_change_filtered(
+        hass,
+        event.TrackStates(False, set(), {person_domain}),
+        _async_person_state_changed,
+    )
 
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
@@ -233,7 +369,8 @@ class ZoneStorageCollection(collection.DictStorageCollection):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up configured zones as well as Home Assistant zone if necessary."""
-    async_setup_track_zone_entity_ids(hass)
+    async_setup_zone_index(hass)
+    async_setup_track_persons(hass)
 
     component = entity_component.EntityComponent[Zone](_LOGGER, DOMAIN, hass)
     id_manager = collection.IDManager()
@@ -384,12 +521,18 @@ class Zone(collection.CollectionEntity):
         if self._config == config:
             return
         self._config = config
+        case_folded_name = self._case_folded_name
         self._set_attrs_from_config()
+        if self._case_folded_name != case_folded_name:
+            self._async_unregister_name(case_folded_name)
+            self._async_register_name()
+            self._persons_in_zone = self._async_persons_in_zone()
         self._generate_attrs()
         self.async_write_ha_state()
 
     @callback
-    def _person_state_change_listener(self, evt: Event[EventStateChangedData]) -> None:
+    def async_person_state_changed(self, evt: Event[EventStateChangedData]) -> None:
+        """Update the persons in the zone when a person changed zone."""
         person_entity_id = evt.data["entity_id"]
         persons_in_zone = self._persons_in_zone
         cur_count = len(persons_in_zone)
@@ -405,21 +548,42 @@ class Zone(collection.CollectionEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
+        self._persons_in_zone = self._async_persons_in_zone()
+        self._generate_attrs()
+        self._async_register_name()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._async_unregister_name(self._case_folded_name)
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_persons_in_zone(self) -> set[str]:
+        """Return the persons currently in the zone."""
         person_domain = "person"  # avoid circular import
-        self._persons_in_zone = {
+        return {
             state.entity_id
             for state in self.hass.states.async_all(person_domain)
             if self._state_is_in_zone(state)
         }
-        self._generate_attrs()
 
-        self.async_on_remove(
-            event.async_track_state_change_filtered(
-                self.hass,
-                event.TrackStates(False, set(), {person_domain}),
-                self._person_state_change_listener,
-            ).async_remove
-        )
+    @callback
+    def _async_register_name(self) -> None:
+        """Register the zone to be updated when persons enter or leave it."""
+        zones_by_name: defaultdict[str, set[Zone]] = self.hass.data[ZONES_BY_NAME]
+        zones_by_name[self._case_folded_name].add(self)
+        if self.entity_id == ENTITY_ID_HOME:
+            zones_by_name[STATE_HOME].add(self)
+
+    @callback
+    def _async_unregister_name(self, case_folded_name: str) -> None:
+        """Unregister the zone from updates for a name."""
+        zones_by_name: defaultdict[str, set[Zone]] = self.hass.data[ZONES_BY_NAME]
+        for name in (case_folded_name, STATE_HOME):
+            if (zones := zones_by_name.get(name)) is not None:
+                zones.discard(self)
+                if not zones:
+                    del zones_by_name[name]
 
     @callback
     def _generate_attrs(self) -> None:
@@ -38,6 +38,7 @@ from .core import (
     HassJobType,
     HomeAssistant,
     callback,
+    current_executor_pool,
 )
 from .data_entry_flow import FLOW_NOT_COMPLETE_STEPS, FlowResult
 from .exceptions import (
@@ -509,6 +510,7 @@ class ConfigEntry(Generic[_DataT]):
     ) -> None:
         """Set up an entry."""
         current_entry.set(self)
+        current_executor_pool.set(self.domain)
         if self.source == SOURCE_IGNORE or self.disabled_by:
             return
 
@@ -7,7 +7,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
@@ -19,6 +19,7 @@ from collections.abc import (
 )
 import concurrent.futures
 from contextlib import suppress
+from contextvars import ContextVar
 from dataclasses import dataclass
 import datetime
 import enum
@@ -105,7 +106,10 @@ from .util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 from .util.event_type import EventType
-from .util.executor import InterruptibleThreadPoolExecutor
+from .util.executor import (
+    InstrumentedThreadPoolExecutor,
+    InterruptibleThreadPoolExecutor,
+)
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
@@ -145,6 +149,9 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# How many state changes are kept to answer which states changed since a version
+STATE_CHANGE_LOG_SIZE = 8192
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -202,6 +209,12 @@ EVENTS_EXCLUDED_FROM_MATCH_ALL = {
 
 _LOGGER = logging.getLogger(__name__)
 
+# Name of the executor pool that jobs added by the currently running
+# integration are routed to, this is the integration domain
+current_executor_pool: ContextVar[str | None] = ContextVar(
+    "current_executor_pool", default=None
+)
+
 
 @functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
 def split_entity_id(entity_id: str) -> tuple[str, str]:
@@ -450,6 +463,7 @@ class HomeAssistant:
         self.import_executor = InterruptibleThreadPoolExecutor(
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
+        self.executor_pools: dict[str, InstrumentedThreadPoolExecutor] = {}
         self.loop_thread_id = getattr(
             self.loop, "_thread_ident", getattr(self.loop, "_thread_id")
         )
@@ -874,8 +888,15 @@ class HomeAssistant:
     def async_add_executor_job[*_Ts, _T](
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        The job runs in the executor pool of the integration that is currently
+        running if one has been created, otherwise in the shared executor.
+        """
+        executor = None
+        if self.executor_pools and (pool_name := current_executor_pool.get()):
+            executor = self.executor_pools.get(pool_name)
+        task = self.loop.run_in_executor(executor, target, *args)
 
         tracked = asyncio.current_task() in self._tasks
         task_bucket = self._tasks if tracked else self._background_tasks
@@ -884,6 +905,35 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def async_create_executor_pool(
+        self, name: str, max_workers: int
+    ) -> InstrumentedThreadPoolExecutor:
+        """Create a named executor pool with a worker quota.
+
+        Executor jobs added while the integration or config entry with the
+        domain `name` is running are routed to this pool instead of the
+        shared executor, so a misbehaving integration can only exhaust its
+        own workers. The existing pool is returned if it was already created,
+        for example by a config entry that is reloaded. Its worker quota is
+        kept until Home Assistant is restarted.
+        """
+        if (pool := self.executor_pools.get(name)) is not None:
+            if pool.max_workers != max_workers:
+                _LOGGER.warning(
+                    "The executor pool %s already has %s workers, "
+                    "restart Home Assistant to change it to %s",
+                    name,
+                    pool.max_workers,
+                    max_workers,
+                )
+            return pool
+        pool = InstrumentedThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"SyncWorker_{name}"
+        )
+        self.executor_pools[name] = pool
+        return pool
+
     @callback
     def async_add_import_executor_job[*_Ts, _T](
         self, target: Callable[[*_Ts], _T], *args: *_Ts
@@ -1221,10 +1271,38 @@ class HomeAssistant:
 
         self.set_state(CoreState.stopped)
         self.import_executor.shutdown()
+        await self._async_shutdown_executor_pools()
 
         if self._stopped is not None:
             self._stopped.set()
 
+    async def _async_shutdown_executor_pools(self) -> None:
+        """Shut down the executor pools concurrently.
+
+        Each pool can take up to EXECUTOR_SHUTDOWN_TIMEOUT to join its
+        threads, so they are shut down in their own threads instead of one
+        after another in the event loop.
+        """
+        futures: list[asyncio.Future[None]] = []
+        for name, pool in self.executor_pools.items():
+            future: asyncio.Future[None] = self.loop.create_future()
+
+            def _shutdown(
+                pool: InstrumentedThreadPoolExecutor = pool,
+                future: asyncio.Future[None] = future,
+            ) -> None:
+                try:
+                    pool.shutdown()
+                finally:
+                    self.loop.call_soon_threadsafe(future.set_result, None)
+
+            threading.Thread(
+                target=_shutdown, name=f"ShutdownExecutorPool_{name}"
+            ).start()
+            futures.append(future)
+        if futures:
+            await asyncio.gather(*futures)
+
     def _cancel_cancellable_timers(self) -> None:
         """Cancel timer handles marked as cancellable."""
         handles: Iterable[asyncio.TimerHandle] = self.loop._scheduled  # type: ignore[attr-defined] # noqa: SLF001
@@ -2037,7 +2115,15 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_version",
+        "_changes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2048,6 +2134,39 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The version starts at the time the state machine was created so
+        # versions handed out by an earlier run are never mistaken for current ones
+        self._version = time.time_ns() // 1000
+        self._changes: deque[tuple[int, str]] = deque(maxlen=STATE_CHANGE_LOG_SIZE)
+
+    @property
+    def version(self) -> int:
+        """Return the version of the state machine.
+
+        The version is increased each time a state is changed or removed.
+        """
+        return self._version
+
+    @callback
+    def async_changed_since(self, version: int) -> set[str] | None:
+        """Return the entity ids which were changed or removed since a version.
+
+        Returns None if the changes are no longer known, callers should fall back
+        to fetching all states.
+
+        This method must be run in the event loop.
+        """
+        if version == self._version:
+            return set()
+        changes = self._changes
+        if version > self._version or not changes or changes[0][0] > version + 1:
+            return None
+        entity_ids: set[str] = set()
+        for change_version, entity_id in reversed(changes):
+            if change_version <= version:
+                break
+            entity_ids.add(entity_id)
+        return entity_ids
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2160,6 +2279,8 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._version += 1
+        self._changes.append((self._version, entity_id))
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2346,6 +2467,8 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._version += 1
+        self._changes.append((self._version, entity_id))
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
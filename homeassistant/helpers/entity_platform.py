@@ -20,6 +20,7 @@ from homeassistant.core import (
     CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
+    EntityServiceResponse,
     HassJob,
     HomeAssistant,
     ServiceCall,
@@ -73,6 +74,11 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+type BatchServiceHandler = Callable[
+    [list[Entity], dict[str, Any] | ServiceCall],
+    Awaitable[EntityServiceResponse | None],
+]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -152,6 +158,8 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Handlers for service calls targeting several entities of this platform
+        self._batch_service_handlers: dict[tuple[str, str], BatchServiceHandler] = {}
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -1017,6 +1025,32 @@ class EntityPlatform:
             supports_response,
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self, domain: str, service: str, handler: BatchServiceHandler
+    ) -> None:
+        """Register a handler for entity service calls targeting many entities.
+
+        When a call of the service targets more than one entity of this
+        platform, the handler is called once with all of them instead of
+        calling the service on each entity. This allows translating the call
+        into a single group or multicast command. The handler gets the same
+        data as the entity service: the service data without the target
+        fields if the service calls an entity method, otherwise the service
+        call. The handler returns the response data keyed by entity_id, or
+        None.
+        """
+        self._batch_service_handlers[(domain, service)] = handler
+
+    @callback
+    def async_get_batch_service_handler(
+        self, domain: str, service: str
+    ) -> BatchServiceHandler | None:
+        """Return the batch handler registered for a service, if any."""
+        if not self._batch_service_handlers:
+            return None
+        return self._batch_service_handlers.get((domain, service))
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
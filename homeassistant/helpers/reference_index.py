@@ -0,0 +1,122 @@
+"""Index the items referenced by automations, scripts, scenes and other entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping
+from enum import StrEnum
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_REFERENCE_INDEX: HassKey[dict[str, ReferenceIndex]] = HassKey("reference_index")
+
+type ReferencesGetter = Callable[[], Mapping[ReferenceType, Collection[str]]]
+
+
+class ReferenceType(StrEnum):
+    """Types of items an entity can reference."""
+
+    AREA = "area"
+    BLUEPRINT = "blueprint"
+    DEVICE = "device"
+    ENTITY = "entity"
+    FLOOR = "floor"
+    LABEL = "label"
+
+
+class ReferenceIndex:
+    """Index of the items referenced by the entities of a domain.
+
+    The references of an entity are collected the first time the index is
+    searched after the entity was added or its references changed, so adding
+    entities does not compute references nobody asks for.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._getters: dict[str, ReferencesGetter] = {}
+        self._pending: dict[str, None] = {}
+        self._references: dict[str, dict[ReferenceType, frozenset[str]]] = {}
+        self._referenced_by: dict[ReferenceType, dict[str, dict[str, None]]] = {
+            reference_type: {} for reference_type in ReferenceType
+        }
+
+    @callback
+    def async_add(
+        self, entity_id: str, get_references: ReferencesGetter
+    ) -> CALLBACK_TYPE:
+        """Add an entity to the index and return a callback to remove it."""
+        self._async_unindex(entity_id)
+        self._getters[entity_id] = get_references
+        self._pending[entity_id] = None
+
+        @callback
+        def _async_remove() -> None:
+            """Remove the entity unless it was added again since."""
+            if self._getters.get(entity_id) is get_references:
+                self.async_remove(entity_id)
+
+        return _async_remove
+
+    @callback
+    def async_invalidate(self, entity_id: str) -> None:
+        """Collect the references of an entity again."""
+        if entity_id in self._getters:
+            self._async_unindex(entity_id)
+            self._pending[entity_id] = None
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Remove an entity from the index."""
+        self._async_unindex(entity_id)
+        self._getters.pop(entity_id, None)
+
+    @callback
+    def async_referenced_by(
+        self, reference_type: ReferenceType, referenced_id: str
+    ) -> list[str]:
+        """Return the entities that reference an item."""
+        if self._pending:
+            self._async_index_pending()
+        return list(self._referenced_by[reference_type].get(referenced_id, ()))
+
+    @callback
+    def _async_index_pending(self) -> None:
+        """Collect the references of the entities added or changed since."""
+        for entity_id in self._pending:
+            references = {
+                reference_type: frozenset(referenced_ids)
+                for reference_type, referenced_ids in self._getters[entity_id]().items()
+                if referenced_ids
+            }
+            self._references[entity_id] = references
+            for reference_type, referenced_ids in references.items():
+                referenced_by = self._referenced_by[reference_type]
+                for referenced_id in referenced_ids:
+                    if (entity_ids := referenced_by.get(referenced_id)) is None:
+                        entity_ids = referenced_by[referenced_id] = {}
+                    entity_ids[entity_id] = None
+        self._pending.clear()
+
+    @callback
+    def _async_unindex(self, entity_id: str) -> None:
+        """Remove the references of an entity."""
+        self._pending.pop(entity_id, None)
+        if (references := self._references.pop(entity_id, None)) is None:
+            return
+        for reference_type, referenced_ids in references.items():
+            referenced_by = self._referenced_by[reference_type]
+            for referenced_id in referenced_ids:
+                entity_ids = referenced_by[referenced_id]
+                entity_ids.pop(entity_id, None)
+                if not entity_ids:
+                    del referenced_by[referenced_id]
+
+
+@callback
+def async_get(hass: HomeAssistant, domain: str) -> ReferenceIndex:
+    """Return the reference index of a domain."""
+    indexes = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    if (index := indexes.get(domain)) is None:
+        index = indexes[domain] = ReferenceIndex()
+    return index
@@ -8,6 +8,7 @@ import dataclasses
 from enum import Enum
 from functools import cache, partial
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -32,6 +33,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
@@ -47,6 +49,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import Integration, async_get_integrations, bind_hass
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.executor import ExecutorJobHistogram
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
 from homeassistant.util.yaml.loader import JSON_TYPE
@@ -67,17 +70,25 @@ from .typing import ConfigType, TemplateVarsType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import BatchServiceHandler, EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
 _LOGGER = logging.getLogger(__name__)
 
+ENTITY_SERVICE_LATENCY: HassKey[dict[str, ExecutorJobHistogram]] = HassKey(
+    "entity_service_latency"
+)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "target_resolution_cache"
+)
+TARGET_RESOLUTION_CACHE_SIZE = 512
 
 
 @cache
@@ -505,30 +516,131 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
     selector = ServiceTargetSelector(service_call)
-    selected = SelectedEntities()
 
     if not selector.has_any_selector:
-        return selected
+        return SelectedEntities()
 
     entity_ids: set[str] | list[str] = selector.entity_ids
     if expand_group:
         entity_ids = expand_entity_ids(hass, entity_ids)
 
-    selected.referenced.update(entity_ids)
-
     if (
         not selector.device_ids
         and not selector.area_ids
         and not selector.floor_ids
         and not selector.label_ids
     ):
-        return selected
+        return SelectedEntities(referenced=set(entity_ids))
+
+    resolved = async_get_target_resolution_cache(hass).async_resolve(selector)
+    return SelectedEntities(
+        referenced=set(entity_ids),
+        indirectly_referenced=set(resolved.indirectly_referenced),
+        missing_devices=set(resolved.missing_devices),
+        missing_areas=set(resolved.missing_areas),
+        missing_floors=set(resolved.missing_floors),
+        missing_labels=set(resolved.missing_labels),
+        referenced_devices=set(resolved.referenced_devices),
+        referenced_areas=set(resolved.referenced_areas),
+    )
+
+
+class TargetResolutionCache:
+    """Cache the entities, devices and areas registry targets resolve to.
+
+    The cache is cleared when any of the registries the resolution depends
+    on is updated.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._cache: dict[
+            tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+            SelectedEntities,
+        ] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for registry updates."""
+        for event_type in (
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            self._hass.bus.async_listen(event_type, self._async_clear)
+
+    @callback
+    def _async_clear(self, event: Event[Any]) -> None:
+        """Clear the cache."""
+        self._cache.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> SelectedEntities:
+        """Return what the device, area, floor and label ids resolve to.
+
+        The returned object is shared and must not be modified.
+        """
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._cache.get(key)) is not None:
+            self.hits += 1
+            return resolved
+        self.misses += 1
+        if len(self._cache) >= TARGET_RESOLUTION_CACHE_SIZE:
+            # Drop the oldest resolution
+            del self._cache[next(iter(self._cache))]
+        resolved = self._cache[key] = _async_resolve_target_ids(self._hass, selector)
+        return resolved
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the cache hit rate counters."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+@callback
+def async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the target resolution cache."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = TargetResolutionCache(hass)
+        cache.async_setup()
+    return cache
+
+
+@callback
+def async_target_resolution_stats(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the target resolution cache hit rate counters, if it was used."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        return None
+    return cache.async_stats()
+
 
+@callback
+def _async_resolve_target_ids(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target selector."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -919,6 +1031,38 @@ async def entity_service_call(
 
     Calls all platforms simultaneously.
     """
+    start = time.monotonic()
+    try:
+        return await _async_entity_service_call(
+            hass, registered_entities, func, call, required_features
+        )
+    finally:
+        duration = time.monotonic() - start
+        service = f"{call.domain}.{call.service}"
+        latencies = hass.data.setdefault(ENTITY_SERVICE_LATENCY, {})
+        if (histogram := latencies.get(service)) is None:
+            histogram = latencies[service] = ExecutorJobHistogram()
+        histogram.record(duration)
+        _LOGGER.debug("Entity service call %s took %.3f seconds", service, duration)
+
+
+@callback
+def async_entity_service_latency(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the latency histograms of entity service calls by service."""
+    return {
+        service: histogram.as_dict()
+        for service, histogram in hass.data.get(ENTITY_SERVICE_LATENCY, {}).items()
+    }
+
+
+async def _async_entity_service_call(
+    hass: HomeAssistant,
+    registered_entities: dict[str, Entity],
+    func: str | HassJob,
+    call: ServiceCall,
+    required_features: Iterable[int] | None,
+) -> EntityServiceResponse | None:
+    """Handle an entity service call without instrumentation."""
     entity_perms: Callable[[str, str], bool] | None = None
     return_response = call.return_response
 
@@ -1006,23 +1150,7 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
-    # Use asyncio.gather here to ensure the returned results
-    # are in the same order as the entities list
-    results: list[ServiceResponse | BaseException] = await asyncio.gather(
-        *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
-            )
-            for entity in entities
-        ],
-        return_exceptions=True,
-    )
-
-    response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
-        if isinstance(result, BaseException):
-            raise result from None
-        response_data[entity.entity_id] = result
+    response_data = await _async_handle_entity_calls(hass, entities, func, data, call)
 
     tasks: list[asyncio.Task[None]] = []
 
@@ -1044,6 +1172,89 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+async def _async_handle_entity_calls(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    call: ServiceCall,
+) -> EntityServiceResponse:
+    """Call the service on several entities and return their responses.
+
+    Platforms with a batch handler get all their targeted entities at once
+    when more than one of them is targeted.
+    """
+    entity_calls: list[Entity] = []
+    batch_calls: dict[EntityPlatform, tuple[BatchServiceHandler, list[Entity]]] = {}
+    for entity in entities:
+        if (platform := entity.platform) is not None and (
+            handler := platform.async_get_batch_service_handler(
+                call.domain, call.service
+            )
+        ):
+            if platform in batch_calls:
+                batch_calls[platform][1].append(entity)
+            else:
+                batch_calls[platform] = (handler, [entity])
+        else:
+            entity_calls.append(entity)
+    for platform, (_, batch_entities) in list(batch_calls.items()):
+        if len(batch_entities) == 1:
+            entity_calls.append(batch_entities[0])
+            del batch_calls[platform]
+
+    # Use asyncio.gather here to ensure the returned results
+    # are in the same order as the entities list
+    results: list[
+        ServiceResponse | EntityServiceResponse | None | BaseException
+    ] = await asyncio.gather(
+        *[
+            entity.async_request_call(
+                _handle_entity_call(hass, entity, func, data, call.context)
+            )
+            for entity in entity_calls
+        ],
+        *[
+            batch_entities[0].async_request_call(
+                _handle_batch_call(handler, batch_entities, data, call.context)
+            )
+            for handler, batch_entities in batch_calls.values()
+        ],
+        return_exceptions=True,
+    )
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result from None
+
+    entity_results = dict(
+        zip(
+            (entity.entity_id for entity in entity_calls),
+            results[: len(entity_calls)],
+            strict=True,
+        )
+    )
+    for batch_result in results[len(entity_calls) :]:
+        if batch_result:
+            entity_results.update(cast(EntityServiceResponse, batch_result))
+    return {
+        entity.entity_id: cast(ServiceResponse, entity_results.get(entity.entity_id))
+        for entity in entities
+    }
+
+
+async def _handle_batch_call(
+    handler: BatchServiceHandler,
+    entities: list[Entity],
+    data: dict | ServiceCall,
+    context: Context,
+) -> EntityServiceResponse | None:
+    """Handle calling a batch handler for the entities of a platform."""
+    for entity in entities:
+        entity.async_set_context(context)
+    return await handler(entities, data)
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
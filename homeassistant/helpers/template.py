@@ -81,6 +81,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .template_fast_path import FallbackToJinja, FastPath, compile_fast_path
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -327,6 +328,29 @@ def _false(arg: str) -> bool:
     return False
 
 
+def _native_result(value: Any) -> Any:
+    """Return a value if parsing its string would return it, else _SENTINEL.
+
+    Only booleans, integers and floats that are written as plain numbers are
+    returned, anything else has to be converted to a string and parsed.
+    """
+    if (value_type := type(value)) is bool or value_type is int:
+        return value
+    if value_type is float and _IS_NUMERIC.match(str(value)) is not None:
+        return value
+    return _SENTINEL
+
+
+def _may_exceed_int_str_digits(value: Any) -> bool:
+    """Return if converting an integer to a string may exceed the digit limit."""
+    return (
+        type(value) is int
+        and (max_digits := sys.get_int_max_str_digits()) != 0
+        # Every decimal digit takes more than 3 bits
+        and value.bit_length() > max_digits * 3
+    )
+
+
 @lru_cache(maxsize=EVAL_CACHE_SIZE)
 def _cached_parse_result(render_result: str) -> Any:
     """Parse a result and cache the result."""
@@ -486,6 +510,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_path",
         "_exc_info",
         "_limited",
         "_strict",
@@ -502,6 +527,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_path: FastPath | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -600,7 +626,19 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                self._fast_path is None
+                or (result := self._render_fast_path(kwargs)) is _SENTINEL
+            ):
+                render_result = _render_with_context(self.template, compiled, **kwargs)
+            elif (
+                parse_result
+                and not (self.hass and self.hass.config.legacy_templates)
+                and (native := _native_result(result)) is not _SENTINEL
+            ):
+                return native
+            else:
+                render_result = str(result)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -611,6 +649,20 @@ class Template:
 
         return self._parse_result(render_result)
 
+    def _render_fast_path(self, variables: dict[str, Any]) -> Any:
+        """Evaluate the template without Jinja, return _SENTINEL if it can't be."""
+        assert self._fast_path is not None
+        with _template_context_manager as cm:
+            cm.set_template(self.template, "rendering")
+            try:
+                result = self._fast_path(variables)
+            except FallbackToJinja:
+                return _SENTINEL
+        if _may_exceed_int_str_digits(result):
+            # Jinja raises converting the result to a string
+            return _SENTINEL
+        return result
+
     def _parse_result(self, render_result: str) -> Any:
         """Parse the result."""
         try:
@@ -745,10 +797,14 @@ class Template:
         error_value: Any = _SENTINEL,
         variables: dict[str, Any] | None = None,
         parse_result: bool = False,
+        *,
+        decode_json: bool = True,
     ) -> Any:
         """Render template with value exposed.
 
-        If valid JSON will expose value_json too.
+        If valid JSON will expose value_json too. Callers that already
+        decoded the value pass decode_json=False and value_json in the
+        variables when the value is valid JSON.
 
         This method must be run in the event loop.
         """
@@ -762,15 +818,28 @@ class Template:
         variables = dict(variables or {})
         variables["value"] = value
 
-        try:  # noqa: SIM105 - suppress is much slower
-            variables["value_json"] = json_loads(value)
-        except JSON_DECODE_EXCEPTIONS:
-            pass
+        if decode_json:
+            try:  # noqa: SIM105 - suppress is much slower
+                variables["value_json"] = json_loads(value)
+            except JSON_DECODE_EXCEPTIONS:
+                pass
 
         try:
-            render_result = _render_with_context(
-                self.template, compiled, **variables
-            ).strip()
+            if (
+                self._fast_path is None
+                or (result := self._render_fast_path(variables)) is _SENTINEL
+            ):
+                render_result = _render_with_context(
+                    self.template, compiled, **variables
+                ).strip()
+            elif (
+                parse_result
+                and not (self.hass and self.hass.config.legacy_templates)
+                and (native := _native_result(result)) is not _SENTINEL
+            ):
+                return native
+            else:
+                render_result = str(result).strip()
         except jinja2.TemplateError as ex:
             if error_value is _SENTINEL:
                 _LOGGER.error(
@@ -816,6 +885,7 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._fast_path = compile_fast_path(env, self.template, env.hass_functions)
 
         return self._compiled
 
@@ -2853,6 +2923,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.tests["match"] = regex_match
         self.tests["search"] = regex_search
         self.tests["contains"] = contains
+        # Functions depending on hass which are passed a context they don't use
+        self.hass_functions: set[Callable[..., Any]] = set()
 
         if hass is None:
             return
@@ -2877,6 +2949,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             def wrapper(_: Any, *args: _P.args, **kwargs: _P.kwargs) -> _R:
                 return func(hass, *args, **kwargs)
 
+            self.hass_functions.add(wrapper)
             return jinja_context(wrapper)
 
         self.globals["device_entities"] = hassfunction(device_entities)
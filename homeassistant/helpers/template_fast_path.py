@@ -0,0 +1,355 @@
+"""Evaluate simple templates without rendering them with Jinja."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from functools import partial
+import operator
+from typing import Any
+
+import jinja2
+from jinja2 import nodes
+
+type FastPath = Callable[[dict[str, Any]], Any]
+
+FAST_PATH_FILTERS = frozenset(
+    {
+        "abs",
+        "add",
+        "as_datetime",
+        "as_local",
+        "as_timestamp",
+        "bool",
+        "capitalize",
+        "contains",
+        "count",
+        "d",
+        "default",
+        "float",
+        "from_json",
+        "has_value",
+        "iif",
+        "int",
+        "is_defined",
+        "is_number",
+        "length",
+        "log",
+        "lower",
+        "multiply",
+        "regex_match",
+        "regex_replace",
+        "regex_search",
+        "round",
+        "slugify",
+        "sqrt",
+        "state_attr",
+        "string",
+        "timestamp_custom",
+        "timestamp_local",
+        "timestamp_utc",
+        "title",
+        "to_json",
+        "trim",
+        "upper",
+    }
+)
+FAST_PATH_GLOBALS = frozenset(
+    {
+        "as_datetime",
+        "as_local",
+        "as_timestamp",
+        "bool",
+        "float",
+        "has_value",
+        "iif",
+        "int",
+        "is_number",
+        "is_state",
+        "is_state_attr",
+        "log",
+        "max",
+        "min",
+        "now",
+        "sqrt",
+        "state_attr",
+        "states",
+        "utcnow",
+    }
+)
+
+_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+}
+_UNARY_OPERATORS: dict[type[nodes.UnaryExpr], Callable[[Any], Any]] = {
+    nodes.Neg: operator.neg,
+    nodes.Pos: operator.pos,
+    nodes.Not: operator.not_,
+}
+_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda value, container: value in container,
+    "notin": lambda value, container: value not in container,
+}
+
+
+class FallbackToJinja(Exception):
+    """Raised when a template has to be rendered by Jinja after all."""
+
+
+class _Unsupported(Exception):
+    """Raised when a template can not be evaluated without Jinja."""
+
+
+def compile_fast_path(
+    environment: jinja2.Environment,
+    source: str,
+    context_free: Collection[Callable[..., Any]],
+) -> FastPath | None:
+    """Compile a template that is a single simple expression.
+
+    The returned function evaluates the expression from the variables the
+    template is rendered with and returns the value, it raises
+    FallbackToJinja when the expression has an undefined value, Jinja has
+    to render the template to handle it the same way as always. None is
+    returned for templates with anything other than attribute and item
+    access, arithmetic, comparisons and the allowed filters and functions.
+
+    Filters and functions are called the same way Jinja calls them, those
+    that are passed a context are only supported when they do not use it.
+    """
+    try:
+        template = environment.parse(source)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(template.body) != 1
+        or not isinstance(output := template.body[0], nodes.Output)
+        or len(output.nodes) != 1
+        or isinstance(output.nodes[0], nodes.TemplateData)
+    ):
+        return None
+    try:
+        return _FastPathCompiler(environment, context_free).compile(output.nodes[0])
+    except _Unsupported:
+        return None
+
+
+def _defined(value: Any) -> Any:
+    """Return a value, falling back to Jinja if it is undefined."""
+    if isinstance(value, jinja2.Undefined):
+        raise FallbackToJinja
+    return value
+
+
+class _FastPathCompiler:
+    """Compile Jinja expression nodes to Python functions."""
+
+    def __init__(
+        self,
+        environment: jinja2.Environment,
+        context_free: Collection[Callable[..., Any]],
+    ) -> None:
+        """Initialize the compiler."""
+        self._environment = environment
+        self._context_free = context_free
+
+    def compile(self, node: nodes.Node) -> FastPath:
+        """Compile an expression node."""
+        if isinstance(node, nodes.Const):
+            value = node.value
+            return lambda variables: value
+        if isinstance(node, nodes.Name):
+            return self._name(node)
+        if isinstance(node, nodes.Getattr):
+            return self._getattr(node)
+        if isinstance(node, nodes.Getitem):
+            return self._getitem(node)
+        if isinstance(node, nodes.Filter):
+            return self._filter(node)
+        if isinstance(node, nodes.Call):
+            return self._call(node)
+        if isinstance(node, nodes.Compare):
+            return self._compare(node)
+        if isinstance(node, nodes.And):
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda variables: left(variables) and right(variables)
+        if isinstance(node, nodes.Or):
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda variables: left(variables) or right(variables)
+        if isinstance(node, nodes.Concat):
+            parts = [self.compile(part) for part in node.nodes]
+            return lambda variables: "".join([str(part(variables)) for part in parts])
+        if isinstance(node, nodes.CondExpr):
+            return self._cond_expr(node)
+        if isinstance(node, (nodes.List, nodes.Tuple)):
+            items = [self.compile(item) for item in node.items]
+            if isinstance(node, nodes.List):
+                return lambda variables: [item(variables) for item in items]
+            return lambda variables: tuple(item(variables) for item in items)
+        if isinstance(node, nodes.BinExpr) and type(node) in _BINARY_OPERATORS:
+            binary = _BINARY_OPERATORS[type(node)]
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda variables: binary(left(variables), right(variables))
+        if isinstance(node, nodes.UnaryExpr) and type(node) in _UNARY_OPERATORS:
+            unary = _UNARY_OPERATORS[type(node)]
+            operand = self.compile(node.node)
+            return lambda variables: unary(operand(variables))
+        raise _Unsupported
+
+    def _name(self, node: nodes.Name) -> FastPath:
+        """Compile looking up a variable, or a global if there is no variable."""
+        name = node.name
+        template_globals = self._environment.globals
+
+        def _resolve(variables: dict[str, Any]) -> Any:
+            if name in variables:
+                return _defined(variables[name])
+            if name in template_globals:
+                return template_globals[name]
+            raise FallbackToJinja
+
+        return _resolve
+
+    def _getattr(self, node: nodes.Getattr) -> FastPath:
+        """Compile attribute access, checked by the sandbox like Jinja does."""
+        obj = self.compile(node.node)
+        attribute = node.attr
+        getattr_ = self._environment.getattr
+        return lambda variables: _defined(getattr_(obj(variables), attribute))
+
+    def _getitem(self, node: nodes.Getitem) -> FastPath:
+        """Compile item access, checked by the sandbox like Jinja does."""
+        if isinstance(node.arg, nodes.Slice):
+            raise _Unsupported
+        obj = self.compile(node.node)
+        argument = self.compile(node.arg)
+        getitem = self._environment.getitem
+        return lambda variables: _defined(getitem(obj(variables), argument(variables)))
+
+    def _bind(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return a function passed what Jinja passes before the arguments."""
+        pass_arg = getattr(getattr(func, "jinja_pass_arg", None), "name", None)
+        if pass_arg is None:
+            return func
+        if pass_arg == "environment":
+            return partial(func, self._environment)
+        if pass_arg == "context" and func in self._context_free:
+            return partial(func, None)
+        raise _Unsupported
+
+    def _arguments(
+        self, node: nodes.Filter | nodes.Call
+    ) -> tuple[list[FastPath], dict[str, FastPath]]:
+        """Compile the arguments of a filter or call."""
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _Unsupported
+        kwargs: dict[str, FastPath] = {}
+        for kwarg in node.kwargs:
+            if not isinstance(kwarg, nodes.Keyword):
+                raise _Unsupported
+            kwargs[kwarg.key] = self.compile(kwarg.value)
+        return [self.compile(arg) for arg in node.args], kwargs
+
+    def _filter(self, node: nodes.Filter) -> FastPath:
+        """Compile applying an allowed filter."""
+        if node.node is None or node.name not in FAST_PATH_FILTERS:
+            raise _Unsupported
+        if (func := self._environment.filters.get(node.name)) is None:
+            raise _Unsupported
+        target = self._bind(func)
+        value = self.compile(node.node)
+        args, kwargs = self._arguments(node)
+
+        def _apply(variables: dict[str, Any]) -> Any:
+            return _defined(
+                target(
+                    value(variables),
+                    *[arg(variables) for arg in args],
+                    **{key: kwarg(variables) for key, kwarg in kwargs.items()},
+                )
+            )
+
+        return _apply
+
+    def _call(self, node: nodes.Call) -> FastPath:
+        """Compile calling an allowed global function."""
+        if not isinstance(node.node, nodes.Name):
+            raise _Unsupported
+        name = node.node.name
+        if name not in FAST_PATH_GLOBALS:
+            raise _Unsupported
+        func: Any = self._environment.globals.get(name)
+        if func is None or not getattr(self._environment, "is_safe_callable", callable)(
+            func
+        ):
+            raise _Unsupported
+        # Jinja passes arguments to a callable object based on its __call__
+        if hasattr(func.__call__, "jinja_pass_arg"):
+            target = self._bind(func.__call__)
+        else:
+            target = self._bind(func)
+        args, kwargs = self._arguments(node)
+
+        def _call(variables: dict[str, Any]) -> Any:
+            # A variable with the name of the function hides the function
+            if name in variables and variables[name] is not func:
+                raise FallbackToJinja
+            try:
+                result = target(
+                    *[arg(variables) for arg in args],
+                    **{key: kwarg(variables) for key, kwarg in kwargs.items()},
+                )
+            except StopIteration as err:
+                raise FallbackToJinja from err
+            return _defined(result)
+
+        return _call
+
+    def _compare(self, node: nodes.Compare) -> FastPath:
+        """Compile a comparison, chained comparisons work like in Python."""
+        expr = self.compile(node.expr)
+        operands: list[tuple[Callable[[Any, Any], Any], FastPath]] = []
+        for operand in node.ops:
+            if (compare := _COMPARE_OPERATORS.get(operand.op)) is None:
+                raise _Unsupported
+            operands.append((compare, self.compile(operand.expr)))
+
+        def _evaluate(variables: dict[str, Any]) -> Any:
+            left = expr(variables)
+            result: Any = True
+            for compare, operand in operands:
+                right = operand(variables)
+                if not (result := compare(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _evaluate
+
+    def _cond_expr(self, node: nodes.CondExpr) -> FastPath:
+        """Compile an inline if expression."""
+        test = self.compile(node.test)
+        expr1 = self.compile(node.expr1)
+        if node.expr2 is None:
+
+            def _no_else(variables: dict[str, Any]) -> Any:
+                if test(variables):
+                    return expr1(variables)
+                raise FallbackToJinja
+
+            return _no_else
+        expr2 = self.compile(node.expr2)
+        return lambda variables: (
+            expr1(variables) if test(variables) else expr2(variables)
+        )
@@ -9,6 +9,8 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from tempfile import TemporaryDirectory
+import time
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -19,6 +21,8 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.reference_index import ReferenceIndex, ReferenceType
+from homeassistant.helpers.template import Template
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -47,10 +51,11 @@ def run(args):
 
 async def run_benchmark(bench):
     """Run a benchmark."""
-    hass = core.HomeAssistant("")
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
-    await hass.async_stop()
+    with TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        runtime = await bench(hass)
+        print(f"Benchmark {bench.__name__} done in {runtime}s")
+        await hass.async_stop()
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -312,6 +317,331 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_json_value_templates(hass):
+    """Render value templates of 1000 MQTT devices with 10 entities each.
+
+    All entities of a device render the same JSON payload, like
+    zigbee2mqtt devices do.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import (
+        MqttValueTemplate,
+        ReceiveMessage,
+        receive_message_cv,
+    )
+
+    keys = [
+        "battery",
+        "humidity",
+        "linkquality",
+        "pressure",
+        "temperature",
+        "voltage",
+        "power_outage_count",
+        "device_temperature",
+        "update_available",
+        "last_seen",
+    ]
+    templates = [
+        MqttValueTemplate(
+            Template(f"{{{{ value_json.{key} }}}}"), hass=hass
+        ).async_render_with_possible_json_value
+        for key in keys
+    ]
+    messages = []
+    for device in range(1000):
+        topic = f"zigbee2mqtt/device_{device}"
+        payload = json.dumps({key: device + idx for idx, key in enumerate(keys)})
+        messages.append(ReceiveMessage(topic, payload, 0, False, topic, 0.0))
+
+    start = timer()
+
+    for msg in messages:
+        token = receive_message_cv.set(msg)
+        for render in templates:
+            render(msg.payload)
+        receive_message_cv.reset(token)
+
+    return timer() - start
+
+
+# Templates from the template, mqtt and helper tests
+TEMPLATE_CORPUS = [
+    "{{ states('sensor.temperature') }}",
+    "{{ states('sensor.temperature') | float * 2 }}",
+    "{{ states('sensor.temperature') | float(0) | round(1) }}",
+    "{{ states.sensor.temperature.state }}",
+    "{{ states.sensor.temperature.attributes.unit_of_measurement }}",
+    "{{ is_state('binary_sensor.door', 'on') }}",
+    "{{ is_state_attr('light.kitchen', 'brightness', 180) }}",
+    "{{ state_attr('light.kitchen', 'brightness') | int / 255 * 100 }}",
+    "{{ states('sensor.power') | float > 100 }}",
+    "{{ 'on' if is_state('binary_sensor.door', 'on') else 'off' }}",
+    "{{ has_value('sensor.temperature') }}",
+    "{{ value_json.temperature }}",
+    "{{ value_json['humidity'] | round(0) }}",
+    "{{ value | int + 1 }}",
+    "{% if is_state('binary_sensor.door', 'on') %}open{% else %}closed{% endif %}",
+    "{{ states.sensor | map(attribute='state') | list | count }}",
+]
+
+
+@benchmark
+async def template_corpus(hass):
+    """Render a corpus of templates 1000 times each."""
+    hass.states.async_set("sensor.temperature", "21.5", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.power", "120")
+    hass.states.async_set("binary_sensor.door", "on")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 180})
+    variables = {"value": "41", "value_json": {"temperature": 20.5, "humidity": 40.4}}
+    templates = [Template(template, hass) for template in TEMPLATE_CORPUS]
+
+    start = timer()
+
+    for _ in range(1000):
+        for template in templates:
+            template.async_render(variables)
+
+    return timer() - start
+
+
+@benchmark
+async def reference_index_lookups(hass):
+    """Look up the automations referencing 1000 entities, 200 devices and 20 areas.
+
+    Indexes 900 synthetic automations that reference 10 entities, 2 devices
+    and an area each.
+    """
+    index = ReferenceIndex()
+    for idx in range(900):
+        references = {
+            ReferenceType.ENTITY: {
+                f"light.light_{(idx * 7 + offset) % 1000}" for offset in range(10)
+            },
+            ReferenceType.DEVICE: {f"device_{idx % 200}", f"device_{idx * 3 % 200}"},
+            ReferenceType.AREA: {f"area_{idx % 20}"},
+        }
+        index.async_add(
+            f"automation.automation_{idx}", lambda references=references: references
+        )
+
+    start = timer()
+
+    for _ in range(100):
+        for idx in range(1000):
+            index.async_referenced_by(ReferenceType.ENTITY, f"light.light_{idx}")
+        for idx in range(200):
+            index.async_referenced_by(ReferenceType.DEVICE, f"device_{idx}")
+        for idx in range(20):
+            index.async_referenced_by(ReferenceType.AREA, f"area_{idx}")
+
+    return timer() - start
+
+
+async def _shared_executor_latency(hass, pool_name):
+    """Run 1000 jobs in the shared executor while 200 slow jobs are queued."""
+    if pool_name is not None:
+        hass.async_create_executor_pool(pool_name, 4)
+
+    async def _add_slow_jobs():
+        core.current_executor_pool.set(pool_name)
+        await asyncio.gather(
+            *(hass.async_add_executor_job(time.sleep, 0.05) for _ in range(200))
+        )
+
+    slow_jobs = hass.async_create_task(_add_slow_jobs(), eager_start=True)
+
+    start = timer()
+
+    for _ in range(1000):
+        await hass.async_add_executor_job(int)
+
+    runtime = timer() - start
+    await slow_jobs
+    return runtime
+
+
+@benchmark
+async def executor_pool_isolated(hass):
+    """Run 1000 jobs in the shared executor while a named pool is saturated."""
+    return await _shared_executor_latency(hass, "slow_integration")
+
+
+@benchmark
+async def executor_pool_shared(hass):
+    """Run 1000 jobs in the shared executor while it runs slow jobs."""
+    return await _shared_executor_latency(hass, None)
+
+
+async def _target_resolution_calls(hass):
+    """Set up 1000 lights and return calls targeting their areas, floors and labels.
+
+    The lights are spread over 50 areas on 5 floors and have one of 10 labels.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.core import ServiceCall
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+    )
+
+    for registry in (lr, fr, ar, dr, er):
+        await registry.async_load(hass)
+    floors = [fr.async_get(hass).async_create(f"Floor {idx}") for idx in range(5)]
+    areas = [
+        ar.async_get(hass).async_create(
+            f"Area {idx}", floor_id=floors[idx % 5].floor_id
+        )
+        for idx in range(50)
+    ]
+    labels = [lr.async_get(hass).async_create(f"Label {idx}") for idx in range(10)]
+    entity_registry = er.async_get(hass)
+    for idx in range(1000):
+        entry = entity_registry.async_get_or_create("light", "benchmark", str(idx))
+        entity_registry.async_update_entity(
+            entry.entity_id,
+            area_id=areas[idx % 50].id,
+            labels={labels[idx % 10].label_id},
+        )
+
+    return [
+        *(ServiceCall("light", "turn_on", {"area_id": area.id}) for area in areas),
+        *(
+            ServiceCall("light", "turn_on", {"floor_id": floor.floor_id})
+            for floor in floors
+        ),
+        *(
+            ServiceCall("light", "turn_on", {"label_id": label.label_id})
+            for label in labels
+        ),
+    ]
+
+
+@benchmark
+async def target_resolution_cached(hass):
+    """Resolve 65 area, floor and label targets of 1000 lights 100 times each."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import service
+
+    calls = await _target_resolution_calls(hass)
+
+    start = timer()
+
+    for _ in range(100):
+        for call in calls:
+            service.async_extract_referenced_entity_ids(hass, call)
+
+    return timer() - start
+
+
+@benchmark
+async def target_resolution_uncached(hass):
+    """Resolve 65 area, floor and label targets of 1000 lights 100 times each.
+
+    Resolves the targets without the target resolution cache.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import service
+
+    calls = await _target_resolution_calls(hass)
+    selectors = [service.ServiceTargetSelector(call) for call in calls]
+
+    start = timer()
+
+    for _ in range(100):
+        for selector in selectors:
+            # pylint: disable-next=protected-access
+            service._async_resolve_target_ids(hass, selector)  # noqa: SLF001
+
+    return timer() - start
+
+
+async def _authenticated_requests(hass):
+    """Return an auth middleware and 500 bearer token and 500 signed requests.
+
+    Every request uses its own access token or signed path.
+    """
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from aiohttp import web
+    from aiohttp.test_utils import make_mocked_request
+
+    from homeassistant.auth import auth_manager_from_config
+    from homeassistant.components.http.auth import async_setup_auth, async_sign_path
+
+    # pylint: enable=import-outside-toplevel
+
+    hass.auth = await auth_manager_from_config(hass, [], [])
+    app = web.Application()
+    await async_setup_auth(hass, app)
+    user = await hass.auth.async_create_user("Benchmark")
+    requests = []
+    for idx in range(500):
+        refresh_token = await hass.auth.async_create_refresh_token(
+            user, "https://example.com/"
+        )
+        access_token = hass.auth.async_create_access_token(refresh_token)
+        requests.append(
+            make_mocked_request(
+                "GET", "/api/states", {"Authorization": f"Bearer {access_token}"}
+            )
+        )
+        signed_path = async_sign_path(
+            hass,
+            f"/api/camera_proxy/camera.camera_{idx}",
+            timedelta(minutes=5),
+            refresh_token_id=refresh_token.id,
+        )
+        requests.append(make_mocked_request("GET", signed_path))
+
+    return app.middlewares[-1], requests
+
+
+async def _authenticate(middleware, requests):
+    """Authenticate requests with the auth middleware."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.http import KEY_AUTHENTICATED
+
+    async def handler(request):
+        """Handle an authenticated request."""
+        assert request[KEY_AUTHENTICATED]
+
+    for request in requests:
+        await middleware(request, handler)
+
+
+@benchmark
+async def authenticate_requests_cached(hass):
+    """Authenticate 500 bearer token and 500 signed requests seen before."""
+    middleware, requests = await _authenticated_requests(hass)
+    await _authenticate(middleware, requests)
+
+    start = timer()
+
+    await _authenticate(middleware, requests)
+
+    return timer() - start
+
+
+@benchmark
+async def authenticate_requests_uncached(hass):
+    """Authenticate 500 bearer token and 500 signed requests not seen before."""
+    middleware, requests = await _authenticated_requests(hass)
+
+    start = timer()
+
+    await _authenticate(middleware, requests)
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
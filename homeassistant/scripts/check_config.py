@@ -219,7 +219,10 @@ def check(config_dir, secrets=False):
         return secrets
 
     try:
-        with patch.object(yaml_loader, "Secrets", secrets_proxy):
+        with (
+            patch.object(yaml_loader, "Secrets", secrets_proxy),
+            patch.object(yaml_loader, "CACHE_ENABLED", False),
+        ):
             res["components"] = asyncio.run(async_check_config(config_dir))
         res["secret_cache"] = {
             str(key): val for key, val in res["secret_cache"].items()
@@ -161,6 +161,8 @@ async def async_setup_component(
     setup_future = hass.loop.create_future()
     setup_futures[domain] = setup_future
 
+    # Route executor jobs of the integration to its executor pool
+    executor_pool_token = core.current_executor_pool.set(domain)
     try:
         result = await _async_setup_component(hass, domain, config)
         setup_future.set_result(result)
@@ -184,6 +186,8 @@ async def async_setup_component(
                 # if there are no concurrent setup attempts
                 await future
         raise
+    finally:
+        core.current_executor_pool.reset(executor_pool_token)
     return result
 
 
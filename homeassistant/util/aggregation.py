@@ -0,0 +1,147 @@
+"""Running aggregates over a changing set of keyed values."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+import math
+import statistics
+from typing import TYPE_CHECKING
+
+
+class RunningAggregate:
+    """Aggregates of keyed values that are updated one value at a time.
+
+    Sums are kept as exact fractions so they do not drift however many
+    updates are applied, the mean matches statistics.mean. Values are kept
+    sorted for min, max, median and range. Ties are resolved in favor of the
+    key that comes first in the order the keys were given in, like a linear
+    scan would.
+
+    Non finite values can not be kept in a sorted list or an exact sum, while
+    there are any the aggregates are computed from all values instead.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize the aggregate."""
+        self._keys = list(keys)
+        self._positions = {key: position for position, key in enumerate(self._keys)}
+        self._values: dict[str, float] = {}
+        self._sorted: list[tuple[float, int]] = []
+        self._sum = Fraction()
+        self._sum_squares = Fraction()
+        self._non_finite = 0
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self._values)
+
+    def __contains__(self, key: str) -> bool:
+        """Return if there is a value for a key."""
+        return key in self._values
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys with a value in key order."""
+        return (key for key in self._keys if key in self._values)
+
+    def __getitem__(self, key: str) -> float:
+        """Return the value of a key."""
+        return self._values[key]
+
+    def set(self, key: str, value: float) -> None:
+        """Set the value of a key."""
+        self.discard(key)
+        self._values[key] = value
+        if not math.isfinite(value):
+            self._non_finite += 1
+            return
+        insort(self._sorted, (value, self._positions[key]))
+        exact = Fraction(value)
+        self._sum += exact
+        self._sum_squares += exact * exact
+
+    def discard(self, key: str) -> None:
+        """Remove the value of a key if there is one."""
+        if (value := self._values.pop(key, None)) is None:
+            return
+        if not math.isfinite(value):
+            self._non_finite -= 1
+            return
+        del self._sorted[bisect_left(self._sorted, (value, self._positions[key]))]
+        exact = Fraction(value)
+        self._sum -= exact
+        self._sum_squares -= exact * exact
+
+    def values(self) -> list[float]:
+        """Return the values in key order."""
+        return [self._values[key] for key in self]
+
+    def min(self) -> tuple[str, float]:
+        """Return the key and value of the smallest value."""
+        if self._non_finite:
+            return self._scan(lambda best, value: best > value)
+        if not self._sorted:
+            raise ValueError("min of no values")
+        value, position = self._sorted[0]
+        return self._keys[position], value
+
+    def max(self) -> tuple[str, float]:
+        """Return the key and value of the largest value."""
+        if self._non_finite:
+            return self._scan(lambda best, value: best < value)
+        if not self._sorted:
+            raise ValueError("max of no values")
+        value, position = self._sorted[
+            bisect_left(self._sorted, (self._sorted[-1][0], -1))
+        ]
+        return self._keys[position], value
+
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        if self._non_finite:
+            return statistics.mean(self.values())
+        if not self._values:
+            raise statistics.StatisticsError("mean requires at least one data point")
+        return float(self._sum / len(self._values))
+
+    def median(self) -> float:
+        """Return the median of the values."""
+        if self._non_finite:
+            return statistics.median(self.values())
+        if not (count := len(self._sorted)):
+            raise statistics.StatisticsError("no median for empty data")
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle][0]
+        return (self._sorted[middle - 1][0] + self._sorted[middle][0]) / 2
+
+    def range(self) -> float:
+        """Return the difference between the largest and smallest value."""
+        return self.max()[1] - self.min()[1]
+
+    def stdev(self) -> float:
+        """Return the sample standard deviation of the values."""
+        if self._non_finite:
+            return statistics.stdev(self.values())
+        if (count := len(self._values)) < 2:
+            raise statistics.StatisticsError("stdev requires at least two data points")
+        squared_deviations = self._sum_squares - self._sum * self._sum / count
+        return math.sqrt(squared_deviations / (count - 1))
+
+    def sum(self) -> float:
+        """Return the sum of the values."""
+        if self._non_finite:
+            return sum(self.values())
+        return float(self._sum)
+
+    def _scan(self, better: Callable[[float, float], bool]) -> tuple[str, float]:
+        """Return the first key and value no other value is better than."""
+        best: tuple[str, float] | None = None
+        for key in self:
+            value = self._values[key]
+            if best is None or better(best[1], value):
+                best = (key, value)
+        if TYPE_CHECKING:
+            assert best is not None
+        return best
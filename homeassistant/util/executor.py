@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
 import logging
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import time
 import traceback
 from typing import Any
@@ -21,6 +23,10 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+# Upper bounds in seconds of the queue-wait and run-time histogram buckets,
+# the last bucket collects everything above the final bound
+EXECUTOR_HISTOGRAM_BUCKETS = (0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -92,3 +98,100 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
             )
             if timeout_remaining <= 0:
                 return
+
+
+class ExecutorJobHistogram:
+    """Fixed bucket histogram of executor job durations."""
+
+    __slots__ = ("counts", "total", "maximum")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.counts = [0] * (len(EXECUTOR_HISTOGRAM_BUCKETS) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a duration."""
+        self.counts[bisect_left(EXECUTOR_HISTOGRAM_BUCKETS, duration)] += 1
+        self.total += duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        buckets = {
+            f"le_{bound}": count
+            for bound, count in zip(
+                EXECUTOR_HISTOGRAM_BUCKETS, self.counts, strict=False
+            )
+        }
+        buckets["inf"] = self.counts[-1]
+        samples = sum(self.counts)
+        return {
+            "buckets": buckets,
+            "mean": self.total / samples if samples else 0.0,
+            "max": self.maximum,
+        }
+
+
+class InstrumentedThreadPoolExecutor(InterruptibleThreadPoolExecutor):
+    """An InterruptibleThreadPoolExecutor that tracks queue-wait and run times."""
+
+    def __init__(self, max_workers: int | None = None, **kwargs: Any) -> None:
+        """Initialize the executor."""
+        super().__init__(max_workers, **kwargs)
+        self._stats_lock = Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self.queue_wait = ExecutorJobHistogram()
+        self.run_time = ExecutorJobHistogram()
+
+    def submit(
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        """Submit a job, recording how long it waits and runs."""
+        with self._stats_lock:
+            self._pending += 1
+        return super().submit(self._run_job, time.monotonic(), fn, args, kwargs)
+
+    def _run_job(
+        self,
+        queued_at: float,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run a job in a worker thread."""
+        started_at = time.monotonic()
+        with self._stats_lock:
+            self._pending -= 1
+            self._running += 1
+            self.queue_wait.record(started_at - queued_at)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            finished_at = time.monotonic()
+            with self._stats_lock:
+                self._running -= 1
+                self._completed += 1
+                self.run_time.record(finished_at - started_at)
+
+    @property
+    def max_workers(self) -> int:
+        """Return the maximum number of workers."""
+        return self._max_workers
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the executor statistics."""
+        with self._stats_lock:
+            return {
+                "max_workers": self._max_workers,
+                "pending": self._pending,
+                "running": self._running,
+                "completed": self._completed,
+                "saturated": self._running >= self._max_workers,
+                "queue_wait": self.queue_wait.as_dict(),
+                "run_time": self.run_time.as_dict(),
+            }
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, overload
 
 import yaml
@@ -36,6 +39,32 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# A dependency of a parsed YAML file, which is a tuple of the kind of the
+# dependency, what it refers to and the value it had when the file was parsed:
+# ("file", path, (mtime, size)), ("dir", directory, files) or ("env", name, value)
+type _Dependency = tuple[str, str, Any]
+
+
+@dataclass(slots=True)
+class _CachedYaml:
+    """A parsed YAML file and everything its parsed tree depends on."""
+
+    signature: tuple[int, int] | None
+    result: JSON_TYPE | None
+    dependencies: dict[tuple[str, str], Any]
+
+
+_YAML_CACHE: dict[tuple[str, Path | None], _CachedYaml] = {}
+_tracking = threading.local()
+
+# Files modified this recently are not cached, as another change within the
+# resolution of the modification time would not change their signature
+_RACY_MODIFICATION_NS = 2_000_000_000
+
+# Tools that instrument loading by patching the loader functions, like
+# check_config, disable the cache as cached files are not parsed again
+CACHE_ENABLED = True
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -48,6 +77,7 @@ class Secrets:
         """Initialize secrets."""
         self.config_dir = config_dir
         self._cache: dict[Path, dict[str, str]] = {}
+        self._dependencies: dict[Path, dict[tuple[str, str], Any]] = {}
 
     def get(self, requester_path: str, secret: str) -> str:
         """Return the value of a secret."""
@@ -78,9 +108,14 @@ class Secrets:
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
         if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+            # The file including the secret depends on the secrets file
+            # even though it was already loaded for another file
+            _add_dependencies(self._dependencies[secret_path])
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
+        dependencies = self._dependencies[secret_path] = {}
+        _tracking_stack().append(dependencies)
         try:
             secrets = load_yaml(str(secret_path))
 
@@ -102,6 +137,9 @@ class Secrets:
                 del secrets["logger"]
         except FileNotFoundError:
             secrets = {}
+        finally:
+            _tracking_stack().pop()
+            _add_dependencies(dependencies)
 
         self._cache[secret_path] = secrets
 
@@ -221,14 +259,139 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are cached in memory together with the files, directory
+    listings and environment variables their parsed tree depends on. A file
+    is only parsed again when the modification time or size of the file or
+    any of its dependencies changed.
+    """
+    path = os.fspath(fname)
+    key = (path, secrets.config_dir if secrets else None)
+    if (
+        CACHE_ENABLED
+        and (cached := _YAML_CACHE.get(key)) is not None
+        and _is_cache_valid(cached, path)
+    ):
+        _add_dependency(("file", path, cached.signature))
+        _add_dependencies(cached.dependencies)
+        return _copy_yaml(cached.result)
+
+    # Taken before reading, so a change while reading is detected next time
+    signature = _file_signature(path)
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            content = conf_file.read()
+    except FileNotFoundError:
+        _add_dependency(("file", path, None))
+        raise
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    top_level = not _tracking_stack()
+    _add_dependency(("file", path, signature))
+    stream = StringIO(content)
+    stream.name = getattr(conf_file, "name", path)
+    dependencies: dict[tuple[str, str], Any] = {}
+    _tracking_stack().append(dependencies)
+    try:
+        result = parse_yaml(stream, secrets)
+    finally:
+        _tracking_stack().pop()
+
+    _add_dependencies(dependencies)
+    if (
+        CACHE_ENABLED
+        and signature is not None
+        and time.time_ns() - signature[0] > _RACY_MODIFICATION_NS
+    ):
+        if top_level:
+            _prune_cache()
+        _YAML_CACHE[key] = _CachedYaml(signature, result, dependencies)
+    return _copy_yaml(result)
+
+
+def _prune_cache() -> None:
+    """Remove the cached files that were deleted or renamed."""
+    for key in [key for key in _YAML_CACHE if not os.path.exists(key[0])]:
+        del _YAML_CACHE[key]
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file or None if it is missing."""
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _tracking_stack() -> list[dict[tuple[str, str], Any]]:
+    """Return the dependencies of the files being parsed in this thread."""
+    try:
+        return _tracking.stack
+    except AttributeError:
+        stack: list[dict[tuple[str, str], Any]] = []
+        _tracking.stack = stack
+        return stack
+
+
+def _add_dependency(dependency: _Dependency) -> None:
+    """Record a dependency of the file that is being parsed."""
+    if stack := _tracking_stack():
+        kind, name, value = dependency
+        stack[-1][(kind, name)] = value
+
+
+def _add_dependencies(dependencies: dict[tuple[str, str], Any]) -> None:
+    """Record the dependencies of an included file for the including file."""
+    if stack := _tracking_stack():
+        stack[-1].update(dependencies)
+
+
+def _is_cache_valid(cached: _CachedYaml, path: str) -> bool:
+    """Return if a cached parsed file still matches the file and its dependencies."""
+    if _file_signature(path) != cached.signature:
+        return False
+    for (kind, name), value in cached.dependencies.items():
+        current: Any
+        if kind == "file":
+            current = _file_signature(name)
+        elif kind == "dir":
+            current = tuple(_find_files(name, "*.yaml"))
+        else:
+            current = os.environ.get(name)
+        if current != value:
+            return False
+    return True
+
+
+def _copy_yaml(obj: Any) -> Any:
+    """Copy the mutable containers of a parsed YAML tree.
+
+    Strings and scalars are immutable and shared with the cache.
+    """
+    copied: NodeDictClass | NodeListClass
+    if isinstance(obj, dict):
+        items = {key: _copy_yaml(value) for key, value in obj.items()}
+        if type(obj) is dict:
+            return items
+        copied = NodeDictClass(items)
+    elif isinstance(obj, list):
+        values = [_copy_yaml(value) for value in obj]
+        if type(obj) is list:
+            return values
+        copied = NodeListClass(values)
+    else:
+        return obj
+    try:  # suppress is much slower
+        copied.__config_file__ = obj.__config_file__
+        copied.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return copied
+
 
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
@@ -382,11 +545,18 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Find the YAML files in a directory and record the listing as dependency."""
+    files = list(_find_files(directory, "*.yaml"))
+    _add_dependency(("dir", directory, tuple(files)))
+    return files
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -405,7 +575,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -421,7 +591,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -433,7 +603,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -502,6 +672,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependency(("env", args[0], os.environ.get(args[0])))
 
     # Check for a default value
     if len(args) > 1:
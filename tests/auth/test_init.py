@@ -390,6 +390,38 @@ async def test_cannot_retrieve_expired_access_token(hass: HomeAssistant) -> None
     assert manager.async_validate_access_token(access_token) is None
 
 
+async def test_verified_access_tokens_are_cached(hass: HomeAssistant) -> None:
+    """Test verified access tokens are cached until they expire or are revoked."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    with patch(
+        "homeassistant.auth.jwt_wrapper.verify_and_decode",
+        wraps=auth.jwt_wrapper.verify_and_decode,
+    ) as mock_verify:
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert mock_verify.call_count == 1
+
+        expired = time.time() + auth_const.ACCESS_TOKEN_EXPIRATION.total_seconds()
+        with freeze_time(dt_util.utc_from_timestamp(expired + 11)):
+            assert manager.async_validate_access_token(access_token) is None
+        assert mock_verify.call_count == 2
+
+        assert manager.async_validate_access_token(access_token) is refresh_token
+        assert mock_verify.call_count == 3
+
+        user.is_active = False
+        assert manager.async_validate_access_token(access_token) is None
+        user.is_active = True
+
+        manager.async_remove_refresh_token(refresh_token)
+        assert manager.async_validate_access_token(access_token) is None
+        assert mock_verify.call_count == 4
+
+
 async def test_generating_system_user(hass: HomeAssistant) -> None:
     """Test that we can add a system user."""
     events = []
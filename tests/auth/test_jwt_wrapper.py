@@ -1,5 +1,7 @@
 """Tests for the Home Assistant auth jwt_wrapper module."""
 
+import time
+
 import jwt
 import pytest
 
@@ -10,3 +12,22 @@ async def test_reject_access_token_with_impossible_large_size() -> None:
     """Test rejecting access tokens with impossible sizes."""
     with pytest.raises(jwt.DecodeError):
         jwt_wrapper.unverified_hs256_token_decode("a" * 10000)
+
+
+async def test_verified_token_cache() -> None:
+    """Test the verified token cache is bounded and honors expiry."""
+    cache = jwt_wrapper.VerifiedTokenCache(maxsize=2)
+    now = time.time()
+    cache.add("token1", {"iss": "a", "exp": now + 100})
+    cache.add("token2", {"iss": "b", "exp": now - 5})
+    assert cache.get("token2") is None
+    assert cache.get("token1") == {"iss": "a", "exp": now + 100}
+
+    cache.add("token2", {"iss": "b", "exp": now - 5})
+    assert cache.get("token2", leeway=10) == {"iss": "b", "exp": now - 5}
+    cache.add("token3", {"iss": "b", "exp": now + 100})
+    assert cache.get("token1") is None
+
+    cache.discard_issuers({"b"})
+    assert cache.get("token2", leeway=10) is None
+    assert cache.get("token3") is None
@@ -1082,6 +1082,7 @@ class MockConfigEntry(config_entries.ConfigEntry):
         self._async_set_state(hass, state, reason)
 
 
+@contextmanager
 def patch_yaml_files(files_dict, endswith=True):
     """Patch load_yaml with a dictionary of yaml files."""
     # match using endswith, start search with longest string
@@ -1115,7 +1116,12 @@ def patch_yaml_files(files_dict, endswith=True):
         # Not found
         raise FileNotFoundError(f"File not found: {fname}")
 
-    return patch.object(yaml_loader, "open", mock_open_f, create=True)
+    # The mocked files do not change the modification time the cache checks
+    with (
+        patch.object(yaml_loader, "open", mock_open_f, create=True),
+        patch.object(yaml_loader, "CACHE_ENABLED", False),
+    ):
+        yield
 
 
 @contextmanager
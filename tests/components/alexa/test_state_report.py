@@ -1,5 +1,6 @@
 """Test report state."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
@@ -11,6 +12,7 @@ from homeassistant.components.alexa import errors, state_report
 from homeassistant.components.alexa.resources import AlexaGlobalCatalog
 from homeassistant.const import PERCENTAGE, UnitOfLength, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
 from .test_common import TEST_URL, get_default_config
 
@@ -703,6 +705,107 @@ async def test_doorbell_event_timeout(
     )
 
 
+async def test_report_state_coalesced(hass: HomeAssistant) -> None:
+    """Test pending reports of an endpoint are merged and concurrency is bounded."""
+    config = get_default_config(hass)
+    await state_report.async_enable_proactive_mode(hass, config)
+    reporter = config.change_reporter
+    assert reporter is not None
+
+    release = asyncio.Event()
+    sent: list[tuple[str, str]] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_send_changereport_message(
+        hass: HomeAssistant, config, alexa_entity, alexa_properties
+    ) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await release.wait()
+        in_flight -= 1
+        sent.append((alexa_entity.entity_id, alexa_properties[0]["value"]))
+
+    with patch(
+        "homeassistant.components.alexa.state_report.async_send_changereport_message",
+        side_effect=mock_send_changereport_message,
+    ):
+        for state in ("on", "off", "on", "off"):
+            hass.states.async_set(
+                "binary_sensor.test_contact",
+                state,
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+            # Reports are blocked, so only let the state listeners run
+            await asyncio.sleep(0)
+        for idx in range(6):
+            hass.states.async_set(
+                f"binary_sensor.test_contact_{idx}",
+                "on",
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+        await asyncio.sleep(0)
+        assert max_in_flight == state_report.MAX_CONCURRENT_CHANGE_REPORTS
+
+        release.set()
+        await hass.async_block_till_done()
+
+    # Only the first and the latest change of the first endpoint are sent
+    assert [report for report in sent if report[0] == "binary_sensor.test_contact"] == [
+        ("binary_sensor.test_contact", "DETECTED"),
+        ("binary_sensor.test_contact", "NOT_DETECTED"),
+    ]
+    assert len(sent) == 8
+    assert reporter.reports_sent == 8
+    assert reporter.reports_coalesced == 2
+
+
+async def test_report_state_error_keeps_sending(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an unexpected error sending a report doesn't stop other reports."""
+    config = get_default_config(hass)
+    await state_report.async_enable_proactive_mode(hass, config)
+    reporter = config.change_reporter
+    assert reporter is not None
+
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def mock_send_changereport_message(
+        hass: HomeAssistant, config, alexa_entity, alexa_properties
+    ) -> None:
+        await release.wait()
+        if alexa_entity.entity_id == "binary_sensor.test_contact_0":
+            raise HomeAssistantError("Token refresh failed")
+        sent.append(alexa_entity.entity_id)
+
+    with (
+        patch(
+            "homeassistant.components.alexa.state_report.async_send_changereport_message",
+            side_effect=mock_send_changereport_message,
+        ),
+        patch.object(state_report, "MAX_CONCURRENT_CHANGE_REPORTS", 1),
+    ):
+        for idx in range(3):
+            hass.states.async_set(
+                f"binary_sensor.test_contact_{idx}",
+                "on",
+                {"friendly_name": "Test Contact Sensor", "device_class": "door"},
+            )
+        await asyncio.sleep(0)
+        release.set()
+        await hass.async_block_till_done()
+
+    # The sender of the failed report sends the remaining reports
+    assert sent == ["binary_sensor.test_contact_1", "binary_sensor.test_contact_2"]
+    assert reporter.reports_sent == 2
+    assert (
+        "Error sending report to Alexa for binary_sensor.test_contact_0" in caplog.text
+    )
+
+
 async def test_proactive_mode_filter_states(
     hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
 ) -> None:
@@ -44,6 +44,58 @@ async def test_api_list_state_entities(
     assert remote_data == local_data
 
 
+async def test_api_list_state_entities_etag(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test listing states is answered with not modified when nothing changed."""
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    hass.states.async_set("test.entity", "world")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+
+
+async def test_api_list_state_entities_since(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test listing the states which changed since a version."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.other", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": 0})
+    assert resp.status == HTTPStatus.OK
+    json = await resp.json()
+    assert json["full"] is True
+    assert json["removed"] == []
+    assert len(json["states"]) == len(hass.states.async_all())
+    assert json["version"] == hass.states.version
+
+    hass.states.async_set("test.entity", "world")
+    hass.states.async_remove("test.other")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": json["version"]}
+    )
+    assert resp.status == HTTPStatus.OK
+    json = await resp.json()
+    assert json["full"] is False
+    assert json["removed"] == ["test.other"]
+    assert [item["entity_id"] for item in json["states"]] == ["test.entity"]
+    assert json["states"][0]["state"] == "world"
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "abc"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_api_get_state(hass: HomeAssistant, mock_api_client: TestClient) -> None:
     """Test if the debug interface allows us to get a state."""
     hass.states.async_set("hello.world", "nice", {"attr": 1})
@@ -493,7 +545,8 @@ async def test_stream_with_restricted(
         f"{const.URL_API_STREAM}?restrict=test_event1,test_event3"
     ) as resp:
         assert resp.status == HTTPStatus.OK
-        assert listen_count + 1 == _listen_count(hass)
+        # One listener for each restricted event type and the stop event
+        assert listen_count + 3 == _listen_count(hass)
 
         hass.bus.async_fire("test_event1")
         data = await _stream_next_event(resp.content)
@@ -505,6 +558,30 @@ async def test_stream_with_restricted(
         assert data["event_type"] == "test_event3"
 
 
+async def test_stream_closed_when_client_falls_behind(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream is closed when the client does not read events."""
+    listen_count = _listen_count(hass)
+
+    with patch("homeassistant.components.api.STREAM_QUEUE_SIZE", 3):
+        async with mock_api_client.get(
+            f"{const.URL_API_STREAM}?restrict=test_event"
+        ) as resp:
+            assert resp.status == HTTPStatus.OK
+            for _ in range(5):
+                hass.bus.async_fire("test_event")
+
+            data = await _stream_next_event(resp.content)
+            assert data["event_type"] == "test_event"
+            data = await _stream_next_event(resp.content)
+            assert data["event_type"] == "test_event"
+            assert await resp.content.read() == b""
+
+    await hass.async_block_till_done()
+    assert _listen_count(hass) == listen_count
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
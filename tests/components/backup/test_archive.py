@@ -0,0 +1,151 @@
+"""Tests for the chunked backup archive."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import random
+import tarfile
+import zlib
+
+from securetar import atomic_contents_add
+
+from homeassistant.components.backup.archive import (
+    CHUNK_SIZE,
+    INNER_TAR_NAME,
+    ChunkIndex,
+    add_chunked_tar,
+    crc32_combine,
+)
+
+
+def test_crc32_combine() -> None:
+    """Test combining CRC-32s matches the CRC-32 of the concatenated data."""
+    rng = random.Random(1234)
+    for size1, size2 in ((0, 0), (0, 5), (7, 0), (1, 1), (1000, 3333), (5, 70000)):
+        data1 = rng.randbytes(size1)
+        data2 = rng.randbytes(size2)
+        assert crc32_combine(zlib.crc32(data1), zlib.crc32(data2), size2) == zlib.crc32(
+            data1 + data2
+        )
+
+
+def _write_backup(
+    config_dir: Path, backup_dir: Path, name: str
+) -> tuple[Path, ChunkIndex]:
+    """Write a backup archive of a directory like the backup manager does."""
+    archive_path = backup_dir / name
+    with tarfile.open(archive_path, "w:") as archive:
+        backup_json = b'{"slug": "test"}'
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = len(backup_json)
+        archive.addfile(tar_info, io.BytesIO(backup_json))
+        with add_chunked_tar(
+            archive,
+            INNER_TAR_NAME,
+            ChunkIndex.load(backup_dir / "index.json"),
+            backup_dir,
+        ) as core_tar:
+            atomic_contents_add(core_tar, config_dir, ["*.log"], "data")
+
+    index = core_tar.index
+    stat = archive_path.stat()
+    index.archive = name
+    index.archive_size = stat.st_size
+    index.archive_mtime_ns = stat.st_mtime_ns
+    index.save(backup_dir / "index.json")
+    return archive_path, index
+
+
+def _read_backup(archive_path: Path, mode: str) -> dict[str, bytes]:
+    """Return the files in a backup archive."""
+    with tarfile.open(archive_path, "r:") as archive:
+        assert archive.getnames() == ["./backup.json", INNER_TAR_NAME]
+        assert archive.extractfile("./backup.json").read() == b'{"slug": "test"}'
+        inner_data = archive.extractfile(INNER_TAR_NAME).read()
+    files = {}
+    with tarfile.open(fileobj=io.BytesIO(inner_data), mode=mode) as core_tar:
+        for member in core_tar:
+            if member.isfile():
+                files[member.name] = core_tar.extractfile(member).read()
+            else:
+                files[member.name] = b""
+    return files
+
+
+def test_chunked_archive(tmp_path: Path) -> None:
+    """Test chunked archives are plain gzip tar files and reuse chunks."""
+    rng = random.Random(1234)
+    config_dir = tmp_path / "config"
+    backup_dir = tmp_path / "backups"
+    (config_dir / ".storage").mkdir(parents=True)
+    backup_dir.mkdir()
+    expected = {"data": b"", "data/.storage": b""}
+    for idx in range(200):
+        data = rng.randbytes(rng.randint(0, 20000))
+        (config_dir / ".storage" / f"file_{idx}").write_bytes(data)
+        expected[f"data/.storage/file_{idx}"] = data
+    database = rng.randbytes(CHUNK_SIZE * 3 + 1000)
+    (config_dir / "home-assistant_v2.db").write_bytes(database)
+    expected["data/home-assistant_v2.db"] = database
+    (config_dir / "home-assistant.log").write_bytes(b"excluded")
+
+    first_path, first_index = _write_backup(config_dir, backup_dir, "first.tar")
+    for mode in ("r:gz", "r|gz"):
+        assert _read_backup(first_path, mode) == expected
+    assert first_index.files["data/home-assistant_v2.db"].size == len(database)
+
+    # Change a small file and a block of the database
+    changed = b"changed"
+    (config_dir / ".storage" / "file_10").write_bytes(changed)
+    expected["data/.storage/file_10"] = changed
+    database = database[:100] + b"x" + database[101:]
+    with (config_dir / "home-assistant_v2.db").open("r+b") as database_file:
+        database_file.seek(100)
+        database_file.write(b"x")
+    expected["data/home-assistant_v2.db"] = database
+
+    second_path, second_index = _write_backup(config_dir, backup_dir, "second.tar")
+    for mode in ("r:gz", "r|gz"):
+        assert _read_backup(second_path, mode) == expected
+
+    # Only the chunks with the changed file, the database header, the changed
+    # database block and the end of the archive are new
+    reused = set(first_index.chunks) & set(second_index.chunks)
+    assert len(reused) >= len(first_index.chunks) - 4
+    assert (
+        first_index.files["data/home-assistant_v2.db"].digests[1:]
+        == second_index.files["data/home-assistant_v2.db"].digests[1:]
+    )
+
+    # A backup without changes reuses all chunks
+    third_path, third_index = _write_backup(config_dir, backup_dir, "third.tar")
+    assert _read_backup(third_path, "r|gz") == expected
+    assert third_index.chunks.keys() == second_index.chunks.keys()
+
+
+def test_chunked_archive_previous_archive_changed(tmp_path: Path) -> None:
+    """Test chunks are not reused when the previous archive changed."""
+    config_dir = tmp_path / "config"
+    backup_dir = tmp_path / "backups"
+    config_dir.mkdir()
+    backup_dir.mkdir()
+    (config_dir / "configuration.yaml").write_bytes(b"default_config:\n")
+
+    first_path, _ = _write_backup(config_dir, backup_dir, "first.tar")
+    with first_path.open("ab") as first_file:
+        first_file.write(b"\0" * 512)
+    assert ChunkIndex.load(backup_dir / "index.json").open_archive(backup_dir) is None
+
+    second_path, _ = _write_backup(config_dir, backup_dir, "second.tar")
+    assert _read_backup(second_path, "r|gz") == {
+        "data": b"",
+        "data/configuration.yaml": b"default_config:\n",
+    }
+
+
+def test_chunk_index_invalid(tmp_path: Path) -> None:
+    """Test an invalid or missing index is empty."""
+    assert ChunkIndex.load(tmp_path / "missing.json") == ChunkIndex()
+    (tmp_path / "index.json").write_text('{"version": 1, "archive": "a.tar"}')
+    assert ChunkIndex.load(tmp_path / "index.json") == ChunkIndex()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, mock_open, patch
 
 import pytest
 
@@ -34,6 +34,10 @@ async def _mock_backup_generation(manager: BackupManager):
         patch(
             "homeassistant.components.backup.manager.SecureTarFile"
         ) as mocked_tarfile,
+        patch(
+            "homeassistant.components.backup.manager.add_chunked_tar"
+        ) as mocked_add_chunked_tar,
+        patch("pathlib.Path.open", mock_open()),
         patch("pathlib.Path.iterdir", _mock_iterdir),
         patch("pathlib.Path.stat", MagicMock(st_size=123)),
         patch("pathlib.Path.is_file", lambda x: x.name != ".storage"),
@@ -71,6 +75,15 @@ async def _mock_backup_generation(manager: BackupManager):
         assert manager.backup_dir.as_posix() in str(
             mocked_tarfile.call_args_list[0][0][0]
         )
+        outer_tar = mocked_tarfile.return_value.__enter__.return_value
+        assert mocked_add_chunked_tar.call_args[0][:2] == (
+            outer_tar,
+            "./homeassistant.tar.gz",
+        )
+        core_tar = mocked_add_chunked_tar.return_value.__enter__.return_value
+        core_tar.index.save.assert_called_once_with(
+            manager.backup_dir / "chunk_index.json"
+        )
 
 
 async def _setup_mock_domain(
@@ -333,3 +346,43 @@ async def test_loading_platforms_when_running_post_backup_actions(
     assert len(manager.platforms) == 1
 
     assert "Loaded 1 platforms" in caplog.text
+
+
+async def test_generate_backup_with_snapshot(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test generate backup archives snapshots instead of the live files."""
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    snapshot = manager.snapshot_dir / "home-assistant_v2.db"
+    platform = Mock(
+        async_pre_backup=AsyncMock(),
+        async_post_backup=AsyncMock(),
+        async_backup_snapshot=AsyncMock(
+            return_value={
+                "home-assistant_v2.db": snapshot,
+                "home-assistant_v2.db-wal": None,
+            }
+        ),
+    )
+    await _setup_mock_domain(hass, platform)
+
+    with patch(
+        "homeassistant.components.backup.manager.atomic_contents_add"
+    ) as mocked_contents_add:
+        await _mock_backup_generation(manager)
+
+    platform.async_backup_snapshot.assert_awaited_once_with(hass, manager.snapshot_dir)
+    assert not platform.async_pre_backup.called
+    assert not platform.async_post_backup.called
+
+    config_dir = Path(hass.config.path())
+    excludes = mocked_contents_add.call_args.kwargs["excludes"]
+    assert manager.snapshot_dir.as_posix() in excludes
+    assert (config_dir / "home-assistant_v2.db").as_posix() in excludes
+    assert (config_dir / "home-assistant_v2.db-wal").as_posix() in excludes
+    core_tar = mocked_contents_add.call_args.kwargs["tar_file"]
+    core_tar.add.assert_called_once_with(
+        snapshot.as_posix(), arcname="data/home-assistant_v2.db", recursive=False
+    )
@@ -7,6 +7,7 @@ from turbojpeg import TurboJPEG
 
 from homeassistant.components.camera import Image
 from homeassistant.components.camera.img_util import (
+    ScaledImageCache,
     TurboJPEGSingleton,
     find_supported_scaling_factor,
     scale_jpeg_camera_image,
@@ -129,3 +130,24 @@ def test_find_supported_scaling_factor(
         )
         == scaling_factor
     )
+
+
+def test_scaled_image_cache() -> None:
+    """Test the scaled image cache evicts the least recently used images."""
+    cache = ScaledImageCache(max_bytes=10)
+    cache.put((b"a", 4, 3), b"1234")
+    cache.put((b"b", 4, 3), b"5678")
+    assert cache.get((b"a", 4, 3)) == b"1234"
+
+    # Evicts b, which is the least recently used
+    cache.put((b"c", 4, 3), b"90")
+    cache.put((b"d", 4, 3), b"ab")
+    assert cache.get((b"b", 4, 3)) is None
+    assert cache.get((b"a", 4, 3)) == b"1234"
+    assert cache.get((b"c", 4, 3)) == b"90"
+    assert cache.get((b"d", 4, 3)) == b"ab"
+
+    # Images larger than the whole budget are not cached
+    cache.put((b"e", 4, 3), b"0123456789a")
+    assert cache.get((b"e", 4, 3)) is None
+    assert cache.get((b"a", 4, 3)) == b"1234"
@@ -1,5 +1,6 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
@@ -1094,3 +1095,133 @@ async def test_entity_picture_url_changes_on_token_update(hass: HomeAssistant) -
     new_entity_picture = camera_state.attributes["entity_picture"]
     assert new_entity_picture != original_picture
     assert "token=" in new_entity_picture
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_get_image_coalesces_concurrent_requests(hass: HomeAssistant) -> None:
+    """Test concurrent requests for the same image share a single fetch."""
+    release = asyncio.Event()
+
+    async def _slow_camera_image(*args, **kwargs) -> bytes:
+        await release.wait()
+        return b"Shared"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_slow_camera_image,
+    ) as mock_camera_image:
+        requests = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*requests)
+        assert mock_camera_image.call_count == 1
+        assert {image.content for image in images} == {b"Shared"}
+
+        # Without an image cache TTL the next request fetches again
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_get_image_cache_ttl(hass: HomeAssistant) -> None:
+    """Test fetched images are reused for the image cache TTL of the camera."""
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+            return_value=b"Cached",
+        ) as mock_camera_image,
+        patch(
+            "homeassistant.components.camera.Camera.image_cache_ttl",
+            new_callable=PropertyMock(return_value=60),
+        ),
+    ):
+        for _ in range(3):
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Cached"
+        assert mock_camera_image.call_count == 1
+
+        # Different sizes are fetched separately
+        await camera.async_get_image(hass, "camera.demo_camera", width=640, height=480)
+        assert mock_camera_image.call_count == 2
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_still_stream_shared(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test viewers of the same still stream share a single producer."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Frame",
+    ) as mock_camera_image:
+        url = "/api/camera_proxy_stream/camera.demo_camera?interval=60"
+        async with (
+            client.get(url) as first_response,
+            client.get(url) as second_response,
+        ):
+            assert first_response.status == HTTPStatus.OK
+            assert second_response.status == HTTPStatus.OK
+            for response in (first_response, second_response):
+                assert b"Frame" in await response.content.readuntil(b"Frame")
+            assert len(hass.data[camera.DATA_STILL_STREAMS]) == 1
+
+        assert mock_camera_image.call_count == 1
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert hass.data[camera.DATA_STILL_STREAMS] == {}
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_scaled_once_per_frame(hass: HomeAssistant) -> None:
+    """Test a frame is only scaled once per size."""
+    turbo_jpeg = mock_turbo_jpeg(first_width=16, first_height=12)
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch(
+            "homeassistant.components.demo.camera.Path.read_bytes",
+            autospec=True,
+            return_value=b"Valid jpeg",
+        ),
+    ):
+        for _ in range(3):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=4, height=3
+            )
+            assert image.content == EMPTY_8_6_JPEG
+
+    assert turbo_jpeg.scale_with_quality.call_count == 1
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_etag(hass_client: ClientSessionGenerator) -> None:
+    """Test the camera proxy answers conditional requests for unchanged images."""
+    client = await hass_client()
+
+    response = await client.get("/api/camera_proxy/camera.demo_camera")
+    assert response.status == HTTPStatus.OK
+    assert await response.read() == b"Test"
+    etag = response.headers["ETag"]
+
+    response = await client.get(
+        "/api/camera_proxy/camera.demo_camera", headers={"If-None-Match": etag}
+    )
+    assert response.status == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        return_value=b"Changed",
+    ):
+        response = await client.get(
+            "/api/camera_proxy/camera.demo_camera", headers={"If-None-Match": etag}
+        )
+    assert response.status == HTTPStatus.OK
+    assert await response.read() == b"Changed"
+    assert response.headers["ETag"] != etag
@@ -276,6 +276,70 @@ async def test_unexposed_entities_skipped(
     assert result.response.matched_states[0].entity_id == exposed_light.entity_id
 
 
+@pytest.mark.usefixtures("init_components")
+async def test_slot_lists_updated_incrementally(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test entity names are updated per entity instead of rebuilt."""
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(
+        kitchen_light.entity_id, "off", {ATTR_FRIENDLY_NAME: "kitchen light"}
+    )
+    expose_entity(hass, kitchen_light.entity_id, True)
+    calls = async_mock_service(hass, "light", "turn_on")
+
+    result = await conversation.async_converse(
+        hass, "turn on kitchen light", None, Context(), None
+    )
+    assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+    assert len(calls) == 1
+
+    with patch(
+        "homeassistant.components.conversation.default_agent.async_should_expose",
+        wraps=default_agent.async_should_expose,
+    ) as mock_should_expose:
+        # A new entity only checks the exposure of that entity
+        hass.states.async_set(
+            "light.bedroom", "off", {ATTR_FRIENDLY_NAME: "bedroom light"}
+        )
+        await hass.async_block_till_done()
+        result = await conversation.async_converse(
+            hass, "turn on bedroom light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        assert len(calls) == 2
+        assert kitchen_light.entity_id not in {
+            call.args[2] for call in mock_should_expose.call_args_list
+        }
+
+        # Aliases are updated from the entity registry
+        entity_registry.async_update_entity(
+            kitchen_light.entity_id, aliases={"stove light"}
+        )
+        result = await conversation.async_converse(
+            hass, "turn on stove light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        assert len(calls) == 3
+        assert calls[2].data == {"entity_id": [kitchen_light.entity_id]}
+
+        # Renamed entities are matched by their new name
+        hass.states.async_set("light.bedroom", "off", {ATTR_FRIENDLY_NAME: "bed light"})
+        result = await conversation.async_converse(
+            hass, "turn on bed light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
+        assert len(calls) == 4
+
+        # Removed entities are no longer matched
+        hass.states.async_remove("light.bedroom")
+        result = await conversation.async_converse(
+            hass, "turn on bed light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ERROR
+        assert len(calls) == 4
+
+
 @pytest.mark.usefixtures("init_components")
 async def test_trigger_sentences(hass: HomeAssistant) -> None:
     """Test registering/unregistering/matching a few trigger sentences."""
@@ -1110,6 +1110,24 @@ async def test_service_group_set_group_remove_group(hass: HomeAssistant) -> None
     assert group_state is None
 
 
+async def test_groups_with_entity(hass: HomeAssistant) -> None:
+    """Test finding groups with an entity after the members changed."""
+    assert await async_setup_component(hass, "group", {"group": {}})
+
+    common.async_set_group(hass, "user_test_group", entity_ids=["light.bowl"])
+    await hass.async_block_till_done()
+    assert group.groups_with_entity(hass, "light.bowl") == ["group.user_test_group"]
+
+    common.async_set_group(hass, "user_test_group", entity_ids=["light.ceiling"])
+    await hass.async_block_till_done()
+    assert group.groups_with_entity(hass, "light.bowl") == []
+    assert group.groups_with_entity(hass, "light.ceiling") == ["group.user_test_group"]
+
+    common.async_remove(hass, "user_test_group")
+    await hass.async_block_till_done()
+    assert group.groups_with_entity(hass, "light.ceiling") == []
+
+
 async def test_group_order(hass: HomeAssistant) -> None:
     """Test that order gets incremented when creating a new group."""
     hass.states.async_set("light.bowl", STATE_ON)
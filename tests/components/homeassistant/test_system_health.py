@@ -0,0 +1,25 @@
+"""Test Home Assistant Core system health."""
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import service
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_target_resolution_cache(hass: HomeAssistant) -> None:
+    """Test the target resolution cache hit rate is reported."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+    info = await get_system_health_info(hass, "homeassistant")
+    assert "target_resolution_cache" not in info
+
+    call = ServiceCall("light", "turn_on", {"area_id": "kitchen"})
+    for _ in range(4):
+        service.async_extract_referenced_entity_ids(hass, call)
+
+    info = await get_system_health_info(hass, "homeassistant")
+    assert info["target_resolution_cache"] == (
+        "1 cached, 3 hits, 1 misses, 75% hit rate"
+    )
@@ -7,6 +7,8 @@ import pytest
 from homeassistant.components.modbus.const import (
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
+    CONF_BLOCK_READ_MAX_GAP,
+    CONF_BLOCK_READ_MAX_REGISTERS,
     CONF_DATA_TYPE,
     CONF_DEVICE_ADDRESS,
     CONF_INPUT_TYPE,
@@ -49,7 +51,7 @@ from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
 
-from .conftest import TEST_ENTITY_NAME, ReadResult
+from .conftest import TEST_ENTITY_NAME, ReadResult, do_next_cycle
 
 from tests.common import mock_restore_cache_with_extra_data
 
@@ -1334,6 +1336,53 @@ async def test_wrap_sensor(hass: HomeAssistant, mock_do_cycle, expected) -> None
     assert hass.states.get(ENTITY_ID).state == expected
 
 
+@pytest.mark.parametrize(
+    "do_config",
+    [
+        {
+            CONF_BLOCK_READ_MAX_GAP: 1,
+            CONF_BLOCK_READ_MAX_REGISTERS: 125,
+            CONF_SENSORS: [
+                {
+                    CONF_NAME: f"{TEST_ENTITY_NAME} {address}",
+                    CONF_ADDRESS: address,
+                    CONF_DATA_TYPE: data_type,
+                    CONF_SCAN_INTERVAL: 10,
+                }
+                for address, data_type in (
+                    (100, DataType.UINT16),
+                    (101, DataType.UINT32),
+                    (104, DataType.UINT16),
+                    (110, DataType.UINT16),
+                )
+            ],
+        },
+    ],
+)
+@pytest.mark.parametrize("register_words", [[0x0001, 0x0002, 0x0003, 0x0004, 0x0005]])
+async def test_block_read_sensor(
+    hass: HomeAssistant, mock_do_cycle, mock_pymodbus
+) -> None:
+    """Run test for sensors sharing block reads."""
+    assert hass.states.get(f"{ENTITY_ID}_100").state == "1"
+    assert hass.states.get(f"{ENTITY_ID}_101").state == "131075"
+    assert hass.states.get(f"{ENTITY_ID}_104").state == "5"
+    # Register 110 is more than the max gap away and read on its own
+    assert hass.states.get(f"{ENTITY_ID}_110").state == "1"
+
+    reads = [
+        call.args
+        for call in mock_pymodbus.read_holding_registers.call_args_list
+        if call.args[0] != 9999
+    ]
+    assert reads == [(100, 5), (110, 1)]
+
+    mock_pymodbus.read_holding_registers.reset_mock()
+    await do_next_cycle(hass, mock_do_cycle, 10)
+    reads = [call.args for call in mock_pymodbus.read_holding_registers.call_args_list]
+    assert reads == [(100, 5), (110, 1)]
+
+
 @pytest.fixture(name="mock_restore")
 async def mock_restore(hass):
     """Mock restore cache."""
@@ -2,11 +2,14 @@
 
 import asyncio
 import copy
+import hashlib
 import json
 from pathlib import Path
 import re
+from typing import Any
 from unittest.mock import AsyncMock, call, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import config_entries
@@ -15,7 +18,10 @@ from homeassistant.components.mqtt.abbreviations import (
     ABBREVIATIONS,
     DEVICE_ABBREVIATIONS,
 )
+from homeassistant.components.mqtt.client import DISCOVERY_COOLDOWN
 from homeassistant.components.mqtt.discovery import (
+    DISCOVERY_CACHE_SAVE_DELAY,
+    DISCOVERY_CACHE_STORAGE_KEY,
     MQTT_DISCOVERY_DONE,
     MQTT_DISCOVERY_NEW,
     MQTT_DISCOVERY_UPDATED,
@@ -38,8 +44,10 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads_object
 from homeassistant.util.signal_type import SignalTypeFormat
 
 from .conftest import ENTRY_DEFAULT_BIRTH_MESSAGE
@@ -49,6 +57,7 @@ from tests.common import (
     MockConfigEntry,
     async_capture_events,
     async_fire_mqtt_message,
+    async_fire_time_changed,
     mock_config_flow,
     mock_platform,
 )
@@ -222,6 +231,200 @@ async def test_correct_config_discovery(
     assert ("binary_sensor", "bla") in hass.data["mqtt"].discovery_already_discovered
 
 
+async def test_discovery_config_reused_after_reload(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test an unchanged discovery payload is not validated again."""
+    await mqtt_mock_entry()
+    entry = hass.config_entries.async_entries(mqtt.DOMAIN)[0]
+    topic = "homeassistant/sensor/bla/config"
+    payload = '{ "~": "some/base", "name": "Beer", "stat_t": "~/state" }'
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object",
+        wraps=json_loads_object,
+    ) as json_loads_mock:
+        async_fire_mqtt_message(hass, topic, payload)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.beer") is not None
+        config = hass.data["mqtt"].discovery_cache[topic].config
+        assert config is not None
+
+        # The broker sends the retained discovery messages after reloading
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        async_fire_mqtt_message(hass, topic, payload)
+        await hass.async_block_till_done()
+
+    assert json_loads_mock.call_count == 1
+    assert hass.data["mqtt"].discovery_cache[topic].config is config
+    async_fire_mqtt_message(hass, "some/base/state", "21")
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.beer")
+    assert state is not None
+    assert state.state == "21"
+
+    async_fire_mqtt_message(hass, topic, "")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.beer") is None
+    assert topic not in hass.data["mqtt"].discovery_cache
+
+
+def _sha256(payload: str) -> str:
+    """Return the hash of a discovery payload."""
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def test_discovery_cache_stored(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test normalized discovery payloads are stored and used after a restart."""
+    topic = "homeassistant/sensor/bla/config"
+    payload = '{ "~": "some/base", "name": "Beer", "stat_t": "~/state" }'
+    hass_storage[DISCOVERY_CACHE_STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": DISCOVERY_CACHE_STORAGE_KEY,
+        "data": {
+            topic: {
+                "hash": _sha256(payload),
+                "payload": {
+                    "name": "Beer",
+                    "state_topic": "some/base/state",
+                    "platform": "mqtt",
+                },
+            }
+        },
+    }
+    await mqtt_mock_entry()
+
+    with patch(
+        "homeassistant.components.mqtt.discovery.json_loads_object",
+        wraps=json_loads_object,
+    ) as json_loads_mock:
+        async_fire_mqtt_message(hass, topic, payload)
+        await hass.async_block_till_done()
+    assert json_loads_mock.call_count == 0
+    async_fire_mqtt_message(hass, "some/base/state", "21")
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.beer")
+    assert state is not None
+    assert state.state == "21"
+
+    # A changed payload is normalized and stored
+    new_payload = '{ "~": "other/base", "name": "Beer", "stat_t": "~/state" }'
+    async_fire_mqtt_message(hass, topic, new_payload)
+    await hass.async_block_till_done()
+    freezer.tick(DISCOVERY_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[DISCOVERY_CACHE_STORAGE_KEY]["data"] == {
+        topic: {
+            "hash": _sha256(new_payload),
+            "payload": {
+                "name": "Beer",
+                "state_topic": "other/base/state",
+                "platform": "mqtt",
+            },
+        }
+    }
+
+    # A removed discovery payload is removed from the store
+    async_fire_mqtt_message(hass, topic, "")
+    await hass.async_block_till_done()
+    freezer.tick(DISCOVERY_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[DISCOVERY_CACHE_STORAGE_KEY]["data"] == {}
+
+
+async def test_discovery_cache_pruned(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test stored payloads of topics which are not received again are removed."""
+    topic = "homeassistant/sensor/bla/config"
+    stale_topic = "homeassistant/sensor/removed/config"
+    payload = '{ "name": "Beer", "state_topic": "some/state" }'
+    stored_payload = {
+        "name": "Beer",
+        "state_topic": "some/state",
+        "platform": "mqtt",
+    }
+    hass_storage[DISCOVERY_CACHE_STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": DISCOVERY_CACHE_STORAGE_KEY,
+        "data": {
+            topic: {"hash": _sha256(payload), "payload": stored_payload},
+            stale_topic: {"hash": _sha256("removed"), "payload": stored_payload},
+        },
+    }
+    await mqtt_mock_entry()
+
+    async_fire_mqtt_message(hass, topic, payload)
+    await hass.async_block_till_done()
+    freezer.tick(DISCOVERY_COOLDOWN - 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    # Discovery has not settled yet
+    async_fire_mqtt_message(hass, topic, payload)
+    await hass.async_block_till_done()
+    freezer.tick(2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert stale_topic in hass.data["mqtt"].discovery_cache
+
+    freezer.tick(DISCOVERY_COOLDOWN)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert stale_topic not in hass.data["mqtt"].discovery_cache
+    freezer.tick(DISCOVERY_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[DISCOVERY_CACHE_STORAGE_KEY]["data"] == {
+        topic: {"hash": _sha256(payload), "payload": stored_payload}
+    }
+
+
+async def test_discovered_entities_added_together(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test entities discovered by a burst of messages are added together."""
+    with patch.object(
+        EntityPlatform,
+        "_async_schedule_add_entities_for_entry",
+        autospec=True,
+        side_effect=EntityPlatform._async_schedule_add_entities_for_entry,
+    ) as add_entities_mock:
+        await mqtt_mock_entry()
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/sensor/first/config",
+            '{ "name": "First", "state_topic": "test-topic" }',
+        )
+        await hass.async_block_till_done()
+        add_entities_mock.reset_mock()
+
+        for name in ("second", "third", "fourth"):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/sensor/{name}/config",
+                f'{{ "name": "{name}", "state_topic": "test-topic" }}',
+            )
+        await hass.async_block_till_done()
+
+    assert len(add_entities_mock.mock_calls) == 1
+    assert len(add_entities_mock.mock_calls[0].args[1]) == 3
+    for name in ("first", "second", "third", "fourth"):
+        assert hass.states.get(f"sensor.{name}") is not None
+
+
 async def test_discovery_integration_info(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -36,10 +36,12 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockConfigEntry,
@@ -219,6 +221,53 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+async def test_value_template_shares_decoded_json(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test value templates of all subscribers decode a JSON payload once."""
+    await mqtt_mock_entry()
+    rendered: list[ReceivePayloadType] = []
+    templates = [
+        mqtt.MqttValueTemplate(
+            template.Template(f"{{{{ value_json.{key} }}}}"), hass=hass
+        )
+        for key in ("battery", "linkquality", "temperature")
+    ]
+
+    @callback
+    def _render(msg: ReceiveMessage) -> None:
+        rendered.extend(
+            tpl.async_render_with_possible_json_value(msg.payload) for tpl in templates
+        )
+
+    for _ in templates:
+        await mqtt.async_subscribe(hass, "zigbee2mqtt/sensor", _render)
+
+    with patch(
+        "homeassistant.components.mqtt.models.json_loads", wraps=json_loads
+    ) as mock_json_loads:
+        async_fire_mqtt_message(
+            hass,
+            "zigbee2mqtt/sensor",
+            '{"battery": 100, "linkquality": 120, "temperature": 21.5}',
+        )
+        await hass.async_block_till_done()
+
+    assert rendered == ["100", "120", "21.5"] * 3
+    assert mock_json_loads.call_count == 1
+
+    # Payloads that are not JSON are not decoded again either
+    rendered.clear()
+    with patch("homeassistant.helpers.template.json_loads") as mock_template_loads:
+        async_fire_mqtt_message(hass, "zigbee2mqtt/sensor", "offline")
+        await hass.async_block_till_done()
+    assert rendered == ["offline"] * 9
+    assert not mock_template_loads.called
+
+    # Rendering outside of a received message still decodes the payload
+    assert templates[0].async_render_with_possible_json_value('{"battery": 50}') == "50"
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -1,11 +1,16 @@
 """Test backup platform for the Recorder integration."""
 
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.backup import async_post_backup, async_pre_backup
+from homeassistant.components.recorder.backup import (
+    async_backup_snapshot,
+    async_post_backup,
+    async_pre_backup,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
@@ -70,3 +75,56 @@ async def test_async_post_backup_failure(
     ):
         await async_post_backup(hass)
     assert unlock_mock.called
+
+
+async def test_async_backup_snapshot(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test backup snapshot of a database in the configuration directory."""
+    hass.config.config_dir = str(tmp_path)
+    snapshot_dir = tmp_path / "backups" / "snapshot"
+    with (
+        patch.object(
+            recorder_mock, "db_url", f"sqlite:///{tmp_path}/home-assistant_v2.db"
+        ),
+        patch(
+            "homeassistant.components.recorder.core.Recorder.async_snapshot_database",
+            return_value=True,
+        ) as snapshot_mock,
+    ):
+        assert await async_backup_snapshot(hass, snapshot_dir) == {
+            "home-assistant_v2.db": snapshot_dir / "home-assistant_v2.db",
+            "home-assistant_v2.db-wal": None,
+            "home-assistant_v2.db-shm": None,
+        }
+    snapshot_mock.assert_called_once_with(
+        (snapshot_dir / "home-assistant_v2.db").as_posix()
+    )
+
+
+async def test_async_backup_snapshot_outside_config(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test no snapshot of a database outside the configuration directory."""
+    with (
+        patch.object(recorder_mock, "db_url", f"sqlite:///{tmp_path}/other.db"),
+        patch(
+            "homeassistant.components.recorder.core.Recorder.async_snapshot_database",
+        ) as snapshot_mock,
+    ):
+        assert await async_backup_snapshot(hass, tmp_path / "snapshot") == {}
+    assert not snapshot_mock.called
+
+
+async def test_async_backup_snapshot_with_migration(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test backup snapshot with migration."""
+    with (
+        patch(
+            "homeassistant.components.recorder.backup.async_migration_in_progress",
+            return_value=True,
+        ),
+        pytest.raises(HomeAssistantError),
+    ):
+        await async_backup_snapshot(hass, tmp_path / "snapshot")
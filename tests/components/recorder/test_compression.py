@@ -0,0 +1,231 @@
+"""The tests for the recorder state compression."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.compression import (
+    CompressionPolicy,
+    StateCompressor,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+
+async def _async_set_states(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entity_id: str,
+    states: list[str],
+    attributes: dict[str, str] | None = None,
+) -> list[tuple[str, float]]:
+    """Set states a second apart and return the recorded states."""
+    start = dt_util.utcnow()
+    for state in states:
+        hass.states.async_set(entity_id, state, attributes)
+        freezer.tick(timedelta(seconds=1))
+    await async_wait_recording_done(hass)
+
+    hist = history.state_changes_during_period(
+        hass, start - timedelta(seconds=1), entity_id=entity_id
+    )
+    return [
+        (state.state, (state.last_updated - start).total_seconds())
+        for state in hist[entity_id]
+    ]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"compression": {"entities": {"sensor.power": {"absolute_deadband": 5}}}}],
+)
+async def test_absolute_deadband(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states within the deadband are held back until a real change."""
+    recorded = await _async_set_states(
+        hass,
+        freezer,
+        "sensor.power",
+        ["100", "101", "104", "103", "110", "112", STATE_UNAVAILABLE, "50"],
+    )
+    assert recorded == [
+        ("100", 0),
+        ("103", 3),
+        ("110", 4),
+        ("112", 5),
+        (STATE_UNAVAILABLE, 6),
+        ("50", 7),
+    ]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [
+        {
+            "compression": {
+                "device_classes": {
+                    "voltage": {"relative_deadband": 1, "max_interval": 3}
+                }
+            }
+        }
+    ],
+)
+async def test_relative_deadband_for_device_class(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a device class policy with a relative deadband and a heartbeat."""
+    recorded = await _async_set_states(
+        hass,
+        freezer,
+        "sensor.voltage",
+        ["230", "231", "232", "231.5", "229", "230", "226"],
+        {"device_class": "voltage"},
+    )
+    assert recorded == [
+        ("230", 0),
+        ("232", 2),
+        ("231.5", 3),
+        ("229", 4),
+        ("230", 5),
+        ("226", 6),
+    ]
+
+    recorded = await _async_set_states(
+        hass, freezer, "sensor.current", ["10", "10.01"], {"device_class": "current"}
+    )
+    assert recorded == [("10", 0), ("10.01", 1)]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"compression": {"entities": {"sensor.energy": {"swinging_door": 0.5}}}}],
+)
+async def test_swinging_door(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states on a trend are held back."""
+    recorded = await _async_set_states(
+        hass,
+        freezer,
+        "sensor.energy",
+        ["0", "1", "2", "3", "3.1", "3.2", "10", STATE_UNAVAILABLE],
+    )
+    assert recorded == [
+        ("0", 0),
+        ("3", 3),
+        ("3.2", 5),
+        ("10", 6),
+        (STATE_UNAVAILABLE, 7),
+    ]
+
+
+@pytest.mark.parametrize(
+    "recorder_config",
+    [{"compression": {"entities": {"sensor.power": {"absolute_deadband": 5}}}}],
+)
+async def test_attribute_change_is_recorded(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a state with changed attributes is always recorded."""
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "100", {"friendly_name": "Power"})
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.power", "101", {"friendly_name": "Power"})
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.power", "102", {"friendly_name": "Power meter"})
+    await async_wait_recording_done(hass)
+
+    hist = history.state_changes_during_period(
+        hass, start - timedelta(seconds=1), entity_id="sensor.power"
+    )
+    assert [state.state for state in hist["sensor.power"]] == ["100", "101", "102"]
+
+
+async def test_flush_links_to_recorded_state(hass: HomeAssistant) -> None:
+    """Test held back states are flushed with the last recorded state as old state."""
+    queued: list[Event] = []
+    compressor = StateCompressor(
+        {"sensor.power": CompressionPolicy(absolute_deadband=5)}, {}, queued.append
+    )
+    hass.bus.async_listen(MATCH_ALL, compressor.async_put)
+
+    for state in ("100", "101", "102"):
+        hass.states.async_set("sensor.power", state)
+    hass.bus.async_fire("other_event")
+    await hass.async_block_till_done()
+
+    assert [event.event_type for event in queued] == [
+        EVENT_STATE_CHANGED,
+        "other_event",
+    ]
+    recorded_state = queued[0].data["new_state"]
+    assert recorded_state.state == "100"
+
+    compressor.async_flush()
+    assert len(queued) == 3
+    assert queued[2].data["new_state"].state == "102"
+    assert queued[2].data["old_state"] is recorded_state
+
+    compressor.async_flush()
+    assert len(queued) == 3
+
+
+async def test_swinging_door_narrowed_within_deadband(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states within the deadband narrow the swinging door."""
+    queued: list[Event] = []
+    compressor = StateCompressor(
+        {"sensor.energy": CompressionPolicy(absolute_deadband=1, swinging_door=0.5)},
+        {},
+        queued.append,
+    )
+    hass.bus.async_listen(EVENT_STATE_CHANGED, compressor.async_put)
+
+    for state in ("0", "1", "0", "3"):
+        hass.states.async_set("sensor.energy", state)
+        freezer.tick(timedelta(seconds=1))
+    await hass.async_block_till_done()
+    compressor.async_flush()
+
+    assert [
+        (
+            event.data["new_state"].state,
+            event.data["new_state"].last_updated_timestamp
+            - queued[0].data["new_state"].last_updated_timestamp,
+        )
+        for event in queued
+    ] == [("0", 0), ("0", 2), ("3", 3)]
+
+
+async def test_swinging_door_without_elapsed_time(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test states outside the deadband without elapsed time are recorded."""
+    queued: list[Event] = []
+    compressor = StateCompressor(
+        {"sensor.energy": CompressionPolicy(swinging_door=0.5)}, {}, queued.append
+    )
+    hass.bus.async_listen(EVENT_STATE_CHANGED, compressor.async_put)
+
+    hass.states.async_set("sensor.energy", "0")
+    hass.states.async_set("sensor.energy", "5")
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.energy", "6")
+    hass.states.async_set("sensor.energy", "10")
+    await hass.async_block_till_done()
+
+    assert [event.data["new_state"].state for event in queued] == [
+        "0",
+        "5",
+        "6",
+        "10",
+    ]
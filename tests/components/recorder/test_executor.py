@@ -0,0 +1,199 @@
+"""The tests for the recorder database executor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event as sqlalchemy_event, text
+
+from homeassistant.components.recorder import executor as recorder_executor
+from homeassistant.components.recorder.const import DBJobPriority
+from homeassistant.components.recorder.executor import (
+    DBJobScheduler,
+    track_db_job_connection,
+    untrack_db_job_connection,
+)
+from homeassistant.core import HomeAssistant
+
+
+@pytest.fixture(name="executor")
+def executor_fixture() -> Generator[ThreadPoolExecutor]:
+    """Return an executor for database jobs."""
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+async def test_jobs_start_in_priority_order(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test waiting jobs start in order of their priority."""
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+    release = threading.Event()
+    started: list[DBJobPriority] = []
+
+    blocking = scheduler.async_add_job(DBJobPriority.BACKGROUND, release.wait)
+    jobs = [
+        scheduler.async_add_job(priority, started.append, priority)
+        for priority in (
+            DBJobPriority.BACKGROUND,
+            DBJobPriority.INTEGRATION,
+            DBJobPriority.INTERACTIVE,
+        )
+    ]
+    stats = scheduler.async_stats()
+    assert stats[DBJobPriority.BACKGROUND]["running"] == 1
+    assert stats[DBJobPriority.BACKGROUND]["queued"] == 1
+    assert stats[DBJobPriority.INTERACTIVE]["queued"] == 1
+
+    release.set()
+    assert await blocking is True
+    await asyncio.gather(*jobs)
+    assert started == [
+        DBJobPriority.INTERACTIVE,
+        DBJobPriority.INTEGRATION,
+        DBJobPriority.BACKGROUND,
+    ]
+    stats = scheduler.async_stats()
+    assert stats[DBJobPriority.BACKGROUND]["queue_wait"]["buckets"]["le_0.001"] >= 1
+    assert sum(stats[DBJobPriority.INTERACTIVE]["queue_wait"]["buckets"].values()) == 1
+
+
+async def test_running_jobs_limited_per_priority(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test a priority can not occupy all workers."""
+    scheduler = DBJobScheduler(hass.loop, executor, 2, {DBJobPriority.BACKGROUND: 1})
+    release = threading.Event()
+
+    background = [
+        scheduler.async_add_job(DBJobPriority.BACKGROUND, release.wait)
+        for _ in range(2)
+    ]
+    assert scheduler.async_stats()[DBJobPriority.BACKGROUND]["queued"] == 1
+
+    assert await scheduler.async_add_job(DBJobPriority.INTERACTIVE, lambda: 42) == 42
+
+    release.set()
+    assert await asyncio.gather(*background) == [True, True]
+
+
+async def test_job_exception(hass: HomeAssistant, executor: ThreadPoolExecutor) -> None:
+    """Test the exception of a job is raised to the caller."""
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+
+    def _raise() -> None:
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError, match="broken"):
+        await scheduler.async_add_job(DBJobPriority.INTERACTIVE, _raise)
+    assert await scheduler.async_add_job(DBJobPriority.INTERACTIVE, lambda: 1) == 1
+
+
+async def test_cancel_waiting_job(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test a cancelled job that is waiting never runs."""
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+    release = threading.Event()
+    started: list[str] = []
+
+    blocking = scheduler.async_add_job(DBJobPriority.INTERACTIVE, release.wait)
+    cancelled = scheduler.async_add_job(
+        DBJobPriority.INTERACTIVE, started.append, "cancelled"
+    )
+    queued = scheduler.async_add_job(
+        DBJobPriority.INTERACTIVE, started.append, "queued"
+    )
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert scheduler.async_stats()[DBJobPriority.INTERACTIVE]["queued"] == 1
+
+    release.set()
+    await asyncio.gather(blocking, queued)
+    assert started == ["queued"]
+
+
+async def test_cancel_running_job_interrupts_query(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test cancelling a running job interrupts its query."""
+    engine = create_engine("sqlite://")
+    sqlalchemy_event.listen(engine, "before_cursor_execute", track_db_job_connection)
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+    query_started = threading.Event()
+    query_interrupted = threading.Event()
+
+    def _endless_query() -> None:
+        with engine.connect() as conn:
+            query_started.set()
+            try:
+                conn.execute(
+                    text(
+                        "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1"
+                        " FROM c) SELECT count(*) FROM c"
+                    )
+                )
+            except Exception as err:
+                if isinstance(err.__cause__, sqlite3.OperationalError):
+                    query_interrupted.set()
+                raise
+
+    job = scheduler.async_add_job(DBJobPriority.INTERACTIVE, _endless_query)
+    await hass.async_add_executor_job(query_started.wait)
+    # The connection is tracked once the statement is executed
+    await asyncio.sleep(0.1)
+    job.cancel()
+
+    assert await hass.async_add_executor_job(query_interrupted.wait, 5)
+    assert await scheduler.async_add_job(DBJobPriority.INTERACTIVE, lambda: 1) == 1
+    engine.dispose()
+
+
+async def test_connection_untracked_on_checkin(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test the connection of a job is forgotten when it is returned to the pool."""
+    engine = create_engine("sqlite://")
+    sqlalchemy_event.listen(engine, "before_cursor_execute", track_db_job_connection)
+    sqlalchemy_event.listen(engine, "checkin", untrack_db_job_connection)
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+
+    def _query() -> tuple[bool, bool]:
+        job = recorder_executor._current_job.job
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            tracked = job.dbapi_connection is not None
+        return tracked, job.dbapi_connection is None
+
+    assert await scheduler.async_add_job(DBJobPriority.INTERACTIVE, _query) == (
+        True,
+        True,
+    )
+    engine.dispose()
+
+
+async def test_shutdown_fails_waiting_jobs(
+    hass: HomeAssistant, executor: ThreadPoolExecutor
+) -> None:
+    """Test jobs that are still waiting fail when the scheduler is shut down."""
+    scheduler = DBJobScheduler(hass.loop, executor, 1, {})
+    release = threading.Event()
+
+    running = scheduler.async_add_job(DBJobPriority.INTERACTIVE, release.wait)
+    waiting = scheduler.async_add_job(DBJobPriority.BACKGROUND, lambda: 1)
+    scheduler.async_shutdown()
+
+    with pytest.raises(RuntimeError, match="shut down"):
+        await waiting
+    with pytest.raises(RuntimeError, match="shut down"):
+        await scheduler.async_add_job(DBJobPriority.INTERACTIVE, lambda: 1)
+    assert scheduler.async_stats()[DBJobPriority.BACKGROUND]["queued"] == 0
+
+    release.set()
+    assert await running is True
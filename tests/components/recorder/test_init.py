@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Generator
+import contextlib
 from datetime import datetime, timedelta
+from pathlib import Path
 import sqlite3
 import threading
 from typing import Any, cast
@@ -60,7 +62,7 @@ from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
     states_meta as states_meta_table_manager,
 )
-from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.recorder.util import dburl_to_path, session_scope
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_CLOSE,
@@ -1853,6 +1855,42 @@ async def test_database_lock_and_unlock(
     assert len(db_events) == 1
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_database_snapshot(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test a database snapshot has what was recorded and writes continue."""
+    await async_setup_recorder_instance(hass, {recorder.CONF_COMMIT_INTERVAL: 0})
+    await hass.async_block_till_done()
+    instance = get_instance(hass)
+    event_types = ("EVENT_TEST",)
+
+    def _count_events(dbpath: str) -> int:
+        with contextlib.closing(sqlite3.connect(dbpath)) as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM events INNER JOIN event_types"
+                " ON events.event_type_id = event_types.event_type_id"
+                " WHERE event_types.event_type = ?",
+                event_types,
+            ).fetchone()[0]
+
+    hass.bus.async_fire("EVENT_TEST")
+    snapshot = tmp_path / "snapshot.db"
+    assert await instance.async_snapshot_database(str(snapshot))
+    assert await hass.async_add_executor_job(_count_events, str(snapshot)) == 1
+
+    # The database is not locked while or after taking the snapshot
+    hass.bus.async_fire("EVENT_TEST")
+    await async_wait_recording_done(hass)
+    database = dburl_to_path(instance.db_url)
+    assert await hass.async_add_executor_job(_count_events, database) == 2
+    assert await hass.async_add_executor_job(_count_events, str(snapshot)) == 1
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
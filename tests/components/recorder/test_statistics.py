@@ -5,10 +5,15 @@ from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder import Recorder, history, migration, statistics
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -30,6 +35,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import StatisticsRollupRebuildTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -1824,6 +1830,258 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_rollup_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test daily and monthly statistics match the reduced hourly statistics."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_active
+
+    zero = dt_util.utcnow()
+    # Cross a daylight saving time change and a month boundary
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-29 00:00:00"))
+    days = 5
+    mean_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour % 7,
+            "min": hour % 7 - 1,
+            "max": hour % 7 + 1,
+        }
+        for hour in range(24 * days)
+    ]
+    sum_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(24 * days)
+    ]
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "test",
+            "statistic_id": "test:temperature",
+            "unit_of_measurement": "°C",
+        },
+        mean_statistics,
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        sum_statistics,
+    )
+    await async_wait_recording_done(hass)
+
+    def _get_stats() -> dict[str, dict[str, list[dict]]]:
+        return {
+            period: statistics_during_period(
+                hass,
+                zero,
+                period=period,
+                types={"change", "last_reset", "max", "mean", "min", "state", "sum"},
+            )
+            for period in ("day", "month")
+        }
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDay).count() == 2 * days
+        assert session.query(StatisticsMonth).count() == 2 * 2
+
+    rollup_stats = _get_stats()
+    assert len(rollup_stats["day"]["test:temperature"]) == days
+    assert len(rollup_stats["month"]["test:total_energy_import"]) == 2
+    instance.statistics_rollups_active = False
+    reduced_stats = _get_stats()
+    for period, stats in rollup_stats.items():
+        assert stats.keys() == reduced_stats[period].keys()
+        for statistic_id, rows in stats.items():
+            assert rows == [
+                pytest.approx(row) for row in reduced_stats[period][statistic_id]
+            ]
+
+    # Rebuild the daily and monthly statistics from the hourly statistics
+    with patch.object(migration, "STATISTICS_ROLLUP_BATCH", timedelta(days=1)):
+        instance.queue_task(StatisticsRollupRebuildTask())
+        # Each run compiles one day and queues the next run
+        for _ in range(days + 1):
+            await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_active
+    assert _get_stats() == rollup_stats
+
+
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_merge_rollup_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiled hours merged into days and months match compiled days and months."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+
+    # Cross a day and a month boundary in the configured time zone
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-31 20:00:00"))
+    hours = 6
+    # Import an hour earlier in the month to add the metadata
+    for metadata, stat in (
+        (
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": "Temperature",
+                "source": "test",
+                "statistic_id": "test:temperature",
+                "unit_of_measurement": "°C",
+            },
+            {"start": start - timedelta(days=7), "mean": 3, "min": 2, "max": 4},
+        ),
+        (
+            {
+                "has_mean": False,
+                "has_sum": True,
+                "name": "Total imported energy",
+                "source": "test",
+                "statistic_id": "test:total_energy_import",
+                "unit_of_measurement": "kWh",
+            },
+            {
+                "start": start - timedelta(days=7),
+                "last_reset": None,
+                "state": 0,
+                "sum": 0,
+            },
+        ),
+    ):
+        async_add_external_statistics(hass, metadata, [stat])
+    await async_wait_recording_done(hass)
+    metadata = get_metadata(
+        hass, statistic_ids={"test:temperature", "test:total_energy_import"}
+    )
+    mean_metadata_id = metadata["test:temperature"][0]
+    sum_metadata_id = metadata["test:total_energy_import"][0]
+
+    with session_scope(hass=hass) as session:
+        for idx in range(hours * 12):
+            five_minutes = start + timedelta(minutes=5 * idx)
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    mean_metadata_id,
+                    {
+                        "start": five_minutes,
+                        # An hour without a mean doesn't count for the mean
+                        "mean": None if idx // 12 == 2 else idx % 7,
+                        "min": idx % 7 - 1,
+                        "max": idx % 7 + 1,
+                    },
+                )
+            )
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    sum_metadata_id,
+                    {
+                        "start": five_minutes,
+                        "last_reset": None,
+                        "state": idx,
+                        "sum": idx * 2,
+                    },
+                )
+            )
+
+    for hour in range(hours):
+        do_adhoc_statistics(hass, start=start + timedelta(hours=hour, minutes=55))
+    await async_wait_recording_done(hass)
+
+    def _get_rollup_rows() -> list[tuple]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return sorted(
+                (
+                    table.__tablename__,
+                    row.metadata_id,
+                    row.start_ts,
+                    row.mean,
+                    row.min,
+                    row.max,
+                    row.mean_count,
+                    row.last_reset_ts,
+                    row.state,
+                    row.sum,
+                )
+                for table in (StatisticsDay, StatisticsMonth)
+                for row in session.query(table)
+            )
+
+    merged_rows = _get_rollup_rows()
+    assert len(merged_rows) == 2 * 3 + 2 * 2
+
+    with session_scope(hass=hass) as session:
+        statistics.compile_rollup_statistics(
+            session,
+            start.timestamp(),
+            (start + timedelta(hours=hours)).timestamp(),
+        )
+    compiled_rows = _get_rollup_rows()
+    assert len(compiled_rows) == len(merged_rows)
+    for merged_row, compiled_row in zip(merged_rows, compiled_rows, strict=True):
+        assert merged_row == pytest.approx(compiled_row)
+
+
+async def test_import_statistics_rollup_error(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test imported statistics are kept if compiling the rollups fails."""
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-10-29 00:00:00"))
+    with (
+        patch.object(
+            statistics,
+            "compile_rollup_statistics",
+            side_effect=SQLAlchemyError("Mock error"),
+        ),
+        patch(
+            "homeassistant.components.recorder.tasks.StatisticsRollupRebuildTask"
+        ) as rebuild_task,
+    ):
+        async_add_external_statistics(
+            hass,
+            {
+                "has_mean": True,
+                "has_sum": False,
+                "name": "Temperature",
+                "source": "test",
+                "statistic_id": "test:temperature",
+                "unit_of_measurement": "°C",
+            },
+            [{"start": start, "mean": 1, "min": 0, "max": 2}],
+        )
+        await async_wait_recording_done(hass)
+
+    assert "Error compiling daily and monthly statistics for test:temperature" in (
+        caplog.text
+    )
+    rebuild_task.assert_called_once_with()
+    stats = statistics_during_period(hass, start, period="hour")
+    assert stats["test:temperature"][0]["mean"] == pytest.approx(1)
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -35,7 +35,10 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "database_jobs": ANY,
     }
+    assert info["database_jobs"].startswith("interactive: 0/4 busy, 0 queued,")
+    assert "background: 0/1 busy" in info["database_jobs"]
 
 
 @pytest.mark.parametrize(
@@ -64,6 +67,7 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "database_jobs": ANY,
     }
 
 
@@ -99,6 +103,7 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "database_jobs": ANY,
     }
 
 
@@ -127,4 +132,5 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "database_jobs": ANY,
     }
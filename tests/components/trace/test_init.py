@@ -0,0 +1,37 @@
+"""Test the trace memory budget."""
+
+from homeassistant.components.trace import TraceMemoryBudget
+
+
+def test_budget_serializes_first_finished() -> None:
+    """Test the traces which are not serialized are returned in finish order."""
+    budget = TraceMemoryBudget(100)
+    budget.add("automation.sun", "1", 40, frozen=False)
+    budget.add("automation.moon", "2", 40, frozen=True)
+    budget.add("automation.sun", "3", 40, frozen=False)
+    assert budget.exceeded
+    budget.touch("automation.sun", "1")
+
+    assert budget.pop_not_frozen() == ("automation.sun", "1")
+    budget.resize("automation.sun", "1", 10)
+    assert budget.total_bytes == 90
+    assert not budget.exceeded
+    assert budget.evict() == []
+
+    budget.discard("automation.sun", "3")
+    assert budget.pop_not_frozen() is None
+    assert budget.total_bytes == 50
+
+
+def test_budget_evicts_least_recently_used() -> None:
+    """Test the least recently used traces are evicted."""
+    budget = TraceMemoryBudget(100)
+    budget.add("automation.sun", "1", 40, frozen=True)
+    budget.add("automation.moon", "2", 40, frozen=False)
+    budget.add("automation.sun", "3", 40, frozen=True, recent=False)
+    budget.touch("automation.sun", "3")
+    budget.touch("automation.sun", "1")
+
+    assert budget.evict() == [("automation.moon", "2")]
+    assert budget.total_bytes == 80
+    assert budget.pop_not_frozen() is None
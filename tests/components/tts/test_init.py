@@ -1,6 +1,7 @@
 """The tests for the TTS component."""
 
 import asyncio
+from datetime import timedelta
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any
@@ -38,7 +39,7 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import async_fire_time_changed, async_mock_service, mock_restore_cache
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1217,6 +1218,157 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+class MockEntityMessage(MockTTSEntity):
+    """Mock entity which returns the message as audio."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Load TTS dat."""
+        return ("mp3", message.encode())
+
+
+async def _async_speak(hass: HomeAssistant, message: str) -> str:
+    """Speak a message and return the url of the voice."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "speak",
+        {
+            ATTR_ENTITY_ID: "tts.test",
+            tts.ATTR_MEDIA_PLAYER_ENTITY_ID: "media_player.something",
+            tts.ATTR_MESSAGE: message,
+        },
+        blocking=True,
+    )
+    url = await get_media_source_url(hass, calls[-1].data[ATTR_MEDIA_CONTENT_ID])
+    await hass.async_block_till_done()
+    return url
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockEntityMessage(DEFAULT_LANG)])
+async def test_cache_budget(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test least recently used voices are removed from the caches."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    client = await hass_client()
+
+    with (
+        patch("homeassistant.components.tts.CACHE_MAX_BYTES", 10),
+        patch("homeassistant.components.tts.MEMORY_CACHE_MAX_BYTES", 10),
+    ):
+        url_1 = await _async_speak(hass, "Message 1")
+        url_2 = await _async_speak(hass, "Message 2")
+
+    file_1 = mock_tts_cache_dir / url_1.rsplit("/", 1)[1]
+    file_2 = mock_tts_cache_dir / url_2.rsplit("/", 1)[1]
+    assert not await hass.async_add_executor_job(file_1.is_file)
+    assert await hass.async_add_executor_job(file_2.is_file)
+
+    req = await client.get(url_1)
+    assert req.status == HTTPStatus.NOT_FOUND
+    req = await client.get(url_2)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"Message 2"
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[tts.CACHE_INDEX_STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "files": [[url_2.rsplit("/", 1)[1].rsplit(".", 1)[0], file_2.name, 9]],
+    }
+
+
+async def test_load_cache_index(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache index is reconciled with the files in the cache dir."""
+    filename = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test.mp3"
+    missing = "8a7b8b4c8f2f0e7bf5a1d5e0a0e2f4c2d8b4ae3c_en-us_-_tts.test.mp3"
+    not_indexed = "1c2e4b6a8d0f2e4a6c8b0d2f4e6a8c0b2d4f6e8a_en-us_-_tts.test.mp3"
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / filename).write_bytes, b"cached"
+    )
+    await hass.async_add_executor_job(
+        (mock_tts_cache_dir / not_indexed).write_bytes, b"not indexed"
+    )
+    hass_storage[tts.CACHE_INDEX_STORAGE_KEY] = {
+        "version": tts.CACHE_INDEX_STORAGE_VERSION,
+        "key": tts.CACHE_INDEX_STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": [
+                [missing.rsplit(".", 1)[0], missing, 7],
+                # The size is taken from the index
+                [filename.rsplit(".", 1)[0], filename, 6],
+            ],
+        },
+    }
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    freezer.tick(timedelta(seconds=tts.CACHE_INDEX_SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[tts.CACHE_INDEX_STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "files": [
+            [not_indexed.rsplit(".", 1)[0], not_indexed, 11],
+            [filename.rsplit(".", 1)[0], filename, 6],
+        ],
+    }
+
+    client = await hass_client()
+    req = await client.get(f"/api/tts_proxy/{filename}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"cached"
+    req = await client.get(f"/api/tts_proxy/{not_indexed}")
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"not indexed"
+    req = await client.get(f"/api/tts_proxy/{missing}")
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize("mock_tts_entity", [MockEntityMessage(DEFAULT_LANG)])
+async def test_cache_file_removed(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the speech is fetched again when its cache file was removed."""
+    await mock_config_entry_setup(hass, mock_tts_entity)
+    client = await hass_client()
+
+    url = await _async_speak(hass, "Message")
+    cache_file = mock_tts_cache_dir / url.rsplit("/", 1)[1]
+    assert await hass.async_add_executor_job(cache_file.is_file)
+    await hass.async_add_executor_job(cache_file.unlink)
+
+    # Remove the voice from the memory cache
+    freezer.tick(timedelta(seconds=tts.DEFAULT_TIME_MEMORY + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert await _async_speak(hass, "Message") == url
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert await req.read() == b"Message"
+    assert await hass.async_add_executor_job(cache_file.is_file)
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
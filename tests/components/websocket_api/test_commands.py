@@ -1028,6 +1028,48 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_since(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test resubscribing to entities only sends what changed since a version."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.bowl", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "since": 0}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.bowl"}
+    assert msg["event"]["r"] == []
+    assert msg["event"]["full"] is True
+    version = msg["event"]["version"]
+    assert version == hass.states.version
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_remove("light.bowl")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "since": version}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.kitchen": {"s": "on", "a": {}, "c": ANY, "lc": ANY}},
+        "r": ["light.bowl"],
+        "version": hass.states.version,
+        "full": False,
+    }
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
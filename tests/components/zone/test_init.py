@@ -1,5 +1,6 @@
 """Test zone component."""
 
+import random
 from typing import Any
 from unittest.mock import patch
 
@@ -666,3 +667,100 @@ async def test_state(hass: HomeAssistant) -> None:
     assert state
     assert state.state == "0"
     assert state.attributes[ATTR_PERSONS] == []
+
+
+async def test_active_zone_index(hass: HomeAssistant) -> None:
+    """Test the zone index finds the same zone as checking all zones."""
+    rnd = random.Random(42)
+    zones = [
+        {
+            "name": f"Zone {idx}",
+            "latitude": 32.8 + rnd.uniform(-0.3, 0.3),
+            "longitude": -117.2 + rnd.uniform(-0.3, 0.3),
+            "radius": rnd.choice((50, 200, 1000, 5000)),
+        }
+        for idx in range(100)
+    ]
+    # Too big to index, near the antimeridian and near the pole
+    zones.append({"name": "Big", "latitude": 33, "longitude": -117, "radius": 1e5})
+    zones.append({"name": "East", "latitude": 0, "longitude": 179.999, "radius": 500})
+    zones.append({"name": "North", "latitude": 89, "longitude": 0, "radius": 500})
+    assert await setup.async_setup_component(hass, zone.DOMAIN, {"zone": zones})
+    # Zones set by other integrations are indexed as well
+    hass.states.async_set(
+        "zone.other", "0", {"latitude": 32.9, "longitude": -117.1, "radius": 300}
+    )
+
+    def _active_zone_without_index(
+        latitude: float, longitude: float, radius: float
+    ) -> str | None:
+        with patch.object(zone, "_bounding_cells", return_value=None):
+            active = zone.async_active_zone(hass, latitude, longitude, radius)
+        return active.entity_id if active else None
+
+    def _assert_same_active_zones() -> None:
+        locations = [
+            (
+                32.8 + rnd.uniform(-0.4, 0.4),
+                -117.2 + rnd.uniform(-0.4, 0.4),
+                rnd.choice((0, 20, 100)),
+            )
+            for _ in range(500)
+        ]
+        locations += [(0, -179.999, 0), (0, 179.9999, 0), (89, 0.001, 0)]
+        for location in locations:
+            active = zone.async_active_zone(hass, *location)
+            assert (active.entity_id if active else None) == (
+                _active_zone_without_index(*location)
+            )
+
+    _assert_same_active_zones()
+    assert zone.async_active_zone(hass, 0, -179.999).entity_id == "zone.east"
+    assert zone.async_active_zone(hass, 89, 0.001).entity_id == "zone.north"
+    assert zone.async_active_zone(hass, 32.9, -117.1).entity_id == "zone.other"
+
+    # Moved and removed zones are updated in the index
+    hass.states.async_set(
+        "zone.other", "0", {"latitude": 33.1, "longitude": -117.3, "radius": 300}
+    )
+    hass.states.async_remove("zone.zone_1")
+    assert zone.async_active_zone(hass, 33.1, -117.3).entity_id == "zone.other"
+    _assert_same_active_zones()
+
+
+async def test_state_zone_renamed(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, storage_setup
+) -> None:
+    """Test persons in a zone are updated when the zone is renamed."""
+    items = [
+        {
+            "id": "office",
+            "name": "Office",
+            "latitude": 1,
+            "longitude": 2,
+            "radius": 3,
+            "passive": False,
+        }
+    ]
+    assert await storage_setup(items)
+    hass.states.async_set("person.person1", "Office")
+    hass.states.async_set("person.person2", "Work")
+    await hass.async_block_till_done()
+    assert hass.states.get("zone.office").attributes[ATTR_PERSONS] == ["person.person1"]
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 6, "type": f"{DOMAIN}/update", f"{DOMAIN}_id": "office", "name": "Work"}
+    )
+    resp = await client.receive_json()
+    assert resp["success"]
+    assert hass.states.get("zone.office").attributes[ATTR_PERSONS] == ["person.person2"]
+
+    # Only the new name is tracked
+    hass.states.async_set("person.person1", "home")
+    hass.states.async_set("person.person3", "work")
+    await hass.async_block_till_done()
+    assert hass.states.get("zone.office").attributes[ATTR_PERSONS] == [
+        "person.person2",
+        "person.person3",
+    ]
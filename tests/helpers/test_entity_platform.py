@@ -12,6 +12,7 @@ import pytest
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE
 from homeassistant.core import (
     CoreState,
+    EntityServiceResponse,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -1643,6 +1644,132 @@ async def test_register_entity_service_response_data_multiple_matches(
     }
 
 
+async def test_batch_service_handler(hass: HomeAssistant) -> None:
+    """Test a batch handler gets all targeted entities of its platform at once."""
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity1")
+    entity2 = MockEntity(entity_id="mock_integration.entity2")
+    await entity_platform1.async_add_entities([entity1, entity2])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity3 = MockEntity(entity_id="mock_integration.entity3")
+    await entity_platform2.async_add_entities([entity3])
+
+    entities = []
+
+    async def generate_response(
+        target: MockEntity, call: ServiceCall
+    ) -> ServiceResponse:
+        entities.append(target)
+        return {"response-key": f"response-value-{target.entity_id}"}
+
+    batch_calls = []
+
+    async def handle_batch(
+        targets: list[MockEntity], call: ServiceCall
+    ) -> EntityServiceResponse:
+        batch_calls.append(targets)
+        return {
+            target.entity_id: {"response-key": f"batch-value-{target.entity_id}"}
+            for target in targets
+        }
+
+    entity_platform1.async_register_entity_service(
+        "hello",
+        {"some": str},
+        generate_response,
+        supports_response=SupportsResponse.ONLY,
+    )
+    entity_platform1.async_register_batch_service_handler(
+        "mock_platform", "hello", handle_batch
+    )
+    assert (
+        entity_platform1.async_get_batch_service_handler("mock_platform", "hello")
+        is handle_batch
+    )
+    assert (
+        entity_platform2.async_get_batch_service_handler("mock_platform", "hello")
+        is None
+    )
+
+    response_data = await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        service_data={"some": "data"},
+        target={"entity_id": [entity1.entity_id, entity3.entity_id, entity2.entity_id]},
+        blocking=True,
+        return_response=True,
+    )
+    assert len(batch_calls) == 1
+    assert set(batch_calls[0]) == {entity1, entity2}
+    assert entities == [entity3]
+    assert response_data == {
+        "mock_integration.entity1": {
+            "response-key": "batch-value-mock_integration.entity1"
+        },
+        "mock_integration.entity2": {
+            "response-key": "batch-value-mock_integration.entity2"
+        },
+        "mock_integration.entity3": {
+            "response-key": "response-value-mock_integration.entity3"
+        },
+    }
+
+    # A single entity of the platform is not handled as a batch
+    entities.clear()
+    response_data = await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        service_data={"some": "data"},
+        target={"entity_id": [entity1.entity_id, entity3.entity_id]},
+        blocking=True,
+        return_response=True,
+    )
+    assert len(batch_calls) == 1
+    assert entities == [entity3, entity1]
+    assert response_data == {
+        "mock_integration.entity1": {
+            "response-key": "response-value-mock_integration.entity1"
+        },
+        "mock_integration.entity3": {
+            "response-key": "response-value-mock_integration.entity3"
+        },
+    }
+
+
+async def test_batch_service_handler_service_data(hass: HomeAssistant) -> None:
+    """Test a batch handler gets the service data without the target fields."""
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity1")
+    entity2 = MockEntity(entity_id="mock_integration.entity2")
+    await entity_platform.async_add_entities([entity1, entity2])
+
+    batch_data = []
+
+    async def handle_batch(targets: list[MockEntity], data: dict[str, Any]) -> None:
+        batch_data.append(data)
+
+    entity_platform.async_register_entity_service("hello", {"some": str}, "hello")
+    entity_platform.async_register_batch_service_handler(
+        "mock_platform", "hello", handle_batch
+    )
+
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        service_data={"some": "data"},
+        target={"entity_id": [entity1.entity_id, entity2.entity_id]},
+        blocking=True,
+    )
+    assert batch_data == [{"some": "data"}]
+
+
 async def test_register_entity_service_response_data_multiple_matches_raises(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,88 @@
+"""Test the reference index helper."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import reference_index
+from homeassistant.helpers.reference_index import ReferenceIndex, ReferenceType
+
+
+def test_referenced_by() -> None:
+    """Test looking up the entities that reference an item."""
+    index = ReferenceIndex()
+    calls: list[str] = []
+    references = {
+        "automation.one": {
+            ReferenceType.ENTITY: {"light.kitchen", "light.hall"},
+            ReferenceType.AREA: {"kitchen"},
+        },
+        "automation.two": {ReferenceType.ENTITY: ["light.kitchen", "light.kitchen"]},
+    }
+
+    def _getter(entity_id: str):
+        def _get_references():
+            calls.append(entity_id)
+            return references[entity_id]
+
+        return _get_references
+
+    index.async_add("automation.one", _getter("automation.one"))
+    index.async_add("automation.two", _getter("automation.two"))
+    assert calls == []
+
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.kitchen") == [
+        "automation.one",
+        "automation.two",
+    ]
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.hall") == [
+        "automation.one"
+    ]
+    assert index.async_referenced_by(ReferenceType.AREA, "kitchen") == [
+        "automation.one"
+    ]
+    assert index.async_referenced_by(ReferenceType.AREA, "light.hall") == []
+    assert calls == ["automation.one", "automation.two"]
+
+    references["automation.two"] = {ReferenceType.ENTITY: {"light.hall"}}
+    index.async_invalidate("automation.two")
+    index.async_invalidate("automation.unknown")
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.kitchen") == [
+        "automation.one"
+    ]
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.hall") == [
+        "automation.one",
+        "automation.two",
+    ]
+    assert calls == ["automation.one", "automation.two", "automation.two"]
+
+    index.async_remove("automation.one")
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.kitchen") == []
+    assert index.async_referenced_by(ReferenceType.AREA, "kitchen") == []
+    assert index.async_referenced_by(ReferenceType.ENTITY, "light.hall") == [
+        "automation.two"
+    ]
+
+
+def test_remove_callback() -> None:
+    """Test the remove callback does not remove an entity that was added again."""
+    index = ReferenceIndex()
+    remove_old = index.async_add(
+        "script.one", lambda: {ReferenceType.DEVICE: {"device_old"}}
+    )
+    remove_new = index.async_add(
+        "script.one", lambda: {ReferenceType.DEVICE: {"device_new"}}
+    )
+
+    remove_old()
+    assert index.async_referenced_by(ReferenceType.DEVICE, "device_old") == []
+    assert index.async_referenced_by(ReferenceType.DEVICE, "device_new") == [
+        "script.one"
+    ]
+
+    remove_new()
+    assert index.async_referenced_by(ReferenceType.DEVICE, "device_new") == []
+
+
+async def test_async_get(hass: HomeAssistant) -> None:
+    """Test each domain has its own index."""
+    index = reference_index.async_get(hass, "automation")
+    assert reference_index.async_get(hass, "automation") is index
+    assert reference_index.async_get(hass, "script") is not index
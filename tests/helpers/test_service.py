@@ -47,6 +47,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -787,6 +788,62 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_resolution_cache(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test target resolution is cached until a registry is updated."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    area = area_registry.async_create("Kitchen")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_get_or_create(
+        "light", "test", "1", device_id=device.id, suggested_object_id="ceiling"
+    )
+    call = ServiceCall("light", "turn_on", {"area_id": area.id})
+    assert service.async_target_resolution_stats(hass) is None
+    cache = service.async_get_target_resolution_cache(hass)
+
+    assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+    assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+    assert cache.async_stats() == {
+        "size": 1,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+    assert service.async_target_resolution_stats(hass) == cache.async_stats()
+
+    # The caller owns the returned sets
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    selected.indirectly_referenced.add("light.other")
+    assert await service.async_extract_entity_ids(hass, call) == {"light.ceiling"}
+
+    entity_registry.async_get_or_create(
+        "light", "test", "2", device_id=device.id, suggested_object_id="bowl"
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.ceiling",
+        "light.bowl",
+    }
+    assert cache.async_stats()["misses"] == 2
+
+    device_registry.async_update_device(device.id, area_id=None)
+    assert await service.async_extract_entity_ids(hass, call) == set()
+    assert cache.async_stats()["misses"] == 3
+
+    area_registry.async_delete(area.id)
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.missing_areas == {area.id}
+    assert cache.async_stats()["misses"] == 4
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -1271,6 +1328,23 @@ async def test_register_with_mixed_case(hass: HomeAssistant) -> None:
     assert descriptions[DOMAIN_LOGGER]["new_service"]["description"] == "new service"
 
 
+async def test_entity_service_latency(hass: HomeAssistant, mock_entities) -> None:
+    """Test the latency of entity service calls is recorded per service."""
+    assert service.async_entity_service_latency(hass) == {}
+    test_service_mock = AsyncMock(return_value=None)
+    for _ in range(2):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(test_service_mock),
+            ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+        )
+
+    latency = service.async_entity_service_latency(hass)
+    assert latency.keys() == {"test_domain.test_service"}
+    assert sum(latency["test_domain.test_service"]["buckets"].values()) == 2
+
+
 async def test_call_with_required_features(hass: HomeAssistant, mock_entities) -> None:
     """Test service calls invoked only if entity has required features."""
     test_service_mock = AsyncMock(return_value=None)
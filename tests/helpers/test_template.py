@@ -1887,6 +1887,28 @@ def test_render_with_possible_json_value_and_dont_parse_result(
     assert isinstance(result, str)
 
 
+def test_render_with_possible_json_value_already_decoded(
+    hass: HomeAssistant,
+) -> None:
+    """Render with possible JSON value decoded by the caller."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}',
+            variables={"value_json": {"hello": "decoded"}},
+            decode_json=False,
+        )
+        == "decoded"
+    )
+    tpl = template.Template("{{ value_json is defined }}", hass)
+    assert (
+        tpl.async_render_with_possible_json_value(
+            '{"hello": "world"}', decode_json=False
+        )
+        == "False"
+    )
+
+
 def test_if_state_exists(hass: HomeAssistant) -> None:
     """Test if state exists works."""
     hass.states.async_set("test.object", "available")
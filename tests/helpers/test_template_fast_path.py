@@ -0,0 +1,177 @@
+"""Test evaluating simple templates without Jinja."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers import template
+from homeassistant.helpers.template_fast_path import compile_fast_path
+
+TEMPLATES = [
+    "{{ 1 }}",
+    "{{ -2.5 }}",
+    "{{ 1e20 }}",
+    "{{ 1 / 3 }}",
+    "{{ 10 // 3 }}",
+    "{{ 2 ** 10 }}",
+    "{{ 2 ** 12000 }}",
+    "{{ -(2 ** (value_json.nested.list[1] * 8000)) }}",
+    "{{ 7 % 3 }}",
+    "{{ 'abc' }}",
+    "{{ ' padded ' }}",
+    "{{ '1' ~ 2 ~ 'x' }}",
+    "{{ none }}",
+    "{{ true and false }}",
+    "{{ 0 or 'fallback' }}",
+    "{{ not true }}",
+    "{{ 1 < 2 < 3 }}",
+    "{{ 3 > 2 > 2 }}",
+    "{{ 'a' in ['a', 'b'] }}",
+    "{{ 'c' not in ('a', 'b') }}",
+    "{{ [1, 2, 3] }}",
+    "{{ (1, 'two') }}",
+    "{{ 'yes' if 1 == 1 else 'no' }}",
+    "{{ 'yes' if 1 == 2 }}",
+    "{{ states('sensor.temperature') }}",
+    "{{ states('sensor.temperature') | float * 2 }}",
+    "{{ states('sensor.temperature') | float(0) | round(1) }}",
+    "{{ states('sensor.missing') | float(0) + 1 }}",
+    "{{ states.sensor.temperature.state }}",
+    "{{ states.sensor.temperature.attributes.unit_of_measurement }}",
+    "{{ states.sensor.temperature.attributes['friendly_name'] }}",
+    "{{ states.sensor.missing.state }}",
+    "{{ is_state('light.kitchen', 'on') }}",
+    "{{ is_state_attr('light.kitchen', 'brightness', 180) }}",
+    "{{ state_attr('light.kitchen', 'brightness') | int / 255 * 100 }}",
+    "{{ 'light.kitchen' | has_value }}",
+    "{{ has_value('sensor.unavailable') }}",
+    "{{ states('sensor.temperature') | is_number }}",
+    "{{ max(1, 5, 3) }}",
+    "{{ min([4, 2, 8]) }}",
+    "{{ iif(is_state('light.kitchen', 'on'), 'lit', 'dark') }}",
+    "{{ value }}",
+    "{{ value | int + 1 }}",
+    "{{ value_json.temperature }}",
+    "{{ value_json['humidity'] | round(0) }}",
+    "{{ value_json.nested.list[1] }}",
+    "{{ value_json.missing }}",
+    "{{ value_json.missing | default('n/a') }}",
+    "{{ value | upper }}",
+    "{{ value | from_json }}",
+    "{{ value_json | to_json }}",
+    "{{ undefined_variable }}",
+    "{{ states }}",
+    "{{ states('sensor.temperature') | float / 0 }}",
+]
+
+
+@pytest.fixture(name="states")
+def setup_states(hass: HomeAssistant) -> None:
+    """Set up the states the templates refer to."""
+    hass.states.async_set(
+        "sensor.temperature",
+        "21.5",
+        {"unit_of_measurement": "°C", "friendly_name": "Temperature"},
+    )
+    hass.states.async_set("light.kitchen", "on", {"brightness": 180})
+    hass.states.async_set("sensor.unavailable", "unavailable")
+
+
+def _render_info(hass: HomeAssistant, template_str: str, **variables: Any) -> dict:
+    """Return the result and what was tracked rendering a template."""
+    info = template.Template(template_str, hass).async_render_to_info(variables)
+    try:
+        result = info.result()
+    except TemplateError as err:
+        result = repr(err)
+    return {
+        "result": result,
+        "result_type": type(result),
+        "all_states": info.all_states,
+        "all_states_lifecycle": info.all_states_lifecycle,
+        "domains": info.domains,
+        "domains_lifecycle": info.domains_lifecycle,
+        "entities": info.entities,
+        "has_time": info.has_time,
+    }
+
+
+def _render_json(hass: HomeAssistant, template_str: str, value: str) -> Any:
+    """Return the result of rendering a template with a value."""
+    tpl = template.Template(template_str, hass)
+    try:
+        return tpl.async_render_with_possible_json_value(value, "error")
+    except Exception as err:  # noqa: BLE001
+        return repr(err)
+
+
+@pytest.mark.usefixtures("states")
+@pytest.mark.parametrize("template_str", TEMPLATES)
+async def test_fast_path_matches_jinja(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates evaluated without Jinja render and track the same."""
+    variables = {
+        "value": '{"temperature": 20.5}',
+        "value_json": {
+            "temperature": 20.5,
+            "humidity": 40.4,
+            "nested": {"list": [1, 2]},
+        },
+    }
+    fast = _render_info(hass, template_str, **variables)
+    with patch.object(template, "compile_fast_path", return_value=None):
+        jinja = _render_info(hass, template_str, **variables)
+    assert fast == jinja
+
+    fast = _render_json(hass, template_str, variables["value"])
+    with patch.object(template, "compile_fast_path", return_value=None):
+        jinja = _render_json(hass, template_str, variables["value"])
+    assert fast == jinja
+
+
+@pytest.mark.parametrize(
+    ("template_str", "supported"),
+    [
+        ("{{ value_json.temperature }}", True),
+        ("{{ states('sensor.x') | float * 2 }}", True),
+        ("{{ is_state('a', 'on') }}", True),
+        ("{{ now() }}", True),
+        ("value: {{ value }}", False),
+        ("{{ value }}{{ value }}", False),
+        ("{% if value %}on{% endif %}", False),
+        ("{{ value is defined }}", False),
+        ("{{ value[1:] }}", False),
+        ("{{ value | average }}", False),
+        ("{{ expand('group.all') }}", False),
+        ("{{ value.upper() }}", False),
+        ("{{ range(3) }}", False),
+        ("{{ is_state(*args) }}", False),
+        ("{{ value", False),
+    ],
+)
+async def test_compile_fast_path(
+    hass: HomeAssistant, template_str: str, supported: bool
+) -> None:
+    """Test which templates are evaluated without Jinja."""
+    environment = template.TemplateEnvironment(hass)
+    fast_path = compile_fast_path(environment, template_str, environment.hass_functions)
+    assert (fast_path is not None) is supported
+
+
+async def test_fast_path_variable_hides_function(hass: HomeAssistant) -> None:
+    """Test a variable with the name of a function is rendered by Jinja."""
+    tpl = template.Template("{{ is_state('light.kitchen', 'on') }}", hass)
+    assert tpl.async_render() is False
+    with pytest.raises(TemplateError):
+        tpl.async_render({"is_state": "not callable"})
+
+
+async def test_fast_path_limited(hass: HomeAssistant) -> None:
+    """Test functions unsupported by limited templates still raise."""
+    tpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        tpl.async_render(limited=True)
@@ -1,6 +1,9 @@
 """Test check_config script."""
 
 import logging
+import os
+from pathlib import Path
+import time
 from unittest.mock import patch
 
 import pytest
@@ -148,6 +151,31 @@ def test_secrets() -> None:
     ]
 
 
+@pytest.mark.usefixtures("event_loop")
+def test_secrets_checked_twice(tmp_path: Path) -> None:
+    """Test a second check in the same process reports the files and secrets."""
+    (tmp_path / YAML_CONFIG_FILE).write_text(
+        BASE_CONFIG + "http:\n  cors_allowed_origins: !secret http_pw"
+    )
+    (tmp_path / "secrets.yaml").write_text("http_pw: http://google.com")
+    # Old enough for the YAML loader to cache them
+    mtime = time.time() - 60
+    for path in tmp_path.iterdir():
+        os.utime(path, (mtime, mtime))
+
+    for _ in range(2):
+        res = check_config.check(str(tmp_path), True)
+        assert res["except"] == {}
+        assert res["secrets"] == {"http_pw": "http://google.com"}
+        assert res["secret_cache"] == {
+            str(tmp_path / "secrets.yaml"): {"http_pw": "http://google.com"}
+        }
+        assert sorted(res["yaml_files"]) == [
+            str(tmp_path / YAML_CONFIG_FILE),
+            str(tmp_path / "secrets.yaml"),
+        ]
+
+
 @pytest.mark.parametrize(
     "hass_config_yaml", [BASE_CONFIG + '  packages:\n    p1:\n      group: ["a"]']
 )
@@ -64,6 +64,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import InstrumentedThreadPoolExecutor
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1492,6 +1493,33 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_changed_since(hass: HomeAssistant) -> None:
+    """Test getting the entities which changed since a version."""
+    with patch("homeassistant.core.STATE_CHANGE_LOG_SIZE", 3):
+        states = ha.StateMachine(hass.bus, hass.loop)
+
+    version = states.version
+    assert states.async_changed_since(version) == set()
+    assert states.async_changed_since(version - 1) is None
+    assert states.async_changed_since(version + 1) is None
+
+    states.async_set("light.bowl", "on")
+    states.async_set("light.kitchen", "on")
+    states.async_set("light.bowl", "off")
+    assert states.version == version + 3
+    assert states.async_changed_since(version) == {"light.bowl", "light.kitchen"}
+    assert states.async_changed_since(version + 2) == {"light.bowl"}
+
+    # Reporting the same state is not a change
+    states.async_set("light.bowl", "off")
+    assert states.version == version + 3
+
+    states.async_remove("light.kitchen")
+    assert states.async_changed_since(version + 2) == {"light.bowl", "light.kitchen"}
+    # The first change is no longer known
+    assert states.async_changed_since(version) is None
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -3242,6 +3270,82 @@ async def test_async_add_import_executor_job(hass: HomeAssistant) -> None:
     assert hass.import_executor._max_workers == 1
 
 
+async def test_async_add_executor_job_executor_pool(hass: HomeAssistant) -> None:
+    """Test executor jobs are routed to the pool of the running integration."""
+    pool = hass.async_create_executor_pool("slow_integration", 1)
+    assert hass.async_create_executor_pool("slow_integration", 1) is pool
+    assert pool.max_workers == 1
+
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocking_job() -> str:
+        started.set()
+        release.wait()
+        return threading.current_thread().name
+
+    async def _add_slow_jobs() -> list[str]:
+        ha.current_executor_pool.set("slow_integration")
+        return await asyncio.gather(
+            hass.async_add_executor_job(blocking_job),
+            hass.async_add_executor_job(blocking_job),
+        )
+
+    slow_task = hass.async_create_task(_add_slow_jobs(), eager_start=True)
+    await hass.async_add_executor_job(started.wait)
+
+    # The quota of the slow integration is exhausted, other jobs still run
+    assert await hass.async_add_executor_job(lambda: "not blocked") == "not blocked"
+    stats = pool.stats()
+    assert stats["running"] == 1
+    assert stats["pending"] == 1
+    assert stats["saturated"] is True
+
+    release.set()
+    thread_names = await slow_task
+    assert all(name.startswith("SyncWorker_slow_integration") for name in thread_names)
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["running"] == 0
+    assert stats["pending"] == 0
+    assert sum(stats["queue_wait"]["buckets"].values()) == 2
+    assert sum(stats["run_time"]["buckets"].values()) == 2
+
+
+async def test_executor_pool_quota_changed(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a warning is logged when an executor pool is created with a new quota."""
+    pool = hass.async_create_executor_pool("integration", 1)
+    assert hass.async_create_executor_pool("integration", 1) is pool
+    assert "already has" not in caplog.text
+
+    assert hass.async_create_executor_pool("integration", 4) is pool
+    assert pool.max_workers == 1
+    assert (
+        "The executor pool integration already has 1 workers, "
+        "restart Home Assistant to change it to 4"
+    ) in caplog.text
+
+
+async def test_executor_pools_shut_down_on_stop(hass: HomeAssistant) -> None:
+    """Test executor pools are shut down in their own threads on stop."""
+    hass.async_create_executor_pool("first", 1)
+    hass.async_create_executor_pool("second", 1)
+    shutdown_threads: list[str] = []
+
+    def _shutdown(self: InstrumentedThreadPoolExecutor) -> None:
+        shutdown_threads.append(threading.current_thread().name)
+
+    with patch.object(InstrumentedThreadPoolExecutor, "shutdown", _shutdown):
+        await hass.async_stop()
+
+    assert sorted(shutdown_threads) == [
+        "ShutdownExecutorPool_first",
+        "ShutdownExecutorPool_second",
+    ]
+
+
 async def test_async_run_job_deprecated(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
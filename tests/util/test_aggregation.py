@@ -0,0 +1,101 @@
+"""Test running aggregates."""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.util.aggregation import RunningAggregate
+
+
+def _linear_min(values: list[tuple[str, float]]) -> tuple[str, float]:
+    """Return the first key with the smallest value."""
+    best = values[0]
+    for key, value in values:
+        if best[1] > value:
+            best = (key, value)
+    return best
+
+
+def _linear_max(values: list[tuple[str, float]]) -> tuple[str, float]:
+    """Return the first key with the largest value."""
+    best = values[0]
+    for key, value in values:
+        if best[1] < value:
+            best = (key, value)
+    return best
+
+
+def test_running_aggregate_matches_full_computation() -> None:
+    """Test the running aggregate matches computing from all values."""
+    rng = random.Random(1234)
+    keys = [f"sensor.test_{idx}" for idx in range(20)]
+    aggregate = RunningAggregate(keys)
+    current: dict[str, float] = {}
+
+    for _ in range(2000):
+        key = rng.choice(keys)
+        if rng.random() < 0.1:
+            aggregate.discard(key)
+            current.pop(key, None)
+        else:
+            # Few distinct values so ties are common
+            value = rng.choice((rng.randint(-3, 3) * 0.1, rng.uniform(-1e3, 1e3)))
+            aggregate.set(key, value)
+            current[key] = value
+
+        ordered = [(key, current[key]) for key in keys if key in current]
+        values = [value for _, value in ordered]
+        assert len(aggregate) == len(values)
+        assert aggregate.values() == values
+        if not values:
+            continue
+        assert aggregate.min() == _linear_min(ordered)
+        assert aggregate.max() == _linear_max(ordered)
+        assert aggregate.mean() == statistics.mean(values)
+        assert aggregate.median() == statistics.median(values)
+        assert aggregate.range() == max(values) - min(values)
+        assert aggregate.sum() == math.fsum(values)
+        if len(values) > 1:
+            assert aggregate.stdev() == pytest.approx(statistics.stdev(values))
+
+
+def test_running_aggregate_non_finite() -> None:
+    """Test aggregates with non finite values are computed from all values."""
+    aggregate = RunningAggregate(["a", "b", "c"])
+    aggregate.set("a", 1.0)
+    aggregate.set("b", math.inf)
+    aggregate.set("c", 3.0)
+
+    assert aggregate.min() == ("a", 1.0)
+    assert aggregate.max() == ("b", math.inf)
+    assert aggregate.mean() == math.inf
+    assert aggregate.median() == 3.0
+    assert aggregate.sum() == math.inf
+
+    aggregate.set("b", math.nan)
+    assert math.isnan(aggregate.mean())
+
+    aggregate.discard("b")
+    assert aggregate.mean() == 2.0
+    assert aggregate.median() == 2.0
+    assert aggregate.stdev() == pytest.approx(math.sqrt(2))
+
+
+def test_running_aggregate_empty() -> None:
+    """Test aggregates of no values raise."""
+    aggregate = RunningAggregate(["a"])
+    assert not aggregate
+    with pytest.raises(ValueError):
+        aggregate.min()
+    with pytest.raises(ValueError):
+        aggregate.max()
+    with pytest.raises(statistics.StatisticsError):
+        aggregate.mean()
+    with pytest.raises(statistics.StatisticsError):
+        aggregate.median()
+    aggregate.set("a", 1.0)
+    with pytest.raises(statistics.StatisticsError):
+        aggregate.stdev()
+    assert aggregate.sum() == 1.0
@@ -7,7 +7,11 @@ from unittest.mock import patch
 import pytest
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    ExecutorJobHistogram,
+    InstrumentedThreadPoolExecutor,
+    InterruptibleThreadPoolExecutor,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(
@@ -92,3 +96,48 @@ async def test_overall_timeout_reached(caplog: pytest.LogCaptureFixture) -> None
     assert finish - start < 3.0
 
     iexecutor.shutdown()
+
+
+async def test_instrumented_executor_stats() -> None:
+    """Test the instrumented executor records queue-wait and run times."""
+    iexecutor = InstrumentedThreadPoolExecutor(max_workers=2)
+
+    def _job(value: int) -> int:
+        time.sleep(0.02)
+        return value
+
+    futures = [iexecutor.submit(_job, value) for value in range(4)]
+    assert [future.result() for future in futures] == [0, 1, 2, 3]
+
+    stats = iexecutor.stats()
+    assert stats["max_workers"] == 2
+    assert stats["completed"] == 4
+    assert stats["pending"] == 0
+    assert stats["running"] == 0
+    assert stats["saturated"] is False
+    assert sum(stats["run_time"]["buckets"].values()) == 4
+    assert stats["run_time"]["mean"] >= 0.02
+    assert stats["queue_wait"]["max"] >= 0.02
+
+    iexecutor.shutdown()
+
+
+def test_executor_job_histogram() -> None:
+    """Test the executor job histogram buckets."""
+    histogram = ExecutorJobHistogram()
+    for duration in (0.0005, 0.05, 0.05, 5, 100):
+        histogram.record(duration)
+
+    assert histogram.as_dict() == {
+        "buckets": {
+            "le_0.001": 1,
+            "le_0.01": 0,
+            "le_0.1": 2,
+            "le_1.0": 0,
+            "le_10.0": 1,
+            "le_60.0": 0,
+            "inf": 1,
+        },
+        "mean": pytest.approx(21.0201),
+        "max": 100,
+    }
@@ -5,6 +5,7 @@ import importlib
 import io
 import os
 import pathlib
+import time
 from typing import Any
 import unittest
 from unittest.mock import Mock, patch
@@ -726,3 +727,123 @@ def test_load_yaml_dict_fail() -> None:
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def _write_yaml(path: pathlib.Path, content: str, age: int = 60) -> None:
+    """Write a file that was modified long enough ago to be cached."""
+    path.write_text(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_yaml_cache(tmp_path: pathlib.Path) -> None:
+    """Test parsed files are cached until they or their includes change."""
+    _write_yaml(
+        tmp_path / "configuration.yaml",
+        "automation: !include_dir_merge_list automations\nname: !include name.yaml\n",
+    )
+    _write_yaml(tmp_path / "name.yaml", "home\n")
+    (tmp_path / "automations").mkdir()
+    _write_yaml(tmp_path / "automations" / "a.yaml", "- id: a\n")
+    config_file = str(tmp_path / "configuration.yaml")
+
+    with patch.object(
+        yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+    ) as parse_mock:
+        first = yaml_loader.load_yaml(config_file)
+        assert first == {"automation": [{"id": "a"}], "name": "home"}
+        assert parse_mock.call_count == 3
+
+        # Nothing changed, served from the cache as an independent copy
+        first["automation"].append({"id": "mutated"})
+        second = yaml_loader.load_yaml(config_file)
+        assert second == {"automation": [{"id": "a"}], "name": "home"}
+        assert parse_mock.call_count == 3
+        assert second.__config_file__ == config_file
+        assert second.__line__ == 1
+        assert second["automation"].__line__ == 1
+
+        # An included file changed without changing its size, only the
+        # changed files are parsed
+        _write_yaml(tmp_path / "name.yaml", "away\n", age=30)
+        assert yaml_loader.load_yaml(config_file)["name"] == "away"
+        assert parse_mock.call_count == 5
+
+        # A file was added to an included directory
+        _write_yaml(tmp_path / "automations" / "b.yaml", "- id: b\n")
+        assert yaml_loader.load_yaml(config_file)["automation"] == [
+            {"id": "a"},
+            {"id": "b"},
+        ]
+        assert parse_mock.call_count == 7
+
+
+def test_load_yaml_cache_env_var_and_secrets(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test cached files are parsed again when env vars or secrets change."""
+    _write_yaml(
+        tmp_path / "configuration.yaml",
+        "env: !env_var CACHE_TEST_VAR\nsecret: !secret password\n",
+    )
+    _write_yaml(tmp_path / "secrets.yaml", "password: one\n")
+    config_file = str(tmp_path / "configuration.yaml")
+    monkeypatch.setenv("CACHE_TEST_VAR", "first")
+
+    def _load() -> dict:
+        return yaml_loader.load_yaml(config_file, yaml_loader.Secrets(tmp_path))
+
+    assert _load() == {"env": "first", "secret": "one"}
+
+    monkeypatch.setenv("CACHE_TEST_VAR", "second")
+    assert _load() == {"env": "second", "secret": "one"}
+
+    _write_yaml(tmp_path / "secrets.yaml", "password: two\n", age=30)
+    assert _load() == {"env": "second", "secret": "two"}
+
+
+def test_load_yaml_cache_skips_recently_modified_files(
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test files modified within the modification time resolution are not cached."""
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text("name: home\n")
+    config_file = str(config_path)
+    assert yaml_loader.load_yaml(config_file) == {"name": "home"}
+    assert (config_file, None) not in yaml_loader._YAML_CACHE
+
+    # Same size and possibly the same modification time
+    config_path.write_text("name: away\n")
+    assert yaml_loader.load_yaml(config_file) == {"name": "away"}
+
+
+def test_load_yaml_cache_prunes_deleted_files(tmp_path: pathlib.Path) -> None:
+    """Test cached files that were deleted are removed from the cache."""
+    _write_yaml(tmp_path / "configuration.yaml", "name: !include name.yaml\n")
+    _write_yaml(tmp_path / "name.yaml", "home\n")
+    config_file = str(tmp_path / "configuration.yaml")
+    name_key = (str(tmp_path / "name.yaml"), None)
+
+    assert yaml_loader.load_yaml(config_file) == {"name": "home"}
+    assert name_key in yaml_loader._YAML_CACHE
+
+    _write_yaml(tmp_path / "configuration.yaml", "name: home_only\n", age=30)
+    (tmp_path / "name.yaml").unlink()
+    assert yaml_loader.load_yaml(config_file) == {"name": "home_only"}
+    assert name_key not in yaml_loader._YAML_CACHE
+
+
+def test_load_yaml_cache_disabled(tmp_path: pathlib.Path) -> None:
+    """Test files are always parsed when the cache is disabled."""
+    _write_yaml(tmp_path / "configuration.yaml", "name: home\n")
+    config_file = str(tmp_path / "configuration.yaml")
+
+    with (
+        patch.object(yaml_loader, "CACHE_ENABLED", False),
+        patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as parse_mock,
+    ):
+        yaml_loader.load_yaml(config_file)
+        yaml_loader.load_yaml(config_file)
+    assert parse_mock.call_count == 2